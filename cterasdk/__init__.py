@@ -1,23 +1,53 @@
 # pylint: disable=wrong-import-position
+import importlib
+
 import cterasdk.settings  # noqa: E402, F401
 import cterasdk.exceptions  # noqa: E402, F401
 
 from .common import Object, PolicyRule  # noqa: E402, F401
 from .convert import fromjsonstr, tojsonstr, fromxmlstr, toxmlstr  # noqa: E402, F401
-from .core import query  # noqa: E402, F401
-from .edge import types as edge_types  # noqa: E402, F401
-from .edge import enum as edge_enum  # noqa: E402, F401
-from .core import types as core_types  # noqa: E402, F401
-from .core import enum as core_enum  # noqa: E402, F401
-from .common import types as common_types  # noqa: E402, F401
-from .common import enum as common_enum  # noqa: E402, F401
-from .objects import GlobalAdmin, ServicesPortal, Edge, Drive, AsyncGlobalAdmin, AsyncServicesPortal, AsyncEdge  # noqa: E402, F401
-from . import direct as ctera_direct  # noqa: E402, F401
-
-# New enhanced modules
-from . import ratelimit  # noqa: E402, F401
-from . import webhooks  # noqa: E402, F401
-from . import observability  # noqa: E402, F401
-from . import analytics  # noqa: E402, F401
-from . import bulk  # noqa: E402, F401
-from . import config  # noqa: E402, F401
+
+
+# Lazily imported on first attribute access (PEP 562): name -> (module, attribute or None for the module itself)
+_LAZY = {
+    'query': ('cterasdk.core.query', None),
+    'edge_types': ('cterasdk.edge.types', None),
+    'edge_enum': ('cterasdk.edge.enum', None),
+    'core_types': ('cterasdk.core.types', None),
+    'core_enum': ('cterasdk.core.enum', None),
+    'common_types': ('cterasdk.common.types', None),
+    'common_enum': ('cterasdk.common.enum', None),
+    'GlobalAdmin': ('cterasdk.objects', 'GlobalAdmin'),
+    'ServicesPortal': ('cterasdk.objects', 'ServicesPortal'),
+    'Edge': ('cterasdk.objects', 'Edge'),
+    'Drive': ('cterasdk.objects', 'Drive'),
+    'AsyncGlobalAdmin': ('cterasdk.objects', 'AsyncGlobalAdmin'),
+    'AsyncServicesPortal': ('cterasdk.objects', 'AsyncServicesPortal'),
+    'AsyncEdge': ('cterasdk.objects', 'AsyncEdge'),
+    'ctera_direct': ('cterasdk.direct', None),
+    # New enhanced modules
+    'ratelimit': ('cterasdk.ratelimit', None),
+    'webhooks': ('cterasdk.webhooks', None),
+    'observability': ('cterasdk.observability', None),
+    'analytics': ('cterasdk.analytics', None),
+    'bulk': ('cterasdk.bulk', None),
+    'config': ('cterasdk.config', None),
+}
+
+__all__ = ['Object', 'PolicyRule', 'fromjsonstr', 'tojsonstr', 'fromxmlstr', 'toxmlstr', *_LAZY]
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
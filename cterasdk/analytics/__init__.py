@@ -10,6 +10,7 @@ from .storage_trends import StorageTrendsAnalytics
 from .file_operations import FileOperationsAnalytics
 from .security_audit import SecurityAuditAnalytics
 from .report_builder import ReportBuilder, ReportFilter
+from .records import FailedLoginRecord, PermissionChangeRecord, ViolationRecord, AdminActivityRecord, StorageTrendPoint
 
 __all__ = [
     'UserActivityAnalytics',
@@ -18,5 +19,10 @@ __all__ = [
     'SecurityAuditAnalytics',
     'ReportBuilder',
     'ReportFilter',
+    'FailedLoginRecord',
+    'PermissionChangeRecord',
+    'ViolationRecord',
+    'AdminActivityRecord',
+    'StorageTrendPoint',
 ]
 
@@ -0,0 +1,72 @@
+"""
+Numba JIT-compiled aggregation kernels over contiguous float64 arrays.
+
+Importing this module raises ImportError if NumPy or Numba are not installed.
+"""
+
+import sys
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _sequential_sum(a):
+    s = 0.0
+    for i in range(a.shape[0]):
+        s += a[i]
+    return s
+
+
+@njit(cache=True)
+def _compensated_sum(a):
+    # Neumaier's compensated summation, as used by the built-in sum() of floats since Python 3.12
+    s = 0.0
+    c = 0.0
+    for i in range(a.shape[0]):
+        x = a[i]
+        t = s + x
+        if abs(s) >= abs(x):
+            c += (s - t) + x
+        else:
+            c += (x - t) + s
+        s = t
+    if c != 0.0 and np.isfinite(c):
+        s += c
+    return s
+
+
+# Sum in the same order and with the same rounding as the built-in sum(), so that results do not depend on Numba
+agg_sum = _compensated_sum if sys.version_info >= (3, 12) else _sequential_sum
+
+
+@njit(cache=True)
+def agg_mean(a):
+    return agg_sum(a) / a.shape[0]
+
+
+@njit(cache=True)
+def agg_min(a):
+    m = a[0]
+    for i in range(1, a.shape[0]):
+        if a[i] < m:
+            m = a[i]
+    return m
+
+
+@njit(cache=True)
+def agg_max(a):
+    m = a[0]
+    for i in range(1, a.shape[0]):
+        if a[i] > m:
+            m = a[i]
+    return m
+
+
+def as_float_array(values):
+    """Return values as a float64 array, or None if they are not all floating point numbers"""
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None
+    return array if array.ndim == 1 and array.dtype == np.float64 else None
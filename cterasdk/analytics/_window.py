@@ -0,0 +1,50 @@
+"""
+Default reporting windows, window partitioning and timestamp formatting shared by the analytics modules.
+"""
+
+import itertools
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+from datetime import datetime, timedelta
+
+
+_DEFAULT_WINDOW_7D = timedelta(days=7)
+_DEFAULT_WINDOW_30D = timedelta(days=30)
+_DEFAULT_WINDOW_90D = timedelta(days=90)
+_DEFAULT_WINDOW_180D = timedelta(days=180)
+
+_MAX_BUCKET_SPAN = timedelta(days=10)  # Longest sub-window requested from the Portal in a single query
+_RESOLUTION = timedelta(microseconds=1)
+
+
+def _resolve_window(start_date: Optional[datetime], end_date: Optional[datetime], default_window: timedelta) -> Tuple[datetime, datetime]:
+    """Resolve a reporting window, ending now and spanning the default window unless specified"""
+    end_date = end_date or datetime.now()
+    start_date = start_date or (end_date - default_window)
+    return start_date, end_date
+
+
+def _split_window(start_date: datetime, end_date: datetime, max_span: timedelta = _MAX_BUCKET_SPAN) -> Iterator[Tuple[datetime, datetime]]:
+    """Split an inclusive window into consecutive, non-overlapping inclusive sub-windows spanning at most ``max_span``"""
+    while start_date + max_span < end_date:
+        yield start_date, start_date + max_span - _RESOLUTION
+        start_date += max_span
+    yield start_date, end_date
+
+
+def _fetch_partitioned(fetch: Callable[..., Iterable], start_date: datetime, end_date: datetime, *args, **kwargs) -> Iterable:
+    """
+    Fetch a window as consecutive sub-window queries, streaming the records of all sub-windows in window order.
+
+    ``fetch`` is called as ``fetch(start, end, *args, **kwargs)`` for each sub-window, one sub-window at a time,
+    since all queries share the Portal session, which is not thread safe.
+    """
+    return itertools.chain.from_iterable(fetch(start, end, *args, **kwargs) for start, end in _split_window(start_date, end_date))
+
+
+def _unformatted(timestamp: datetime) -> datetime:
+    return timestamp
+
+
+def _timestamp_formatter(serialize_timestamps: bool) -> Callable[[datetime], Any]:
+    """Get a function rendering record timestamps as ISO 8601 strings, or leaving them as datetime objects"""
+    return datetime.isoformat if serialize_timestamps else _unformatted
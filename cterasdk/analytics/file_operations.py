@@ -2,15 +2,89 @@
 File operations analytics for tracking upload/download patterns and file activity.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Callable
+from datetime import datetime, timedelta, tzinfo
 from collections import defaultdict
 
+from ._window import _DEFAULT_WINDOW_7D, _DEFAULT_WINDOW_30D, _resolve_window
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from datasketch import HyperLogLog
+except ImportError:
+    HyperLogLog = None
+
 
 logger = logging.getLogger('cterasdk.analytics')
 
 
+_HLL_PRECISION = 12  # 2 ** 12 HyperLogLog registers per file, for a standard error of about 1.6%
+
+# Truncation of wall-clock timestamps to the start of their calendar interval. Weeks start on Monday
+_BUCKET_START = {
+    'hour': lambda t: t.replace(minute=0, second=0, microsecond=0),
+    'day': lambda t: t.replace(hour=0, minute=0, second=0, microsecond=0),
+    'week': lambda t: (t - timedelta(days=t.weekday())).replace(hour=0, minute=0, second=0, microsecond=0),
+    'month': lambda t: t.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+}
+
+# NumPy datetime units of the calendar intervals, weeks are computed from days
+_BUCKET_UNITS = {
+    'hour': 'h',
+    'day': 'D',
+    'week': 'D',
+    'month': 'M',
+}
+
+
+def _wall_clock(tz: Optional[tzinfo]) -> Callable[[datetime], datetime]:
+    """Get a function converting timestamps to naive wall-clock times in ``tz``, or in local time if ``tz`` is None"""
+    if tz is None:
+        return lambda t: t if t.tzinfo is None else t.astimezone().replace(tzinfo=None)
+    return lambda t: t.astimezone(tz).replace(tzinfo=None)
+
+
+class _ApproximateUsers:
+    """Fixed-size cardinality estimate of usernames, backed by HyperLogLog"""
+
+    __slots__ = ('_hll',)
+
+    def __init__(self, hyperloglog):
+        self._hll = hyperloglog(p=_HLL_PRECISION)
+
+    def add(self, username: str):
+        self._hll.update(username.encode())
+
+    def __len__(self):
+        return int(self._hll.count())
+
+
+def _unique_users_counter(exact: bool) -> Callable:
+    """
+    Return a factory of per-file unique user counters.
+
+    HyperLogLog sketches are used unless exact counts are requested or ``datasketch`` is not installed.
+    """
+    if not exact:
+        if HyperLogLog is not None:
+            return lambda: _ApproximateUsers(HyperLogLog)
+        logger.debug("datasketch not installed, counting unique users exactly")
+    return set
+
+
 class FileOperationsAnalytics:
     """
     Provides analytics for file operations and activity patterns.
@@ -37,11 +111,11 @@ class FileOperationsAnalytics:
         :param datetime end_date: End date
         :param str group_by: Grouping interval (hour, day, week, month)
         :return: Upload/download statistics
+        :raises ValueError: If the grouping interval is not supported
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        if group_by not in _BUCKET_START:
+            raise ValueError(f"Unsupported grouping interval: {group_by}")
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Analyzing upload/download stats from %s to %s", start_date, end_date)
         
@@ -74,7 +148,8 @@ class FileOperationsAnalytics:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         limit: int = 50,
-        operation_type: str = 'all'
+        operation_type: str = 'all',
+        exact_unique_users: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get most accessed files.
@@ -83,12 +158,10 @@ class FileOperationsAnalytics:
         :param datetime end_date: End date
         :param int limit: Number of files to return
         :param str operation_type: Type of operation (all, read, write, delete)
+        :param bool exact_unique_users: Count unique users exactly, or estimate them with HyperLogLog if set to False
         :return: List of most accessed files
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Finding most accessed files (type: %s)", operation_type)
         
@@ -96,41 +169,15 @@ class FileOperationsAnalytics:
         
         try:
             file_access_data = self._fetch_file_access_logs(start_date, end_date, operation_type)
-            
-            # Count access frequency
-            access_counts = defaultdict(lambda: {
-                'path': '',
-                'access_count': 0,
-                'unique_users': set(),
-                'total_bytes_transferred': 0,
-                'last_accessed': None
-            })
-            
-            for access in file_access_data:
-                path = access['file_path']
-                access_counts[path]['path'] = path
-                access_counts[path]['access_count'] += 1
-                access_counts[path]['unique_users'].add(access['username'])
-                access_counts[path]['total_bytes_transferred'] += access.get('bytes', 0)
-                
-                if not access_counts[path]['last_accessed'] or access['timestamp'] > access_counts[path]['last_accessed']:
-                    access_counts[path]['last_accessed'] = access['timestamp']
-            
-            # Sort by access count
-            sorted_files = sorted(
-                access_counts.values(),
-                key=lambda x: x['access_count'],
-                reverse=True
-            )[:limit]
-            
-            for file_data in sorted_files:
-                accessed_files.append({
-                    'path': file_data['path'],
-                    'access_count': file_data['access_count'],
-                    'unique_users': len(file_data['unique_users']),
-                    'total_bytes_transferred_mb': file_data['total_bytes_transferred'] / (1024 ** 2),
-                    'last_accessed': file_data['last_accessed'].isoformat() if file_data['last_accessed'] else None
-                })
+            if not file_access_data:
+                return accessed_files
+
+            users_counter = _unique_users_counter(exact_unique_users)
+            if users_counter is set:  # pandas counts unique users exactly, so it is used only when estimates are not
+                if pd is not None:
+                    return self._most_accessed_vectorized(file_access_data, limit)
+                logger.debug("pandas not installed, aggregating file access records in pure Python")
+            accessed_files = self._most_accessed(file_access_data, limit, users_counter)
         except Exception as e:
             logger.error("Failed to get most accessed files: %s", str(e))
         
@@ -148,10 +195,7 @@ class FileOperationsAnalytics:
         :param datetime end_date: End date
         :return: File sharing statistics
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Analyzing file sharing activity")
         
@@ -185,10 +229,7 @@ class FileOperationsAnalytics:
         :param datetime end_date: End date
         :return: Modification pattern data
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=7)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_7D)
         
         logger.info("Analyzing file modification patterns")
         
@@ -222,10 +263,7 @@ class FileOperationsAnalytics:
         :param str operation_type: Optional operation type filter
         :return: List of failed operations
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=7)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_7D)
         
         logger.info("Fetching failed operations")
         
@@ -234,9 +272,15 @@ class FileOperationsAnalytics:
         try:
             failures = self._fetch_failed_operations(start_date, end_date, operation_type)
             
+            # Failures often share timestamps, format each distinct one once
+            iso_timestamps = {}
             for failure in failures:
+                timestamp = failure['timestamp']
+                iso_timestamp = iso_timestamps.get(timestamp)
+                if iso_timestamp is None:
+                    iso_timestamp = iso_timestamps[timestamp] = timestamp.isoformat()
                 failed_ops.append({
-                    'timestamp': failure['timestamp'].isoformat(),
+                    'timestamp': iso_timestamp,
                     'operation': failure['operation_type'],
                     'file_path': failure['file_path'],
                     'username': failure['username'],
@@ -248,6 +292,64 @@ class FileOperationsAnalytics:
         
         return failed_ops
     
+    @staticmethod
+    def _most_accessed_vectorized(file_access_data: List[Dict], limit: int) -> List[Dict[str, Any]]:
+        """Aggregate file access records using pandas group-by kernels"""
+        df = pd.DataFrame(file_access_data)
+        if 'bytes' not in df:
+            df['bytes'] = 0
+        df['bytes'] = df['bytes'].fillna(0)
+
+        aggregated = df.groupby('file_path', sort=False).agg(
+            access_count=('username', 'size'),
+            unique_users=('username', 'nunique'),
+            total_bytes=('bytes', 'sum'),
+            last_accessed=('timestamp', 'max')
+        )
+        top = aggregated.nlargest(limit, 'access_count').reset_index()
+        top['total_bytes_transferred_mb'] = top['total_bytes'] / (1024 ** 2)
+
+        return [
+            {
+                'path': row.file_path,
+                'access_count': int(row.access_count),
+                'unique_users': int(row.unique_users),
+                'total_bytes_transferred_mb': float(row.total_bytes_transferred_mb),
+                'last_accessed': row.last_accessed.isoformat() if pd.notna(row.last_accessed) else None
+            }
+            for row in top.itertuples(index=False)
+        ]
+
+    @staticmethod
+    def _most_accessed(file_access_data: List[Dict], limit: int, users_counter: Callable) -> List[Dict[str, Any]]:
+        """Aggregate file access records in pure Python, counting the unique users of each file with ``users_counter()``"""
+        counts = defaultdict(int)
+        users = defaultdict(users_counter)
+        bytes_sum = defaultdict(int)
+        last_ts = {}
+
+        for access in file_access_data:
+            # Interned strings share one object per distinct value and hash once
+            path = sys.intern(access['file_path'])
+            counts[path] += 1
+            users[path].add(sys.intern(access['username']))
+            bytes_sum[path] += access.get('bytes', 0)
+            timestamp = access['timestamp']
+            last_accessed = last_ts.get(path)
+            if last_accessed is None or timestamp > last_accessed:
+                last_ts[path] = timestamp
+
+        return [
+            {
+                'path': path,
+                'access_count': access_count,
+                'unique_users': int(len(users[path])),
+                'total_bytes_transferred_mb': bytes_sum[path] / (1024 ** 2),
+                'last_accessed': last_ts[path].isoformat() if last_ts[path] else None
+            }
+            for path, access_count in heapq.nlargest(limit, counts.items(), key=itemgetter(1))
+        ]
+
     def _fetch_file_operations(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """Fetch file operations (placeholder)"""
         return []
@@ -269,8 +371,84 @@ class FileOperationsAnalytics:
         return []
     
     def _aggregate_operations(self, operations: List[Dict], group_by: str, stats: Dict) -> Dict:
-        """Aggregate file operations"""
+        """
+        Aggregate file operations into per-interval upload and download totals.
+
+        Intervals are calendar aligned in the time zone of the first operation, and only intervals with operations are kept.
+        """
+        if not operations:
+            return stats
+
+        tz = operations[0]['timestamp'].tzinfo
+        wall_clock = _wall_clock(tz)
+        bucket_operations = self._bucket_operations_vectorized if np is not None else self._bucket_operations
+        starts, uploads, downloads, upload_bytes, download_bytes = bucket_operations(operations, group_by, wall_clock)
+        starts = [start.replace(tzinfo=tz).isoformat() for start in starts]
+
+        stats['total_uploads'] = int(sum(uploads))
+        stats['total_downloads'] = int(sum(downloads))
+        stats['total_upload_bytes'] = int(sum(upload_bytes))
+        stats['total_download_bytes'] = int(sum(download_bytes))
+        if stats['total_uploads']:
+            stats['avg_upload_size_mb'] = stats['total_upload_bytes'] / stats['total_uploads'] / (1024 ** 2)
+            stats['peak_upload_time'] = starts[max(range(len(uploads)), key=uploads.__getitem__)]
+        if stats['total_downloads']:
+            stats['avg_download_size_mb'] = stats['total_download_bytes'] / stats['total_downloads'] / (1024 ** 2)
+            stats['peak_download_time'] = starts[max(range(len(downloads)), key=downloads.__getitem__)]
+
+        stats['timeline'] = [
+            {
+                'start': start,
+                'uploads': int(uploads[index]),
+                'downloads': int(downloads[index]),
+                'upload_bytes': int(upload_bytes[index]),
+                'download_bytes': int(download_bytes[index])
+            }
+            for index, start in enumerate(starts) if uploads[index] or downloads[index]
+        ]
         return stats
+
+    @staticmethod
+    def _bucket_operations_vectorized(operations: List[Dict], group_by: str, wall_clock: Callable[[datetime], datetime]):
+        """Count operations and bytes per occupied interval with NumPy unique and bincount"""
+        count = len(operations)
+        times = np.fromiter((wall_clock(op['timestamp']) for op in operations), dtype='datetime64[us]', count=count)
+        starts = times.astype(f'datetime64[{_BUCKET_UNITS[group_by]}]')
+        if group_by == 'week':
+            days = starts.astype(np.int64)
+            starts = (days - (days + 3) % 7).astype('datetime64[D]')  # The epoch is a Thursday
+        starts, buckets = np.unique(starts, return_inverse=True)
+        size = len(starts)
+
+        is_upload = np.fromiter((op['type'] == 'upload' for op in operations), dtype=bool, count=count)
+        is_download = np.fromiter((op['type'] == 'download' for op in operations), dtype=bool, count=count)
+        transferred = np.fromiter((op.get('bytes', 0) for op in operations), dtype=np.int64, count=count)
+
+        return (
+            starts.astype('datetime64[us]').tolist(),
+            np.bincount(buckets[is_upload], minlength=size).tolist(),
+            np.bincount(buckets[is_download], minlength=size).tolist(),
+            np.bincount(buckets[is_upload], weights=transferred[is_upload], minlength=size).tolist(),
+            np.bincount(buckets[is_download], weights=transferred[is_download], minlength=size).tolist()
+        )
+
+    @staticmethod
+    def _bucket_operations(operations: List[Dict], group_by: str, wall_clock: Callable[[datetime], datetime]):
+        """Count operations and bytes per occupied interval in pure Python"""
+        bucket_start = _BUCKET_START[group_by]
+        totals = defaultdict(lambda: [0, 0, 0, 0])  # Uploads, downloads, upload bytes and download bytes
+
+        for op in operations:
+            bucket = totals[bucket_start(wall_clock(op['timestamp']))]
+            if op['type'] == 'upload':
+                bucket[0] += 1
+                bucket[2] += op.get('bytes', 0)
+            elif op['type'] == 'download':
+                bucket[1] += 1
+                bucket[3] += op.get('bytes', 0)
+
+        starts = sorted(totals)
+        return (starts, *(list(column) for column in zip(*(totals[start] for start in starts))))
     
     def _analyze_sharing_activity(self, shares_data: List[Dict], stats: Dict) -> Dict:
         """Analyze sharing activity"""
@@ -0,0 +1,77 @@
+"""
+Compact record types returned by the analytics modules.
+"""
+
+from typing import Any, Dict, List
+from dataclasses import dataclass
+
+
+class _Record:
+    """Base class for slotted analytics records"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a dictionary, e.g. for JSON output.
+
+        :return: Record fields keyed by name
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+@dataclass(slots=True, frozen=True)
+class FailedLoginRecord(_Record):
+    """Failed login attempts of a single user"""
+    username: str
+    failed_attempts: int
+    first_attempt: Any
+    last_attempt: Any
+    ip_addresses: List[str]
+    risk_level: str
+
+
+@dataclass(slots=True, frozen=True)
+class PermissionChangeRecord(_Record):
+    """Permission change audit record, action is one of granted, revoked, modified"""
+    timestamp: Any
+    resource_path: str
+    changed_by: str
+    action: str
+    affected_user: str
+    previous_permissions: Any
+    new_permissions: Any
+
+
+@dataclass(slots=True, frozen=True)
+class ViolationRecord(_Record):
+    """Unauthorized or suspicious data access attempt"""
+    timestamp: Any
+    username: str
+    resource_path: str
+    action_attempted: str
+    violation_type: str
+    ip_address: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class AdminActivityRecord(_Record):
+    """Administrative activity audit record"""
+    timestamp: Any
+    admin_username: str
+    action: str
+    resource_type: str
+    resource_id: Any
+    details: Dict[str, Any]
+    success: bool
+
+
+@dataclass(slots=True, frozen=True)
+class StorageTrendPoint(_Record):
+    """Storage utilization at a point in time"""
+    timestamp: Any
+    total_used_gb: float
+    total_capacity_gb: float
+    utilization_percent: float
+    growth_rate_gb_per_day: float
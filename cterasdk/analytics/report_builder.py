@@ -2,15 +2,179 @@
 Custom report builder with filters and aggregations.
 """
 
+import asyncio
+import csv
+import functools
+import heapq
+import html
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator
 from datetime import datetime
+from operator import eq, gt, itemgetter, lt
 from enum import Enum
+from string import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
 
 
 logger = logging.getLogger('cterasdk.analytics')
 
 
+_VECTORIZE_THRESHOLD = 1000  # Minimum number of records for which filtering is delegated to pandas
+
+
+_HTML_HEADER = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>$title</title>
+    <style>
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #4CAF50; color: white; }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+    <p>$description</p>
+    <p>Generated: $generated_at</p>
+    <p>Total Records: $total_records</p>
+""")
+_HTML_FOOTER = """</body>
+</html>
+"""
+
+_JIT_THRESHOLD = 1024  # Minimum number of values for which aggregations are delegated to JIT-compiled kernels
+
+
+@functools.lru_cache(maxsize=1)
+def _jit_kernels():
+    """Import the Numba aggregation kernels, if Numba is installed. Deferred, since importing Numba is slow"""
+    try:
+        from . import _numba_kernels  # pylint: disable=import-outside-toplevel
+        return _numba_kernels
+    except ImportError:
+        logger.debug("numba not installed, aggregating with Python built-ins")
+        return None
+
+
+def _to_arrow(data: List[Dict]):
+    """Convert records to an Arrow table, flattening nested fields into dot notation columns"""
+    fields = dict.fromkeys(key for record in data for key in record)  # Every record, since from_pylist infers from the first
+    table = pa.Table.from_pydict({field: [record.get(field) for record in data] for field in fields})
+    while any(pa.types.is_struct(column.type) for column in table.columns):
+        table = table.flatten()
+    return table
+
+
+_ARROW_CONDITIONS = {
+    '==': lambda column, value: pc.is_null(column) if value is None else pc.equal(column, value),
+    '>': pc.greater,
+    '<': pc.less,
+    'in': lambda column, value: pc.is_in(column, value_set=pa.array(value)),
+    'contains': pc.match_substring,
+} if pc is not None else {}
+
+
+def _arrow_condition(table, filter_def: Dict):
+    """
+    Evaluate a standard filter over an Arrow table as a boolean array.
+
+    :return: Boolean array, or None if the filter does not evaluate over the table as it does row by row
+    """
+    field = filter_def['field']
+    operator = filter_def['operator']
+    if field not in table.column_names or operator not in _ARROW_CONDITIONS:
+        return None
+    column = table[field]
+    if operator in ('>', '<') and column.null_count:
+        return None  # Comparing a missing value row by row raises TypeError, rather than excluding the record
+    return _ARROW_CONDITIONS[operator](column, filter_def['value'])
+
+
+def _sortable(column) -> bool:
+    """
+    Check that sorting an Arrow column orders records as sorting row by row does.
+
+    Rows are sorted by ``value or ''``, so missing and falsy values tie with each other, unlike in Arrow.
+    """
+    if column.null_count:
+        return False
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        falsy = pc.equal(pc.utf8_length(column), 0)
+    elif pa.types.is_boolean(column.type):
+        falsy = pc.invert(column)
+    elif pa.types.is_integer(column.type) or pa.types.is_floating(column.type) or pa.types.is_decimal(column.type):
+        falsy = pc.equal(column, 0)
+    else:
+        return False
+    return not pc.any(falsy).as_py()
+
+
+def _scalar(value: Any) -> Any:
+    """Convert a NumPy scalar to its native Python equivalent"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_field(field: str) -> tuple:
+    """Split a dot notation field into its keys"""
+    return tuple(field.split('.'))
+
+
+def _contains(item_value: Any, value: str) -> bool:
+    return isinstance(item_value, str) and value in item_value
+
+
+_OPERATORS = {
+    '==': eq,
+    '>': gt,
+    '<': lt,
+    'in': lambda item_value, value: item_value in value,
+    'contains': _contains,
+}
+
+
+def _accept(item: Dict) -> bool:  # pylint: disable=unused-argument
+    """Predicate of a filter without conditions"""
+    return True
+
+
+def _conjunction(first: Callable[[Dict], bool], second: Callable[[Dict], bool]) -> Callable[[Dict], bool]:
+    """Fuse two predicates into one"""
+    if first is _accept:
+        return second
+    return lambda item: first(item) and second(item)
+
+
+def _walk(data: Dict, keys: tuple) -> Any:
+    """Get nested field value using pre-split keys"""
+    if len(keys) == 1:
+        return data.get(keys[0]) if isinstance(data, dict) else None
+    value = data
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+        else:
+            return None
+    return value
+
+
 class ReportFormat(str, Enum):
     """Report output formats"""
     JSON = "json"
@@ -28,6 +192,82 @@ class AggregationType(str, Enum):
     COUNT = "count"
 
 
+_PANDAS_AGGREGATIONS = {
+    AggregationType.SUM: 'sum',
+    AggregationType.AVG: 'mean',
+    AggregationType.MIN: 'min',
+    AggregationType.MAX: 'max',
+    AggregationType.COUNT: 'count',
+}
+
+
+_BUILTIN_AGGREGATIONS = {
+    AggregationType.SUM: sum,
+    AggregationType.AVG: lambda values: sum(values) / len(values),
+    AggregationType.MIN: min,
+    AggregationType.MAX: max,
+    AggregationType.COUNT: len,
+}
+
+
+class _OnlineAggregate:
+    """Running state of an aggregation, updated one value at a time"""
+
+    __slots__ = ('count', 'total', 'mean', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+
+    def average(self, value):
+        # Welford's recurrence, numerically stable for long runs of values
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+
+    def track_min(self, value):
+        self.count += 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+
+    def track_max(self, value):
+        self.count += 1
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def tally(self, value):  # pylint: disable=unused-argument
+        self.count += 1
+
+    @classmethod
+    def updater(cls, agg_type: AggregationType) -> Callable:
+        """Return the update function for an aggregation type"""
+        return {
+            AggregationType.SUM: cls.add,
+            AggregationType.AVG: cls.average,
+            AggregationType.MIN: cls.track_min,
+            AggregationType.MAX: cls.track_max,
+            AggregationType.COUNT: cls.tally,
+        }[agg_type]
+
+    def result(self, agg_type: AggregationType) -> Any:
+        """Return the aggregation result, or None if no values were aggregated"""
+        if not self.count:
+            return None
+        return {
+            AggregationType.SUM: self.total,
+            AggregationType.AVG: self.mean,
+            AggregationType.MIN: self.minimum,
+            AggregationType.MAX: self.maximum,
+            AggregationType.COUNT: self.count,
+        }[agg_type]
+
+
 class ReportFilter:
     """
     Filter for report data.
@@ -36,107 +276,131 @@ class ReportFilter:
     def __init__(self):
         """Initialize report filter"""
         self.filters: List[Dict[str, Any]] = []
+        self._compiled: List[Callable[[Dict], bool]] = []
+        self._fused: Optional[Callable[[Dict], bool]] = None
     
-    def add_equals(self, field: str, value: Any) -> 'ReportFilter':
-        """Add equals filter"""
-        self.filters.append({
+    def _add(self, field: str, operator: str, value: Any) -> 'ReportFilter':
+        """Record a filter definition and its compiled predicate"""
+        filter_def = {
             'field': field,
-            'operator': '==',
+            'operator': operator,
             'value': value
-        })
+        }
+        self.filters.append(filter_def)
+        self._compiled.append(self._compile_filter(filter_def))
+        self._fused = None
         return self
     
+    def add_equals(self, field: str, value: Any) -> 'ReportFilter':
+        """Add equals filter"""
+        return self._add(field, '==', value)
+
     def add_greater_than(self, field: str, value: Any) -> 'ReportFilter':
         """Add greater than filter"""
-        self.filters.append({
-            'field': field,
-            'operator': '>',
-            'value': value
-        })
-        return self
+        return self._add(field, '>', value)
     
     def add_less_than(self, field: str, value: Any) -> 'ReportFilter':
         """Add less than filter"""
-        self.filters.append({
-            'field': field,
-            'operator': '<',
-            'value': value
-        })
-        return self
+        return self._add(field, '<', value)
     
     def add_in(self, field: str, values: List[Any]) -> 'ReportFilter':
         """Add in filter"""
-        self.filters.append({
-            'field': field,
-            'operator': 'in',
-            'value': values
-        })
-        return self
+        return self._add(field, 'in', values)
     
     def add_contains(self, field: str, value: str) -> 'ReportFilter':
         """Add contains filter"""
-        self.filters.append({
-            'field': field,
-            'operator': 'contains',
-            'value': value
-        })
-        return self
+        return self._add(field, 'contains', value)
     
     def add_custom(self, filter_func: Callable) -> 'ReportFilter':
         """Add custom filter function"""
-        self.filters.append({
-            'field': '_custom',
-            'operator': 'custom',
-            'value': filter_func
-        })
-        return self
+        return self._add('_custom', 'custom', filter_func)
     
     def apply(self, data: List[Dict]) -> List[Dict]:
         """Apply filters to data"""
-        filtered_data = data
+        if pd is not None and len(data) > _VECTORIZE_THRESHOLD:
+            return self._apply_vectorized(data)
+
+        return list(filter(self.predicate(), data))
+
+    def predicate(self) -> Callable[[Dict], bool]:
+        """Return a single predicate fusing all filters, compiled when the filters were added"""
+        if self._fused is None:
+            self._fused = functools.reduce(_conjunction, self._compiled, _accept)
+        return self._fused
+
+    @staticmethod
+    def _compile_filter(filter_def: Dict) -> Callable[[Dict], bool]:
+        """Compile a filter definition into a record predicate"""
+        operator = filter_def['operator']
+        value = filter_def['value']
+        if operator == 'custom':
+            return value
         
-        for filter_def in self.filters:
+        keys = _split_field(filter_def['field'])
+        compare = _OPERATORS.get(operator)
+        if compare is None:
+            return lambda item: False
+        return lambda item: compare(_walk(item, keys), value)
+
+    def _apply_vectorized(self, data: List[Dict]) -> List[Dict]:
+        """Apply standard filters as a single boolean mask over a pandas DataFrame"""
+        df = pd.json_normalize(data)
+        mask = pd.Series(True, index=df.index)
+        custom_filters = []
+
+        for filter_def, compiled in zip(self.filters, self._compiled):
             if filter_def['operator'] == 'custom':
-                filtered_data = [item for item in filtered_data if filter_def['value'](item)]
+                custom_filters.append(filter_def['value'])
             else:
-                filtered_data = self._apply_standard_filter(filtered_data, filter_def)
-        
+                mask &= self._filter_mask(df, data, filter_def, compiled)
+
+        filtered_data = [item for item, keep in zip(data, mask.tolist()) if keep]
+        for filter_func in custom_filters:
+            filtered_data = [item for item in filtered_data if filter_func(item)]
         return filtered_data
     
-    def _apply_standard_filter(self, data: List[Dict], filter_def: Dict) -> List[Dict]:
-        """Apply standard filter"""
+    @staticmethod
+    def _filter_mask(df, data: List[Dict], filter_def: Dict, compiled: Callable[[Dict], bool]):
+        """Mask of the DataFrame rows matching a standard filter"""
         field = filter_def['field']
         operator = filter_def['operator']
         value = filter_def['value']
-        
-        filtered = []
-        for item in data:
-            item_value = self._get_nested_value(item, field)
-            
-            if operator == '==' and item_value == value:
-                filtered.append(item)
-            elif operator == '>' and item_value > value:
-                filtered.append(item)
-            elif operator == '<' and item_value < value:
-                filtered.append(item)
-            elif operator == 'in' and item_value in value:
-                filtered.append(item)
-            elif operator == 'contains' and isinstance(item_value, str) and value in item_value:
-                filtered.append(item)
-        
-        return filtered
+        column = df[field] if field in df else pd.Series(None, index=df.index, dtype=object)
+
+        if operator == '==':
+            return column.isna() if value is None else column.eq(value)
+        if operator in ('>', '<'):
+            matches = column.gt(value) if operator == '>' else column.lt(value)
+            missing = column.isna()
+            if missing.any():
+                # Compare missing values row by row, raising TypeError for None as filtering row by row does
+                rows = missing.index[missing]
+                matches = matches.astype(bool)
+                matches.loc[rows] = pd.Series([compiled(data[row]) for row in rows], index=rows, dtype=bool)
+            return matches
+        if operator == 'in':
+            matches = column.isin(value)
+            if any(candidate is None for candidate in value):
+                matches |= column.isna()  # Missing fields are None when filtering row by row
+            return matches
+        if operator == 'contains':
+            return ReportFilter._contains_mask(column, value)
+        return pd.Series(False, index=df.index)
+
+    @staticmethod
+    def _contains_mask(column, value: str):
+        """Mask of the string values of a column containing a substring, whether stored as ``object`` or ``str`` dtype"""
+        if not (pd.api.types.is_string_dtype(column.dtype) or pd.api.types.is_object_dtype(column.dtype)):
+            return pd.Series(False, index=column.index)
+        try:
+            return column.str.contains(value, regex=False, na=False).astype(bool)
+        except AttributeError:  # Object column without any string value
+            return pd.Series(False, index=column.index)
     
     @staticmethod
     def _get_nested_value(data: Dict, field: str) -> Any:
         """Get nested field value using dot notation"""
-        keys = field.split('.')
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-        return value
+        return _walk(data, _split_field(field))
 
 
 class ReportBuilder:
@@ -236,47 +500,122 @@ class ReportBuilder:
         """
         logger.info("Building report: %s", self.title)
         
-        report = {
+        report = self._new_report()
+        try:
+            self._complete_report(report, self._fetch_all())
+        except Exception as e:
+            logger.error("Failed to build report: %s", str(e))
+            report['error'] = str(e)
+
+        return report
+
+    async def build_async(self) -> Dict[str, Any]:
+        """
+        Build and execute the report, fetching all data sources concurrently.
+
+        :return: Report data
+        """
+        logger.info("Building report: %s", self.title)
+
+        report = self._new_report()
+        try:
+            results = await asyncio.gather(*(self._fetch_data_source_async(source) for source in self.data_sources))
+            self._complete_report(report, itertools.chain.from_iterable(results))
+        except Exception as e:
+            logger.error("Failed to build report: %s", str(e))
+            report['error'] = str(e)
+
+        return report
+
+    def _new_report(self) -> Dict[str, Any]:
+        return {
             'title': self.title,
             'description': self.description,
             'generated_at': datetime.now().isoformat(),
             'data': [],
             'summary': {}
         }
+
+    def _complete_report(self, report: Dict[str, Any], rows: Iterable[Dict]):
+        report['data'] = self._select(rows)
+        report['summary'] = self._generate_summary(report['data'])
+
+    def _fetch_all(self) -> Iterable[Dict]:
+        """
+        Stream records from all data sources, one source after the other.
         
-        try:
-            # Fetch data from sources
-            all_data = []
-            for source in self.data_sources:
-                data = self._fetch_data_source(source)
-                all_data.extend(data)
-            
-            # Apply filters
-            for filter_obj in self.filters:
-                all_data = filter_obj.apply(all_data)
-            
-            # Apply aggregations
-            if self.aggregations:
-                aggregated_data = self._apply_aggregations(all_data)
-                report['data'] = aggregated_data
-            else:
-                report['data'] = all_data
-            
-            # Sort data
-            if self.sort_by:
-                report['data'] = self._sort_data(report['data'], self.sort_by, self.sort_descending)
-            
-            # Apply limit
-            if self.limit:
-                report['data'] = report['data'][:self.limit]
-            
-            # Generate summary
-            report['summary'] = self._generate_summary(report['data'])
-        except Exception as e:
-            logger.error("Failed to build report: %s", str(e))
-            report['error'] = str(e)
+        Sources are not fetched on threads, since they share the Portal session, which is not thread safe.
+        Use ``build_async`` to fetch them concurrently.
+        """
+        return itertools.chain.from_iterable(self._fetch_data_source(source) for source in self.data_sources)
+
+    def _select(self, rows: Iterable[Dict]) -> List[Dict]:
+        """Filter, aggregate, sort and limit the fetched records"""
+        if self._columnar_eligible():
+            rows = list(rows)
+            selected = self._select_columnar(rows)
+            if selected is not None:
+                return selected
+            logger.debug("Columnar selection not applicable, selecting row by row")
         
-        return report
+        # Stream records through the fused filter predicate
+        if self.filters:
+            rows = filter(self._compile_predicate(self.filters), rows)
+
+        # Apply aggregations
+        data = self._apply_aggregations(rows) if self.aggregations else rows
+
+        # Sort data and apply limit
+        if self.sort_by and self.limit:
+            data = self._topk_data(data, self.sort_by, self.sort_descending, self.limit)
+        elif self.sort_by:
+            data = self._sort_data(data, self.sort_by, self.sort_descending)
+        elif self.limit:
+            data = itertools.islice(data, self.limit)
+        return list(data)
+
+    def _columnar_eligible(self) -> bool:
+        """Check whether the report can be selected with Arrow compute kernels"""
+        return (
+            bool(self.sort_by)
+            and not self.aggregations
+            and all(f['operator'] != 'custom' for report_filter in self.filters for f in report_filter.filters)
+            and pa is not None
+        )
+
+    def _select_columnar(self, records: List[Dict]) -> Optional[List[Dict]]:
+        """
+        Filter, sort and limit records over a columnar Arrow copy of the data.
+
+        Kernels compute the indices of the selected records, so the original records are returned unchanged.
+        Returns None if the records are not selected as they are row by row, e.g. if the sort field has missing values.
+        """
+        try:
+            table = _to_arrow(records)
+            indices = pa.array(range(len(records)), type=pa.int64())
+
+            mask = None
+            for report_filter in self.filters:
+                for filter_def in report_filter.filters:
+                    condition = _arrow_condition(table, filter_def)
+                    if condition is None:
+                        return None
+                    mask = condition if mask is None else pc.and_kleene(mask, condition)
+            if mask is not None:
+                mask = pc.fill_null(mask, False)
+                table = table.filter(mask)
+                indices = pc.filter(indices, mask)
+
+            if self.sort_by not in table.column_names or not _sortable(table[self.sort_by]):
+                return None
+            order = pc.sort_indices(table, sort_keys=[(self.sort_by, 'descending' if self.sort_descending else 'ascending')])
+        except pa.ArrowException as e:  # e.g. values of mixed types, or compared with a value of another type
+            logger.debug("Records cannot be selected with Arrow kernels: %s", e)
+            return None
+        indices = pc.take(indices, order)
+        if self.limit:
+            indices = indices.slice(0, self.limit)
+        return [records[index] for index in indices.to_pylist()]
     
     def export(self, format: ReportFormat, output_path: str) -> bool:
         """
@@ -301,75 +640,164 @@ class ReportBuilder:
             logger.error("Failed to export report: %s", str(e))
             return False
     
-    def _fetch_data_source(self, source: Dict[str, Any]) -> List[Dict]:
+    def _fetch_data_source(self, source: Dict[str, Any]) -> Iterator[Dict]:
         """Fetch data from source (placeholder)"""
         # Would implement actual data fetching from portal API
-        return []
+        yield from ()
+
+    async def _fetch_data_source_async(self, source: Dict[str, Any]) -> List[Dict]:
+        """Fetch data from source asynchronously (placeholder)"""
+        # Would implement actual data fetching from the asynchronous portal API
+        return list(self._fetch_data_source(source))
     
-    def _apply_aggregations(self, data: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _compile_predicate(filters: List[ReportFilter]) -> Callable[[Dict], bool]:
+        """Fuse all report filters into a single record predicate"""
+        return functools.reduce(_conjunction, (report_filter.predicate() for report_filter in filters), _accept)
+
+    def _apply_aggregations(self, data: Iterable[Dict]) -> List[Dict]:
         """Apply aggregations to data"""
         if not self.aggregations:
-            return data
+            return list(data)
         
-        aggregated = []
+        if pd is not None:
+            data = data if isinstance(data, list) else list(data)
+            if len(data) > _VECTORIZE_THRESHOLD:
+                return self._apply_aggregations_vectorized(data) or data
         
+        return self._apply_aggregations_online(data)
+
+    def _apply_aggregations_online(self, data: Iterable[Dict]) -> List[Dict]:
+        """
+        Apply all aggregations in a single pass over the data.
+
+        Grouped aggregations keep constant-size running state per group rather than lists of values.
+        """
+        plans = []
         for agg in self.aggregations:
             if agg['group_by']:
-                # Group by aggregation
-                from collections import defaultdict
-                groups = defaultdict(list)
-                
-                for item in data:
-                    group_key = ReportFilter._get_nested_value(item, agg['group_by'])
-                    groups[group_key].append(item)
-                
-                for group_key, group_items in groups.items():
-                    values = [ReportFilter._get_nested_value(item, agg['field']) for item in group_items]
-                    values = [v for v in values if v is not None]
-                    
-                    aggregated.append({
-                        agg['group_by']: group_key,
-                        f"{agg['type']}_{agg['field']}": self._calculate_aggregation(values, agg['type'])
-                    })
+                plans.append((_split_field(agg['group_by']), _split_field(agg['field']), _OnlineAggregate.updater(agg['type']), {}))
             else:
-                # Simple aggregation
-                values = [ReportFilter._get_nested_value(item, agg['field']) for item in data]
-                values = [v for v in values if v is not None]
-                
+                plans.append((None, _split_field(agg['field']), None, []))
+
+        for item in data:
+            for group_keys, field_keys, update, state in plans:
+                value = _walk(item, field_keys)
+                if group_keys is None:
+                    if value is not None:
+                        state.append(value)
+                    continue
+                group_key = _walk(item, group_keys)
+                aggregate = state.get(group_key)
+                if aggregate is None:
+                    aggregate = state[group_key] = _OnlineAggregate()
+                if value is not None:
+                    update(aggregate, value)
+
+        return self._online_results(plans)
+
+    def _online_results(self, plans: List[tuple]) -> List[Dict]:
+        """Report the state accumulated by a single pass over the data"""
+        aggregated = []
+        for agg, (group_keys, _, _, state) in zip(self.aggregations, plans):
+            if group_keys is None:
                 aggregated.append({
                     'field': agg['field'],
                     'aggregation': agg['type'].value,
-                    'result': self._calculate_aggregation(values, agg['type'])
+                    'result': self._calculate_aggregation(state, agg['type'])
                 })
-        
-        return aggregated if aggregated else data
+            else:
+                name = f"{agg['type']}_{agg['field']}"
+                for group_key, aggregate in state.items():
+                    aggregated.append({
+                        agg['group_by']: group_key,
+                        name: aggregate.result(agg['type'])
+                    })
+        return aggregated
     
+    def _apply_aggregations_vectorized(self, data: List[Dict]) -> List[Dict]:
+        """Apply aggregations with one pandas group-by per distinct group field"""
+        df = pd.json_normalize(data)
+        fields = {agg['field'] for agg in self.aggregations} | {agg['group_by'] for agg in self.aggregations if agg['group_by']}
+        for field in fields:
+            if field not in df:
+                df[field] = None
+
+        by_group = defaultdict(list)
+        for index, agg in enumerate(self.aggregations):
+            by_group[agg['group_by'] or None].append((index, agg))
+
+        results = {}
+        for group_by, aggs in by_group.items():
+            if group_by is None:
+                for index, agg in aggs:
+                    values = df[agg['field']].dropna()
+                    results[index] = [{
+                        'field': agg['field'],
+                        'aggregation': agg['type'].value,
+                        'result': _scalar(values.agg(_PANDAS_AGGREGATIONS[agg['type']])) if not values.empty else None
+                    }]
+            else:
+                results.update(self._group_aggregations_vectorized(df, group_by, aggs))
+
+        return [row for index in sorted(results) for row in results[index]]
+
+    @staticmethod
+    def _group_aggregations_vectorized(df, group_by: str, aggs: List[tuple]) -> Dict[int, List[Dict]]:
+        """Apply all aggregations grouped by the same field with a single pandas group-by"""
+        spec = {}
+        for index, agg in aggs:
+            spec[f'_{index}'] = (agg['field'], _PANDAS_AGGREGATIONS[agg['type']])
+            spec[f'_{index}_count'] = (agg['field'], 'count')
+        table = df.groupby(group_by, sort=False, dropna=False).agg(**spec)
+        group_keys = [None if pd.isna(key) else _scalar(key) for key in table.index]
+        results = {}
+        for index, agg in aggs:
+            name = f"{agg['type']}_{agg['field']}"
+            results[index] = [
+                {group_by: group_key, name: _scalar(value) if count else None}
+                for group_key, value, count in zip(group_keys, table[f'_{index}'], table[f'_{index}_count'])
+            ]
+        return results
+
     @staticmethod
     def _calculate_aggregation(values: List[Any], agg_type: AggregationType) -> Any:
         """Calculate aggregation"""
         if not values:
             return None
         
-        if agg_type == AggregationType.SUM:
-            return sum(values)
-        elif agg_type == AggregationType.AVG:
-            return sum(values) / len(values)
-        elif agg_type == AggregationType.MIN:
-            return min(values)
-        elif agg_type == AggregationType.MAX:
-            return max(values)
-        elif agg_type == AggregationType.COUNT:
-            return len(values)
+        if len(values) >= _JIT_THRESHOLD and agg_type != AggregationType.COUNT:
+            kernels = _jit_kernels()
+            array = kernels.as_float_array(values) if kernels else None
+            if array is not None:
+                kernel = {
+                    AggregationType.SUM: kernels.agg_sum,
+                    AggregationType.AVG: kernels.agg_mean,
+                    AggregationType.MIN: kernels.agg_min,
+                    AggregationType.MAX: kernels.agg_max,
+                }[agg_type]
+                return float(kernel(array))
+
+        aggregate = _BUILTIN_AGGREGATIONS.get(agg_type)
+        return aggregate(values) if aggregate else None
     
     @staticmethod
-    def _sort_data(data: List[Dict], sort_by: str, descending: bool) -> List[Dict]:
+    def _sort_data(data: Iterable[Dict], sort_by: str, descending: bool) -> List[Dict]:
         """Sort data"""
+        keys = _split_field(sort_by)
         return sorted(
             data,
-            key=lambda x: ReportFilter._get_nested_value(x, sort_by) or '',
+            key=lambda x: _walk(x, keys) or '',
             reverse=descending
         )
     
+    @staticmethod
+    def _topk_data(data: Iterable[Dict], sort_by: str, descending: bool, limit: int) -> List[Dict]:
+        """Select the first records in sort order without sorting the entire data set"""
+        keys = _split_field(sort_by)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(limit, data, key=lambda x: _walk(x, keys) or '')
+
     @staticmethod
     def _generate_summary(data: List[Dict]) -> Dict[str, Any]:
         """Generate report summary"""
@@ -381,6 +809,16 @@ class ReportBuilder:
     @staticmethod
     def _export_json(report: Dict, output_path: str) -> bool:
         """Export to JSON"""
+        if orjson is not None:
+            try:
+                content = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                logger.debug("Report is not serializable by orjson, exporting JSON with the json module")
+            else:
+                with open(output_path, 'wb') as f:
+                    f.write(content)
+                return True
+
         import json
         with open(output_path, 'w') as f:
             json.dump(report, f, indent=2)
@@ -389,40 +827,40 @@ class ReportBuilder:
     @staticmethod
     def _export_csv(report: Dict, output_path: str) -> bool:
         """Export to CSV"""
-        import csv
         if not report['data']:
             return False
         
+        columns = report['data'][0].keys()
+        select = itemgetter(*columns)
         with open(output_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=report['data'][0].keys())
+            writer = csv.DictWriter(f, fieldnames=columns)
             writer.writeheader()
-            writer.writerows(report['data'])
+            for record in report['data']:
+                if record.keys() == columns:  # Same fields as the header, picked in C
+                    values = select(record)
+                    writer.writer.writerow(values if len(columns) > 1 else (values,))
+                else:  # Missing fields are left empty, extra fields raise ValueError
+                    writer.writerow(record)
         return True
     
     @staticmethod
     def _export_html(report: Dict, output_path: str) -> bool:
         """Export to HTML"""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report['title']}</title>
-            <style>
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #4CAF50; color: white; }}
-            </style>
-        </head>
-        <body>
-            <h1>{report['title']}</h1>
-            <p>{report['description']}</p>
-            <p>Generated: {report['generated_at']}</p>
-            <p>Total Records: {report['summary']['total_records']}</p>
-        </body>
-        </html>
-        """
+        header = _HTML_HEADER.substitute(
+            title=html.escape(str(report['title'])),
+            description=html.escape(str(report['description'])),
+            generated_at=report['generated_at'],
+            total_records=report['summary']['total_records']
+        )
         with open(output_path, 'w') as f:
-            f.write(html)
+            f.write(header)
+            if report['data']:
+                columns = list(report['data'][0].keys())
+                f.write('<table>\n<tr>' + ''.join(f'<th>{html.escape(str(c))}</th>' for c in columns) + '</tr>\n')
+                for row in report['data']:
+                    f.write('<tr>' + ''.join(f'<td>{html.escape(str(row.get(c, "")))}</td>' for c in columns) + '</tr>\n')
+                f.write('</table>\n')
+            f.write(_HTML_FOOTER)
         return True
     
     @staticmethod
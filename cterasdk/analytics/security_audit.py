@@ -2,15 +2,130 @@
 Security audit analytics for tracking security events and compliance.
 """
 
+import functools
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Any, Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter, itemgetter
+
+from .records import FailedLoginRecord, PermissionChangeRecord, ViolationRecord, AdminActivityRecord
+from ._window import _DEFAULT_WINDOW_7D, _DEFAULT_WINDOW_30D, _DEFAULT_WINDOW_90D, _resolve_window, _timestamp_formatter, _fetch_partitioned
 
 
 logger = logging.getLogger('cterasdk.analytics')
 
 
+_PAGE_SIZE = 1000  # Number of audit records requested per page
+_CURSOR_FIELDS = ('timestamp', 'id')  # Fields of the keyset pagination cursor, which every audit record must include
+
+# Indexed-field equality predicates matching denied or suspicious access attempts, any of which qualifies
+_VIOLATION_FILTERS = {'status': 'denied', 'suspicious': True}
+_DEFAULT_SEVERITY = 'medium'
+
+# Fields projected by the Portal for permission changes, in PermissionChangeRecord order
+_PERMISSION_CHANGE_FIELDS = (
+    'timestamp', 'resource_path', 'changed_by_user', 'action', 'affected_user', 'previous_permissions', 'new_permissions'
+)
+
+# Fields projected by the Portal for admin activities, in AdminActivityRecord order
+_ADMIN_ACTIVITY_FIELDS = ('timestamp', 'admin_username', 'action', 'resource_type', 'resource_id', 'details', 'success')
+
+
+@dataclass(frozen=True)
+class _PageCursor:
+    """
+    Keyset pagination cursor, the ``(timestamp, id)`` of the last record of the previous page.
+
+    Pages are requested with ``timestamp >= start AND (timestamp, id) > (last_ts, last_id) ORDER BY timestamp, id``,
+    which the Portal serves from a composite ``(timestamp, id)`` index rather than by scanning past an offset.
+    """
+    last_ts: datetime
+    last_id: Any
+
+
+def _iter_pages(fetch: Callable, *args, page_size: int = _PAGE_SIZE, fields: Optional[tuple] = None, **kwargs) -> Iterator[Dict]:
+    """
+    Stream audit records page by page using keyset pagination.
+
+    Projected ``fields`` are extended with the cursor fields, so that records sharing a timestamp at a page boundary
+    are neither skipped nor repeated.
+    """
+    if fields is not None:
+        kwargs['fields'] = fields + tuple(field for field in _CURSOR_FIELDS if field not in fields)
+    cursor = None
+    while True:
+        page = fetch(*args, cursor=cursor, page_size=page_size, **kwargs)
+        yield from page
+        if len(page) < page_size:
+            return
+        last = page[-1]
+        cursor = _PageCursor(last['timestamp'], last['id'])
+
+
+def _paginated(fetch: Callable) -> Callable[..., Iterator[Dict]]:
+    """Bind a page fetcher to keyset pagination, e.g. for fetching the sub-windows of a partitioned window"""
+    return functools.partial(_iter_pages, fetch)
+
+
+class _AnomalyDetector(ABC):
+    """Accumulates access logs, in timestamp order, and reports the anomalies found"""
+
+    @abstractmethod
+    def update(self, log: Dict):
+        """Account for the next access log"""
+
+    @abstractmethod
+    def finalize(self) -> List[Dict]:
+        """Anomalies found in the access logs"""
+
+
+class _UnusualAccessTimes(_AnomalyDetector):
+    """Detect access at unusual times"""
+
+    def update(self, log: Dict):
+        pass
+
+    def finalize(self) -> List[Dict]:
+        return []
+
+
+class _MassDownloads(_AnomalyDetector):
+    """Detect mass file downloads"""
+
+    def update(self, log: Dict):
+        pass
+
+    def finalize(self) -> List[Dict]:
+        return []
+
+
+class _UnusualLocations(_AnomalyDetector):
+    """Detect access from unusual locations"""
+
+    def update(self, log: Dict):
+        pass
+
+    def finalize(self) -> List[Dict]:
+        return []
+
+
+class _RapidDeletions(_AnomalyDetector):
+    """Detect rapid file deletions"""
+
+    def update(self, log: Dict):
+        pass
+
+    def finalize(self) -> List[Dict]:
+        return []
+
+
+_DETECTORS = (_UnusualAccessTimes, _MassDownloads, _UnusualLocations, _RapidDeletions)
+
+
 class SecurityAuditAnalytics:
     """
     Provides security audit analytics and compliance reporting.
@@ -28,85 +143,89 @@ class SecurityAuditAnalytics:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        threshold: int = 3
-    ) -> List[Dict[str, Any]]:
+        threshold: int = 3,
+        top_n: Optional[int] = None
+    ) -> List[FailedLoginRecord]:
         """
         Get failed login attempts, highlighting potential security issues.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
         :param int threshold: Number of failed attempts to flag as suspicious
+        :param int top_n: Optional number of users with the most failed attempts to return
         :return: List of failed login records
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=7)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_7D)
         
         logger.info("Analyzing failed login attempts from %s to %s", start_date, end_date)
         
         failed_logins = []
         
         try:
-            login_attempts = self._fetch_login_attempts(start_date, end_date, success=False)
+            login_attempts = _iter_pages(self._fetch_login_attempts, start_date, end_date, success=False, min_count=threshold)
             
-            # Group by username
-            attempts_by_user = defaultdict(list)
+            # Reduce attempts to a per-user accumulator in a single pass, attempts arrive in timestamp order
+            attempts_by_user = {}
             for attempt in login_attempts:
-                attempts_by_user[attempt['username']].append(attempt)
+                username, timestamp, ip_address = attempt['username'], attempt['timestamp'], attempt['ip_address']
+                accumulator = attempts_by_user.get(username)
+                if accumulator is None:
+                    attempts_by_user[username] = {'count': 1, 'first_ts': timestamp, 'last_ts': timestamp, 'ips': {ip_address}}
+                else:
+                    accumulator['count'] += 1
+                    accumulator['last_ts'] = timestamp
+                    accumulator['ips'].add(ip_address)
             
             # Identify suspicious activity
-            for username, attempts in attempts_by_user.items():
-                if len(attempts) >= threshold:
-                    failed_logins.append({
-                        'username': username,
-                        'failed_attempts': len(attempts),
-                        'first_attempt': attempts[0]['timestamp'].isoformat(),
-                        'last_attempt': attempts[-1]['timestamp'].isoformat(),
-                        'ip_addresses': list(set(a['ip_address'] for a in attempts)),
-                        'risk_level': 'high' if len(attempts) >= threshold * 2 else 'medium'
-                    })
+            for username, accumulator in attempts_by_user.items():
+                count = accumulator['count']
+                if count >= threshold:
+                    failed_logins.append(FailedLoginRecord(
+                        username=username,
+                        failed_attempts=count,
+                        first_attempt=accumulator['first_ts'].isoformat(),
+                        last_attempt=accumulator['last_ts'].isoformat(),
+                        ip_addresses=list(accumulator['ips']),
+                        risk_level='high' if count >= threshold * 2 else 'medium'
+                    ))
         except Exception as e:
             logger.error("Failed to get failed login attempts: %s", str(e))
         
-        return sorted(failed_logins, key=lambda x: x['failed_attempts'], reverse=True)
+        if top_n is not None:
+            return heapq.nlargest(top_n, failed_logins, key=attrgetter('failed_attempts'))
+        return sorted(failed_logins, key=attrgetter('failed_attempts'), reverse=True)
     
     def get_permission_changes(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        resource_path: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        resource_path: Optional[str] = None,
+        serialize_timestamps: bool = True
+    ) -> List[PermissionChangeRecord]:
         """
         Get permission change audit trail.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
         :param str resource_path: Optional specific resource path
+        :param bool serialize_timestamps: Return timestamps as ISO 8601 strings, or as datetime objects if ``False``
         :return: List of permission change records
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Fetching permission changes")
         
         permission_changes = []
         
         try:
-            changes = self._fetch_permission_changes(start_date, end_date, resource_path)
+            changes = _fetch_partitioned(
+                _paginated(self._fetch_permission_changes), start_date, end_date, resource_path, fields=_PERMISSION_CHANGE_FIELDS
+            )
+            project = itemgetter(*_PERMISSION_CHANGE_FIELDS[1:])
+            timestamp = _timestamp_formatter(serialize_timestamps)
             
             for change in changes:
-                permission_changes.append({
-                    'timestamp': change['timestamp'].isoformat(),
-                    'resource_path': change['resource_path'],
-                    'changed_by': change['changed_by_user'],
-                    'action': change['action'],  # granted, revoked, modified
-                    'affected_user': change['affected_user'],
-                    'previous_permissions': change['previous_permissions'],
-                    'new_permissions': change['new_permissions'],
-                })
+                permission_changes.append(PermissionChangeRecord(timestamp(change['timestamp']), *project(change)))
         except Exception as e:
             logger.error("Failed to get permission changes: %s", str(e))
         
@@ -115,38 +234,39 @@ class SecurityAuditAnalytics:
     def get_data_access_violations(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+        end_date: Optional[datetime] = None,
+        serialize_timestamps: bool = True
+    ) -> List[ViolationRecord]:
         """
         Get unauthorized or suspicious data access attempts.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
+        :param bool serialize_timestamps: Return timestamps as ISO 8601 strings, or as datetime objects if ``False``
         :return: List of access violation records
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=7)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_7D)
         
         logger.info("Analyzing data access violations")
         
         violations = []
         
         try:
-            access_logs = self._fetch_access_logs(start_date, end_date)
+            access_logs = _fetch_partitioned(
+                _paginated(self._fetch_access_logs), start_date, end_date, filters=_VIOLATION_FILTERS, match_any=True
+            )
             
+            timestamp = _timestamp_formatter(serialize_timestamps)
             for log in access_logs:
-                if self._is_violation(log):
-                    violations.append({
-                        'timestamp': log['timestamp'].isoformat(),
-                        'username': log['username'],
-                        'resource_path': log['resource_path'],
-                        'action_attempted': log['action'],
-                        'violation_type': log['violation_type'],
-                        'ip_address': log['ip_address'],
-                        'severity': log.get('severity', 'medium')
-                    })
+                violations.append(ViolationRecord(
+                    timestamp=timestamp(log['timestamp']),
+                    username=log['username'],
+                    resource_path=log['resource_path'],
+                    action_attempted=log['action'],
+                    violation_type=log['violation_type'],
+                    ip_address=log['ip_address'],
+                    severity=log.get('severity') or _DEFAULT_SEVERITY
+                ))
         except Exception as e:
             logger.error("Failed to get data access violations: %s", str(e))
         
@@ -156,38 +276,50 @@ class SecurityAuditAnalytics:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        admin_username: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        admin_username: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: Optional[int] = None,
+        serialize_timestamps: bool = True
+    ) -> List[AdminActivityRecord]:
         """
         Get administrative activity for audit purposes.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
         :param str admin_username: Optional specific admin user
+        :param str action: Optional specific administrative action
+        :param int limit: Optional maximum number of records to return, stops fetching once reached
+        :param bool serialize_timestamps: Return timestamps as ISO 8601 strings, or as datetime objects if ``False``
         :return: List of admin activity records
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Fetching admin activity")
         
         admin_activities = []
         
         try:
-            activities = self._fetch_admin_activities(start_date, end_date, admin_username)
+            filters = {}
+            if admin_username:
+                filters['admin_username'] = admin_username
+            if action:
+                filters['action'] = action
+            if limit is None:
+                activities = _fetch_partitioned(
+                    _paginated(self._fetch_admin_activities), start_date, end_date, filters=filters, fields=_ADMIN_ACTIVITY_FIELDS
+                )
+            else:
+                # Fetch sequentially, so that fetching stops once the limit is reached
+                activities = itertools.islice(
+                    _iter_pages(self._fetch_admin_activities, start_date, end_date, filters=filters, fields=_ADMIN_ACTIVITY_FIELDS), limit
+                )
+            project = itemgetter('admin_username', 'action', 'resource_type', 'resource_id')
+            timestamp = _timestamp_formatter(serialize_timestamps)
             
             for activity in activities:
-                admin_activities.append({
-                    'timestamp': activity['timestamp'].isoformat(),
-                    'admin_username': activity['admin_username'],
-                    'action': activity['action'],
-                    'resource_type': activity['resource_type'],
-                    'resource_id': activity['resource_id'],
-                    'details': activity.get('details', {}),
-                    'success': activity['success']
-                })
+                admin_activities.append(AdminActivityRecord(
+                    timestamp(activity['timestamp']), *project(activity), activity.get('details', {}), activity['success']
+                ))
         except Exception as e:
             logger.error("Failed to get admin activity: %s", str(e))
         
@@ -207,10 +339,7 @@ class SecurityAuditAnalytics:
         :param datetime end_date: End date
         :return: Compliance report data
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=90)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_90D)
         
         logger.info("Generating %s compliance report", compliance_standard)
         
@@ -242,67 +371,106 @@ class SecurityAuditAnalytics:
     def detect_anomalous_behavior(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Detect anomalous user behavior that may indicate security issues.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
+        :param int limit: Optional number of highest-risk anomalies to return
         :return: List of anomalies detected
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=7)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_7D)
         
         logger.info("Detecting anomalous behavior")
         
         anomalies = []
         
         try:
-            # Check for various anomaly patterns
-            
-            # Unusual access times
-            unusual_times = self._detect_unusual_access_times(start_date, end_date)
-            anomalies.extend(unusual_times)
-            
-            # Mass file downloads
-            mass_downloads = self._detect_mass_downloads(start_date, end_date)
-            anomalies.extend(mass_downloads)
+            # Check for various anomaly patterns in a single pass over the access logs
+            detectors = [detector() for detector in _DETECTORS]
+            for log in _fetch_partitioned(_paginated(self._fetch_access_logs), start_date, end_date):
+                for detector in detectors:
+                    detector.update(log)
             
-            # Access from unusual locations
-            unusual_locations = self._detect_unusual_locations(start_date, end_date)
-            anomalies.extend(unusual_locations)
-            
-            # Rapid file deletions
-            rapid_deletions = self._detect_rapid_deletions(start_date, end_date)
-            anomalies.extend(rapid_deletions)
+            for detector in detectors:
+                anomalies.extend(detector.finalize())
         except Exception as e:
             logger.error("Failed to detect anomalous behavior: %s", str(e))
         
+        if limit is not None:
+            return heapq.nlargest(limit, anomalies, key=lambda x: x.get('risk_score', 0))
         return sorted(anomalies, key=lambda x: x.get('risk_score', 0), reverse=True)
     
-    def _fetch_login_attempts(self, start_date: datetime, end_date: datetime, success: bool) -> List[Dict]:
-        """Fetch login attempts (placeholder)"""
+    def _fetch_login_attempts(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        success: bool,
+        min_count: Optional[int] = None,
+        cursor: Optional[_PageCursor] = None,
+        page_size: int = _PAGE_SIZE
+    ) -> List[Dict]:
+        """
+        Fetch a page of login attempts (placeholder)
+        
+        The time range, outcome and minimum per-user attempt count are query predicates evaluated by the Portal,
+        so only attempts of users reaching ``min_count`` are transferred.
+        """
         return []
     
-    def _fetch_permission_changes(self, start_date: datetime, end_date: datetime, resource_path: Optional[str]) -> List[Dict]:
-        """Fetch permission changes (placeholder)"""
+    def _fetch_permission_changes(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        resource_path: Optional[str],
+        cursor: Optional[_PageCursor] = None,
+        page_size: int = _PAGE_SIZE,
+        fields: Optional[tuple] = None
+    ) -> List[Dict]:
+        """
+        Fetch a page of permission changes (placeholder)
+        
+        When ``fields`` is set, the Portal returns only the projected fields of each record.
+        """
         return []
     
-    def _fetch_access_logs(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Fetch access logs (placeholder)"""
+    def _fetch_access_logs(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        match_any: bool = False,
+        cursor: Optional[_PageCursor] = None,
+        page_size: int = _PAGE_SIZE
+    ) -> List[Dict]:
+        """
+        Fetch a page of access logs (placeholder)
+        
+        ``filters`` are equality predicates on indexed fields, encoded as ``filterIndex`` predicates of the Portal query
+        so that only matching log events are scanned. They are combined with OR when ``match_any`` is set, AND otherwise.
+        """
         return []
     
-    def _fetch_admin_activities(self, start_date: datetime, end_date: datetime, admin_username: Optional[str]) -> List[Dict]:
-        """Fetch admin activities (placeholder)"""
+    def _fetch_admin_activities(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[_PageCursor] = None,
+        page_size: int = _PAGE_SIZE,
+        fields: Optional[tuple] = None
+    ) -> List[Dict]:
+        """
+        Fetch a page of admin activities (placeholder)
+        
+        ``filters`` are equality predicates on indexed fields, such as the administrator or action, evaluated by the Portal.
+        When ``fields`` is set, the Portal returns only the projected fields of each record.
+        """
         return []
     
-    def _is_violation(self, log: Dict) -> bool:
-        """Check if access log represents a violation"""
-        return log.get('status') == 'denied' or log.get('suspicious', False)
-    
     def _generate_gdpr_report(self, start_date: datetime, end_date: datetime, report: Dict) -> Dict:
         """Generate GDPR compliance report"""
         return report
@@ -314,20 +482,3 @@ class SecurityAuditAnalytics:
     def _generate_soc2_report(self, start_date: datetime, end_date: datetime, report: Dict) -> Dict:
         """Generate SOC2 compliance report"""
         return report
-    
-    def _detect_unusual_access_times(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Detect access at unusual times"""
-        return []
-    
-    def _detect_mass_downloads(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Detect mass file downloads"""
-        return []
-    
-    def _detect_unusual_locations(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Detect access from unusual locations"""
-        return []
-    
-    def _detect_rapid_deletions(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Detect rapid file deletions"""
-        return []
-
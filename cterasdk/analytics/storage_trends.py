@@ -2,15 +2,98 @@
 Storage utilization trends and capacity planning analytics.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from statistics import NormalDist
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict
+
+from .records import StorageTrendPoint
+from ._window import _DEFAULT_WINDOW_90D, _DEFAULT_WINDOW_180D, _resolve_window, _timestamp_formatter, _fetch_partitioned
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.stats import t as student_t
+except ImportError:
+    student_t = None
 
 
 logger = logging.getLogger('cterasdk.analytics')
 
 
+_GB = 1 << 30
+
+_SNAPSHOT_CACHE_SIZE = 128
+_SNAPSHOT_CACHE_TTL = 3600  # Seconds
+
+
+def _floor(moment: datetime, granularity: str) -> datetime:
+    """Truncate a datetime to the start of its granularity period"""
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == 'hourly':
+        return moment
+    moment = moment.replace(hour=0)
+    if granularity == 'weekly':
+        return moment - timedelta(days=moment.weekday())
+    if granularity == 'monthly':
+        return moment.replace(day=1)
+    return moment
+
+
+def _ceil(moment: datetime, granularity: str) -> datetime:
+    """Round a datetime up to the start of the next granularity period, unless already on a boundary"""
+    floor = _floor(moment, granularity)
+    if floor == moment:
+        return moment
+    if granularity == 'hourly':
+        return floor + timedelta(hours=1)
+    if granularity == 'weekly':
+        return floor + timedelta(weeks=1)
+    if granularity == 'monthly':
+        return (floor + timedelta(days=32)).replace(day=1)
+    return floor + timedelta(days=1)
+
+
+def _linear_fit_vectorized(x: List[float], y: List[float]) -> Tuple[float, float, float]:
+    """Fit y = slope * x + intercept with NumPy, returning the slope, intercept and residual standard deviation"""
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if len(x) < 2:
+        return 0.0, float(y[0]), 0.0
+    slope, intercept = np.polyfit(x, y, 1)
+    residuals = y - (slope * x + intercept)
+    deviation = float(np.sqrt(residuals @ residuals / (len(x) - 2))) if len(x) > 2 else 0.0
+    return float(slope), float(intercept), deviation
+
+
+def _linear_fit(x: List[float], y: List[float]) -> Tuple[float, float, float]:
+    """Fit y = slope * x + intercept, returning the slope, intercept and residual standard deviation"""
+    count = len(x)
+    mean_x, mean_y = sum(x) / count, sum(y) / count
+    sxx = sum((xi - mean_x) ** 2 for xi in x)
+    if sxx == 0:
+        return 0.0, mean_y, 0.0
+    slope = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / sxx
+    intercept = mean_y - slope * mean_x
+    if count <= 2:
+        return slope, intercept, 0.0
+    sse = sum((yi - (slope * xi + intercept)) ** 2 for xi, yi in zip(x, y))
+    return slope, intercept, (sse / (count - 2)) ** 0.5
+
+
+def _critical_value(confidence: float, degrees_of_freedom: int) -> float:
+    """Two-sided critical value for a prediction band, Student's t when SciPy is available, normal otherwise"""
+    quantile = (1 + confidence) / 2
+    if degrees_of_freedom > 0 and student_t is not None:
+        return float(student_t.ppf(quantile, degrees_of_freedom))
+    return NormalDist().inv_cdf(quantile)
+
+
 class StorageTrendsAnalytics:
     """
     Provides analytics for storage utilization and capacity planning.
@@ -23,25 +106,25 @@ class StorageTrendsAnalytics:
         :param portal: Portal client instance
         """
         self.portal = portal
+        self._snapshot_cache: OrderedDict = OrderedDict()
     
     def get_storage_growth_trend(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        granularity: str = 'daily'
-    ) -> List[Dict[str, Any]]:
+        granularity: str = 'daily',
+        serialize_timestamps: bool = True
+    ) -> List[StorageTrendPoint]:
         """
         Get storage growth trend over time.
         
         :param datetime start_date: Start date
         :param datetime end_date: End date
         :param str granularity: Data granularity (hourly, daily, weekly, monthly)
+        :param bool serialize_timestamps: Return timestamps as ISO 8601 strings, or as datetime objects if ``False``
         :return: List of storage data points over time
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=90)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_90D)
         
         logger.info("Analyzing storage growth from %s to %s", start_date, end_date)
         
@@ -49,21 +132,48 @@ class StorageTrendsAnalytics:
         
         try:
             # Would fetch historical storage data from portal
-            storage_snapshots = self._fetch_storage_snapshots(start_date, end_date, granularity)
-            
-            for snapshot in storage_snapshots:
-                trend_data.append({
-                    'timestamp': snapshot['timestamp'].isoformat(),
-                    'total_used_gb': snapshot['used_bytes'] / (1024 ** 3),
-                    'total_capacity_gb': snapshot['capacity_bytes'] / (1024 ** 3),
-                    'utilization_percent': (snapshot['used_bytes'] / snapshot['capacity_bytes']) * 100,
-                    'growth_rate_gb_per_day': snapshot.get('growth_rate', 0),
-                })
+            storage_snapshots = list(self._storage_snapshots(start_date, end_date, granularity))
+            if storage_snapshots:
+                timestamp = _timestamp_formatter(serialize_timestamps)
+                growth_trend = self._growth_trend_vectorized if np is not None else self._growth_trend
+                trend_data = growth_trend(storage_snapshots, timestamp)
         except Exception as e:
             logger.error("Failed to get storage growth trend: %s", str(e))
         
         return trend_data
     
+    @staticmethod
+    def _growth_trend_vectorized(snapshots: List[Dict], timestamp: Callable[[datetime], Any]) -> List[StorageTrendPoint]:
+        """Convert storage snapshots to trend data points using NumPy array arithmetic"""
+        count = len(snapshots)
+        used = np.fromiter((snapshot['used_bytes'] for snapshot in snapshots), dtype=np.float64, count=count)
+        capacity = np.fromiter((snapshot['capacity_bytes'] for snapshot in snapshots), dtype=np.float64, count=count)
+        used_gb = used * (1.0 / _GB)
+        capacity_gb = capacity * (1.0 / _GB)
+        utilization = np.divide(used * 100, capacity, out=np.zeros(count), where=capacity > 0)
+
+        return [
+            StorageTrendPoint(
+                timestamp(snapshot['timestamp']), used_gb_value, capacity_gb_value, utilization_value, snapshot.get('growth_rate', 0)
+            )
+            for snapshot, used_gb_value, capacity_gb_value, utilization_value
+            in zip(snapshots, used_gb.tolist(), capacity_gb.tolist(), utilization.tolist())
+        ]
+    
+    @staticmethod
+    def _growth_trend(snapshots: List[Dict], timestamp: Callable[[datetime], Any]) -> List[StorageTrendPoint]:
+        """Convert storage snapshots to trend data points"""
+        return [
+            StorageTrendPoint(
+                timestamp=timestamp(snapshot['timestamp']),
+                total_used_gb=snapshot['used_bytes'] / _GB,
+                total_capacity_gb=snapshot['capacity_bytes'] / _GB,
+                utilization_percent=(snapshot['used_bytes'] / snapshot['capacity_bytes']) * 100 if snapshot['capacity_bytes'] > 0 else 0,
+                growth_rate_gb_per_day=snapshot.get('growth_rate', 0),
+            )
+            for snapshot in snapshots
+        ]
+    
     def predict_capacity_needs(
         self,
         forecast_days: int = 90,
@@ -91,10 +201,8 @@ class StorageTrendsAnalytics:
         
         try:
             # Fetch historical data
-            historical_data = self.get_storage_growth_trend(
-                start_date=datetime.now() - timedelta(days=180),
-                end_date=datetime.now()
-            )
+            start_date, end_date = _resolve_window(None, None, _DEFAULT_WINDOW_180D)
+            historical_data = self.get_storage_growth_trend(start_date=start_date, end_date=end_date, serialize_timestamps=False)
             
             if historical_data:
                 # Simple linear regression for prediction
@@ -125,20 +233,14 @@ class StorageTrendsAnalytics:
         user_storage = []
         
         try:
-            # Would query user storage quotas and usage from portal
-            users = self._fetch_user_storage_data()
-            
-            sorted_users = sorted(
-                users,
-                key=lambda x: x.get('used_bytes', 0),
-                reverse=True
-            )[:top_n]
+            # Ranking and limiting are pushed down to the portal, so at most top_n users are transferred
+            users = self._fetch_user_storage_data(top_n=top_n, order_by='used_bytes desc')
             
-            for user in sorted_users:
+            for user in heapq.nlargest(top_n, users, key=lambda x: x.get('used_bytes', 0)):
                 user_data = {
                     'username': user['username'],
-                    'used_gb': user['used_bytes'] / (1024 ** 3),
-                    'quota_gb': user['quota_bytes'] / (1024 ** 3),
+                    'used_gb': user['used_bytes'] / _GB,
+                    'quota_gb': user['quota_bytes'] / _GB,
                     'utilization_percent': (user['used_bytes'] / user['quota_bytes']) * 100 if user['quota_bytes'] > 0 else 0,
                 }
                 
@@ -163,31 +265,59 @@ class StorageTrendsAnalytics:
         
         file_type_data = {
             'total_size_gb': 0,
-            'file_types': defaultdict(lambda: {'size_gb': 0, 'count': 0, 'percentage': 0}),
+            'file_types': {},
         }
         
         try:
-            # Would query file metadata from portal
-            file_stats = self._fetch_file_type_statistics()
-            
-            total_bytes = sum(stat['size_bytes'] for stat in file_stats)
-            file_type_data['total_size_gb'] = total_bytes / (1024 ** 3)
-            
-            for stat in file_stats:
-                file_type = stat['extension'] or 'no_extension'
-                size_gb = stat['size_bytes'] / (1024 ** 3)
-                percentage = (stat['size_bytes'] / total_bytes) * 100 if total_bytes > 0 else 0
+            # Sizes and counts are summed per extension by the portal, so one row per extension is transferred
+            file_stats = self._fetch_file_type_statistics(group_by='extension')
+            if file_stats:
+                file_type_totals = self._file_type_totals_vectorized if np is not None else self._file_type_totals
+                totals = file_type_totals(file_stats)
                 
-                file_type_data['file_types'][file_type] = {
-                    'size_gb': size_gb,
-                    'count': stat['count'],
-                    'percentage': percentage,
+                total_bytes = sum(size for size, _ in totals.values())
+                file_type_data['total_size_gb'] = total_bytes / _GB
+                file_type_data['file_types'] = {
+                    file_type: {
+                        'size_gb': size / _GB,
+                        'count': count,
+                        'percentage': (size / total_bytes) * 100 if total_bytes > 0 else 0,
+                    }
+                    for file_type, (size, count) in totals.items()
                 }
         except Exception as e:
             logger.error("Failed to get storage by file type: %s", str(e))
         
         return file_type_data
     
+    @staticmethod
+    def _file_type_totals_vectorized(file_stats: List[Dict]) -> Dict[str, Tuple[int, int]]:
+        """
+        Group file type statistics by extension with NumPy, returning (size_bytes, count) per extension.
+        
+        Extensions are ordered by their first occurrence, as :meth:`_file_type_totals` orders them.
+        """
+        extensions = np.array([stat['extension'] or 'no_extension' for stat in file_stats])
+        sizes = np.fromiter((stat['size_bytes'] for stat in file_stats), dtype=np.int64, count=len(file_stats))
+        counts = np.fromiter((stat['count'] for stat in file_stats), dtype=np.int64, count=len(file_stats))
+        keys, first, inverse = np.unique(extensions, return_index=True, return_inverse=True)
+        size_by = np.zeros(len(keys), dtype=np.int64)
+        count_by = np.zeros(len(keys), dtype=np.int64)
+        np.add.at(size_by, inverse, sizes)  # Integer sums, exact unlike the floating point weights of np.bincount
+        np.add.at(count_by, inverse, counts)
+        order = np.argsort(first)
+        return {key: (size, count) for key, size, count in zip(keys[order].tolist(), size_by[order].tolist(), count_by[order].tolist())}
+    
+    @staticmethod
+    def _file_type_totals(file_stats: List[Dict]) -> Dict[str, Tuple[int, int]]:
+        """Group file type statistics by extension, returning (size_bytes, count) per extension"""
+        totals = {}
+        for stat in file_stats:
+            file_type = stat['extension'] or 'no_extension'
+            size, count = totals.get(file_type, (0, 0))
+            totals[file_type] = (size + stat['size_bytes'], count + stat['count'])
+        return totals
+    
     def identify_storage_optimization_opportunities(self) -> List[Dict[str, Any]]:
         """
         Identify opportunities for storage optimization.
@@ -238,22 +368,85 @@ class StorageTrendsAnalytics:
         
         return sorted(opportunities, key=lambda x: x['potential_savings_gb'], reverse=True)
     
-    def _fetch_storage_snapshots(self, start_date: datetime, end_date: datetime, granularity: str) -> List[Dict]:
-        """Fetch storage snapshots (placeholder)"""
-        return []
+    def _storage_snapshots(self, start_date: datetime, end_date: datetime, granularity: str) -> Iterator[Dict]:
+        """
+        Get storage snapshots, served from a bounded TTL cache.
+        
+        The window is widened to whole granularity periods before fetching, so near-identical windows share
+        a cache entry, and snapshots are then trimmed back to the requested window. Long windows are fetched
+        as consecutive sub-window queries.
+        """
+        key = (_floor(start_date, granularity), _ceil(end_date, granularity), granularity)
+        now = time.monotonic()
+        entry = self._snapshot_cache.get(key)
+        if entry is None or now - entry[0] > _SNAPSHOT_CACHE_TTL:
+            entry = (now, tuple(_fetch_partitioned(self._fetch_storage_snapshots, *key)))
+            self._snapshot_cache[key] = entry
+            if len(self._snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+                self._snapshot_cache.popitem(last=False)
+        else:
+            self._snapshot_cache.move_to_end(key)
+        return (snapshot for snapshot in entry[1] if start_date <= snapshot['timestamp'] <= end_date)
     
-    def _fetch_user_storage_data(self) -> List[Dict]:
-        """Fetch user storage data (placeholder)"""
+    def _fetch_storage_snapshots(self, start_date: datetime, end_date: datetime, granularity: str) -> Iterator[Dict]:
+        """Stream storage snapshots (placeholder)"""
+        yield from ()
+    
+    def _fetch_user_storage_data(self, top_n: Optional[int] = None, order_by: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch user storage data (placeholder)
+        
+        The ordering and ``top_n`` limit are evaluated by the Portal, so only the requested users are transferred.
+        """
         return []
     
-    def _fetch_file_type_statistics(self) -> List[Dict]:
-        """Fetch file type statistics (placeholder)"""
+    def _fetch_file_type_statistics(self, group_by: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch file type statistics (placeholder)
+        
+        When ``group_by`` is set, the Portal returns one row per group with ``size_bytes`` and ``count`` summed.
+        """
         return []
     
-    def _perform_capacity_forecast(self, historical_data: List[Dict], forecast_days: int, confidence: float) -> Dict:
-        """Perform capacity forecasting using trend analysis"""
-        # Would implement linear regression or more sophisticated forecasting
-        return {}
+    def _perform_capacity_forecast(self, historical_data: List[StorageTrendPoint], forecast_days: int, confidence: float) -> Dict:
+        """
+        Perform capacity forecasting using a least-squares linear fit of usage over time.
+        
+        The predicted capacity need is the upper bound of the prediction band at the requested confidence level.
+        """
+        origin = historical_data[0].timestamp
+        days = [(point.timestamp - origin).total_seconds() / 86400 for point in historical_data]
+        usage = [point.total_used_gb for point in historical_data]
+        linear_fit = _linear_fit_vectorized if np is not None else _linear_fit
+        slope, intercept, deviation = linear_fit(days, usage)
+        
+        current_usage = usage[-1]
+        current_capacity = historical_data[-1].total_capacity_gb
+        horizon = days[-1] + forecast_days
+        predicted_usage = max(slope * horizon + intercept, 0)
+        predicted_needed = predicted_usage + _critical_value(confidence, len(usage) - 2) * deviation
+        
+        days_until_full = None
+        if slope > 0 and current_capacity > current_usage:
+            days_until_full = max(int((current_capacity - intercept) / slope - days[-1]), 0)
+        
+        if predicted_needed >= current_capacity:
+            recommended_action = f'Expand capacity by at least {predicted_needed - current_capacity:.1f} GB'
+        elif days_until_full is not None and days_until_full <= 2 * forecast_days:
+            recommended_action = f'Plan capacity expansion within {days_until_full} days'
+        else:
+            recommended_action = 'No action required'
+        
+        return {
+            'forecast_days': forecast_days,
+            'confidence_level': confidence,
+            'current_usage_gb': current_usage,
+            'current_capacity_gb': current_capacity,
+            'predicted_usage_gb': predicted_usage,
+            'predicted_capacity_needed_gb': predicted_needed,
+            'days_until_full': days_until_full,
+            'recommended_action': recommended_action,
+        }
     
     def _find_duplicate_files(self) -> List[Dict]:
         """Find duplicate files (placeholder)"""
@@ -2,10 +2,13 @@
 User activity analytics for tracking access patterns and user behavior.
 """
 
+import heapq
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+from ._window import _DEFAULT_WINDOW_30D, _resolve_window
 
 
 logger = logging.getLogger('cterasdk.analytics')
@@ -40,10 +43,7 @@ class UserActivityAnalytics:
         :param str metric: Metric to measure activity (logins, uploads, downloads, modifications)
         :return: List of user activity records
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info(
             "Analyzing most active users from %s to %s (metric: %s)",
@@ -58,14 +58,8 @@ class UserActivityAnalytics:
             # Example structure - actual implementation would fetch from portal
             users = self._fetch_user_activity(start_date, end_date, metric)
             
-            # Sort by activity metric
-            sorted_users = sorted(
-                users,
-                key=lambda x: x.get('activity_count', 0),
-                reverse=True
-            )[:limit]
-            
-            activity_data = sorted_users
+            # Select the top users by activity metric
+            activity_data = heapq.nlargest(limit, users, key=lambda x: x.get('activity_count', 0))
         except Exception as e:
             logger.error("Failed to get most active users: %s", str(e))
         
@@ -85,10 +79,7 @@ class UserActivityAnalytics:
         :param datetime end_date: End date for analysis
         :return: User access pattern data
         """
-        if not end_date:
-            end_date = datetime.now()
-        if not start_date:
-            start_date = end_date - timedelta(days=30)
+        start_date, end_date = _resolve_window(start_date, end_date, _DEFAULT_WINDOW_30D)
         
         logger.info("Analyzing access patterns for user: %s", username)
         
@@ -101,7 +92,7 @@ class UserActivityAnalytics:
             'login_times': [],
             'peak_hours': [],
             'most_accessed_files': [],
-            'device_types': defaultdict(int),
+            'device_types': Counter(),
             'total_sessions': 0,
             'avg_session_duration': 0,
         }
@@ -125,7 +116,8 @@ class UserActivityAnalytics:
         :param int days_inactive: Number of days of inactivity threshold
         :return: List of inactive user records
         """
-        cutoff_date = datetime.now() - timedelta(days=days_inactive)
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days_inactive)
         
         logger.info("Finding users inactive since %s", cutoff_date)
         
@@ -135,15 +127,15 @@ class UserActivityAnalytics:
             # Would query user last login times from portal
             users = self._fetch_all_users_with_last_login()
             
-            for user in users:
-                last_login = user.get('last_login')
-                if last_login and last_login < cutoff_date:
-                    inactive_users.append({
-                        'username': user.get('username'),
-                        'email': user.get('email'),
-                        'last_login': last_login.isoformat(),
-                        'days_inactive': (datetime.now() - last_login).days
-                    })
+            inactive_users = [
+                {
+                    'username': user.get('username'),
+                    'email': user.get('email'),
+                    'last_login': last_login.isoformat(),
+                    'days_inactive': (now - last_login).days
+                }
+                for user in users if (last_login := user.get('last_login')) and last_login < cutoff_date
+            ]
         except Exception as e:
             logger.error("Failed to get inactive users: %s", str(e))
         
@@ -200,7 +192,9 @@ class UserActivityAnalytics:
     
     def _analyze_access_patterns(self, logs: List[Dict], patterns: Dict) -> Dict:
         """Analyze access patterns from logs"""
-        # Implementation would parse logs and extract patterns
+        patterns['device_types'] = Counter(log.get('device_type') for log in logs)
+        hour_counts = Counter(timestamp.hour for log in logs if (timestamp := log.get('timestamp')))
+        patterns['peak_hours'] = [hour for hour, _ in hour_counts.most_common(5)]
         return patterns
     
     def _analyze_concurrent_sessions(self, sessions: List[Dict], session_data: Dict) -> Dict:
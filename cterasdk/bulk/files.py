@@ -14,14 +14,10 @@ class BulkFileOperations:
     
     def delete_files(self, file_paths: List[str], max_concurrent: int = 10):
         """Bulk delete files."""
-        self.manager.max_concurrent = max_concurrent
+        manager = self.manager = BulkOperationManager(max_concurrent=max_concurrent)
         
-        for path in file_paths:
-            self.manager.add_operation(
-                f"delete_file_{path}",
-                self.portal.cloudfs.delete,
-                path
-            )
+        delete = self.portal.cloudfs.delete
+        manager.add_operations((f"delete_file_{path}", delete, (path,), {}, None) for path in file_paths)
         
-        return self.manager.execute_async()
+        return manager.execute_async()
 
@@ -3,8 +3,11 @@ Core bulk operations framework.
 """
 
 import asyncio
+import functools
 import logging
-from typing import List, Optional, Callable, Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Callable, Any, Dict, Iterable, Tuple
 from enum import Enum
 from datetime import datetime
 
@@ -12,6 +15,15 @@ from datetime import datetime
 logger = logging.getLogger('cterasdk.bulk')
 
 
+def _uvloop_factory() -> Optional[Callable]:
+    """Get the uvloop event loop factory, if uvloop is installed"""
+    try:
+        import uvloop
+        return uvloop.new_event_loop
+    except ImportError:
+        return None
+
+
 class OperationStatus(str, Enum):
     """Operation status"""
     PENDING = "pending"
@@ -24,17 +36,26 @@ class OperationStatus(str, Enum):
 class OperationResult:
     """Result of a bulk operation"""
     
+    __slots__ = ('operation_id', 'status', 'data', 'error', '_ts')
+    
     def __init__(self, operation_id: str, status: OperationStatus, data: Any = None, error: Optional[str] = None):
         self.operation_id = operation_id
         self.status = status
         self.data = data
         self.error = error
-        self.timestamp = datetime.now()
+        self._ts = time.time()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Time the result was recorded"""
+        return datetime.fromtimestamp(self._ts)
 
 
 class BulkOperation:
     """Represents a single operation in a bulk set"""
     
+    __slots__ = ('operation_id', 'func', 'args', 'kwargs', 'rollback_func', 'result', 'is_coro', 'rollback_is_coro')
+    
     def __init__(self, operation_id: str, func: Callable, args: tuple, kwargs: dict, rollback_func: Optional[Callable] = None):
         self.operation_id = operation_id
         self.func = func
@@ -42,6 +63,8 @@ class BulkOperation:
         self.kwargs = kwargs
         self.rollback_func = rollback_func
         self.result: Optional[OperationResult] = None
+        self.is_coro = asyncio.iscoroutinefunction(func)
+        self.rollback_is_coro = asyncio.iscoroutinefunction(rollback_func) if rollback_func else False
 
 
 class BulkOperationManager:
@@ -49,17 +72,24 @@ class BulkOperationManager:
     Manages bulk operations with parallel execution, progress tracking, and rollback.
     """
     
-    def __init__(self, max_concurrent: int = 10, enable_rollback: bool = True):
+    def __init__(self, max_concurrent: int = 10, enable_rollback: bool = True, progress_batch_size: int = 1):
         """
         Initialize bulk operation manager.
         
         :param int max_concurrent: Maximum concurrent operations
         :param bool enable_rollback: Whether to enable rollback on failure
+        :param int progress_batch_size: Number of completed operations between progress callbacks, defaults to every operation
+        :raises ValueError: If ``max_concurrent`` is less than 1
         """
+        if max_concurrent < 1:
+            raise ValueError(f"Maximum concurrent operations must be at least 1, got {max_concurrent}")
         self.max_concurrent = max_concurrent
         self.enable_rollback = enable_rollback
+        self.progress_batch_size = max(1, progress_batch_size)
         self.operations: List[BulkOperation] = []
         self.completed_operations: List[BulkOperation] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._failed_count = 0
     
     def add_operation(
         self,
@@ -81,34 +111,81 @@ class BulkOperationManager:
         operation = BulkOperation(operation_id, func, args, kwargs, rollback_func)
         self.operations.append(operation)
     
+    def add_operations(self, specs: Iterable[Tuple[str, Callable, tuple, dict, Optional[Callable]]]):
+        """
+        Add operations to the bulk set.
+        
+        :param specs: Iterable of ``(operation_id, func, args, kwargs, rollback_func)`` tuples
+        """
+        self.operations.extend(
+            BulkOperation(operation_id, func, args, kwargs, rollback_func) for operation_id, func, args, kwargs, rollback_func in specs
+        )
+    
     async def execute_async(self, on_progress: Optional[Callable] = None) -> List[OperationResult]:
         """
         Execute all operations asynchronously.
         
+        Up to ``max_concurrent`` coroutine operations run at once. Blocking operations run one at a time on a worker thread,
+        off the event loop.
+        
         :param callable on_progress: Optional progress callback
         :return: List of operation results
         """
         logger.info("Starting bulk execution of %d operations", len(self.operations))
         
-        results = []
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        results = [None] * len(self.operations)
+        self._failed_count = 0
+        pending = iter(enumerate(self.operations))
+        progress_is_coro = asyncio.iscoroutinefunction(on_progress) if on_progress else False
         
-        async def execute_with_semaphore(operation: BulkOperation):
-            async with semaphore:
-                return await self._execute_single(operation, on_progress)
+        async def worker():
+            # Workers share one iterator, so each operation is taken by exactly one worker
+            for index, operation in pending:
+                try:
+                    results[index] = await self._execute_single(operation, on_progress, progress_is_coro)
+                except Exception as e:
+                    results[index] = e
         
-        tasks = [execute_with_semaphore(op) for op in self.operations]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        workers = min(self.max_concurrent, len(self.operations))
+        if any(not operation.is_coro for operation in self.operations):
+            # Blocking callables run on a single thread, so they do not stall the event loop. They run one at a time,
+            # because synchronous Portal sessions are not thread safe
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cterasdk.bulk')
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
         
-        # Check for failures
-        failed_ops = [r for r in results if isinstance(r, OperationResult) and r.status == OperationStatus.FAILED]
+        if on_progress and self._progress_pending():
+            if progress_is_coro:
+                await on_progress(len(self.completed_operations), len(self.operations))
+            else:
+                on_progress(len(self.completed_operations), len(self.operations))
         
-        if failed_ops and self.enable_rollback:
-            logger.warning("%d operations failed, initiating rollback", len(failed_ops))
+        if self._failed_count and self.enable_rollback:
+            logger.warning("%d operations failed, initiating rollback", self._failed_count)
             await self._rollback()
         
         return results
     
+    def run(self, on_progress: Optional[Callable] = None, use_uvloop: bool = True) -> List[OperationResult]:
+        """
+        Execute all operations asynchronously on a new event loop, blocking until they complete.
+        
+        The event loop is backed by uvloop when it is installed, without changing the global event loop policy.
+        
+        :param callable on_progress: Optional progress callback
+        :param bool use_uvloop: Whether to use uvloop when it is installed
+        :return: List of operation results
+        """
+        loop_factory = _uvloop_factory() if use_uvloop else None
+        if loop_factory is not None and hasattr(asyncio, 'Runner'):  # Python 3.11+
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                return runner.run(self.execute_async(on_progress))
+        return asyncio.run(self.execute_async(on_progress))
+    
     def execute_sync(self, on_progress: Optional[Callable] = None) -> List[OperationResult]:
         """
         Execute all operations synchronously.
@@ -126,7 +203,7 @@ class BulkOperationManager:
                 operation.result = OperationResult(operation.operation_id, OperationStatus.SUCCESS, result)
                 self.completed_operations.append(operation)
                 
-                if on_progress:
+                if on_progress and self._progress_due():
                     on_progress(len(self.completed_operations), len(self.operations))
             except Exception as e:
                 logger.error("Operation %s failed: %s", operation.operation_id, str(e))
@@ -138,21 +215,31 @@ class BulkOperationManager:
             
             results.append(operation.result)
         
+        if on_progress and self._progress_pending():
+            on_progress(len(self.completed_operations), len(self.operations))
+        
         return results
     
-    async def _execute_single(self, operation: BulkOperation, on_progress: Optional[Callable]) -> OperationResult:
+    async def _execute_single(
+        self,
+        operation: BulkOperation,
+        on_progress: Optional[Callable],
+        progress_is_coro: bool = False
+    ) -> OperationResult:
         """Execute a single operation"""
         try:
-            if asyncio.iscoroutinefunction(operation.func):
+            if operation.is_coro:
                 result = await operation.func(*operation.args, **operation.kwargs)
             else:
-                result = operation.func(*operation.args, **operation.kwargs)
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(operation.func, *operation.args, **operation.kwargs)
+                )
             
             operation.result = OperationResult(operation.operation_id, OperationStatus.SUCCESS, result)
             self.completed_operations.append(operation)
             
-            if on_progress:
-                if asyncio.iscoroutinefunction(on_progress):
+            if on_progress and self._progress_due():
+                if progress_is_coro:
                     await on_progress(len(self.completed_operations), len(self.operations))
                 else:
                     on_progress(len(self.completed_operations), len(self.operations))
@@ -160,8 +247,19 @@ class BulkOperationManager:
             return operation.result
         except Exception as e:
             logger.error("Operation %s failed: %s", operation.operation_id, str(e))
+            self._failed_count += 1
             return OperationResult(operation.operation_id, OperationStatus.FAILED, error=str(e))
     
+    def _progress_due(self) -> bool:
+        """Check whether progress should be reported, every progress_batch_size completions and on the last one"""
+        completed = len(self.completed_operations)
+        return completed % self.progress_batch_size == 0 or completed == len(self.operations)
+    
+    def _progress_pending(self) -> bool:
+        """Check whether completions since the last progress report were not reported yet"""
+        completed = len(self.completed_operations)
+        return completed % self.progress_batch_size != 0 and completed != len(self.operations)
+    
     async def _rollback(self):
         """Rollback completed operations"""
         logger.info("Rolling back %d operations", len(self.completed_operations))
@@ -169,7 +267,7 @@ class BulkOperationManager:
         for operation in reversed(self.completed_operations):
             if operation.rollback_func:
                 try:
-                    if asyncio.iscoroutinefunction(operation.rollback_func):
+                    if operation.rollback_is_coro:
                         await operation.rollback_func(*operation.args, **operation.kwargs)
                     else:
                         operation.rollback_func(*operation.args, **operation.kwargs)
@@ -199,13 +297,23 @@ class BulkOperationManager:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get execution summary"""
-        results = [op.result for op in self.operations if op.result]
+        success = failed = rolled_back = 0
+        for operation in self.operations:
+            if operation.result is None:
+                continue
+            status = operation.result.status
+            if status is OperationStatus.SUCCESS:
+                success += 1
+            elif status is OperationStatus.FAILED:
+                failed += 1
+            elif status is OperationStatus.ROLLED_BACK:
+                rolled_back += 1
         
         return {
             'total': len(self.operations),
             'completed': len(self.completed_operations),
-            'success': sum(1 for r in results if r.status == OperationStatus.SUCCESS),
-            'failed': sum(1 for r in results if r.status == OperationStatus.FAILED),
-            'rolled_back': sum(1 for r in results if r.status == OperationStatus.ROLLED_BACK),
+            'success': success,
+            'failed': failed,
+            'rolled_back': rolled_back,
         }
 
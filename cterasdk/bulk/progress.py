@@ -1,29 +1,33 @@
 """Progress tracking for bulk operations."""
 import logging
-from datetime import datetime
+import time
 
 logger = logging.getLogger('cterasdk.bulk')
 
 class ProgressTracker:
     """Tracks progress of bulk operations."""
     
-    def __init__(self, total: int):
+    def __init__(self, total: int, log_interval: int = 1):
         self.total = total
         self.completed = 0
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
+        self.log_interval = log_interval
+        self._logged = 0
     
     def update(self, completed: int, total: int):
-        """Update progress."""
+        """Update progress, logging it every ``log_interval`` completions and on completion."""
         self.completed = completed
         self.total = total
-        percentage = (completed / total) * 100 if total > 0 else 0
-        logger.info("Progress: %d/%d (%.1f%%)", completed, total, percentage)
+        if completed - self._logged >= self.log_interval or completed >= total:
+            self._logged = completed
+            percentage = (completed / total) * 100 if total > 0 else 0
+            logger.info("Progress: %d/%d (%.1f%%)", completed, total, percentage)
     
     def get_eta(self) -> float:
         """Get estimated time to completion in seconds."""
         if self.completed == 0:
             return 0
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.start_time
         rate = self.completed / elapsed
         remaining = self.total - self.completed
         return remaining / rate if rate > 0 else 0
@@ -14,27 +14,22 @@ class BulkUserOperations:
     
     def create_users(self, users: List[Dict[str, Any]], max_concurrent: int = 10):
         """Bulk create users."""
-        self.manager.max_concurrent = max_concurrent
+        manager = self.manager = BulkOperationManager(max_concurrent=max_concurrent)
         
-        for user in users:
-            self.manager.add_operation(
-                f"create_user_{user['username']}",
-                self.portal.users.add,
-                user['username'], user['email'], user['first_name'], user['last_name']
-            )
+        add = self.portal.users.add
+        manager.add_operations(
+            (f"create_user_{user['username']}", add, (user['username'], user['email'], user['first_name'], user['last_name']), {}, None)
+            for user in users
+        )
         
-        return self.manager.execute_async()
+        return manager.execute_async()
     
     def delete_users(self, usernames: List[str], max_concurrent: int = 10):
         """Bulk delete users."""
-        self.manager.max_concurrent = max_concurrent
+        manager = self.manager = BulkOperationManager(max_concurrent=max_concurrent)
         
-        for username in usernames:
-            self.manager.add_operation(
-                f"delete_user_{username}",
-                self.portal.users.delete,
-                username
-            )
+        delete = self.portal.users.delete
+        manager.add_operations((f"delete_user_{username}", delete, (username,), {}, None) for username in usernames)
         
-        return self.manager.execute_async()
+        return manager.execute_async()
 
@@ -10,25 +10,51 @@ class CommandRegistry:
     
     def __init__(self):
         self.commands = {}
+        self._dispatch = {
+            'interactive': lambda args: self._interactive_mode(),
+            'users': self._handle_users,
+            'files': self._handle_files,
+            'devices': self._handle_devices,
+            'reports': self._handle_reports
+        }
+        self._users_commands = {
+            'list': lambda args: {'command': 'list_users', 'limit': args.limit},
+            'create': lambda args: {
+                'command': 'create_user',
+                'username': args.username,
+                'email': args.email,
+                'first_name': args.first_name,
+                'last_name': args.last_name
+            },
+            'delete': lambda args: {'command': 'delete_user', 'username': args.username}
+        }
+        self._files_commands = {
+            'list': lambda args: {'command': 'list_files', 'path': args.path},
+            'upload': lambda args: {
+                'command': 'upload_file',
+                'local_path': args.local_path,
+                'remote_path': args.remote_path
+            },
+            'download': lambda args: {
+                'command': 'download_file',
+                'remote_path': args.remote_path,
+                'local_path': args.local_path
+            }
+        }
+        self._devices_commands = {
+            'list': lambda args: {'command': 'list_devices'}
+        }
     
     def register(self, name: str, handler):
         """Register a command handler."""
+        if name in self._dispatch:
+            raise ValueError(f"Cannot override built-in command: {name}")
         self.commands[name] = handler
     
     def execute(self, args) -> Dict[str, Any]:
         """Execute a command based on parsed arguments."""
-        if args.command == 'interactive':
-            return self._interactive_mode()
-        elif args.command == 'users':
-            return self._handle_users(args)
-        elif args.command == 'files':
-            return self._handle_files(args)
-        elif args.command == 'devices':
-            return self._handle_devices(args)
-        elif args.command == 'reports':
-            return self._handle_reports(args)
-        else:
-            return {'error': 'Unknown command'}
+        handler = self._dispatch.get(args.command) or self.commands.get(args.command)
+        return handler(args) if handler else {'error': 'Unknown command'}
     
     def _interactive_mode(self) -> Dict[str, Any]:
         """Start interactive mode."""
@@ -37,43 +63,18 @@ class CommandRegistry:
     
     def _handle_users(self, args) -> Dict[str, Any]:
         """Handle user commands."""
-        if args.users_command == 'list':
-            return {'command': 'list_users', 'limit': args.limit}
-        elif args.users_command == 'create':
-            return {
-                'command': 'create_user',
-                'username': args.username,
-                'email': args.email,
-                'first_name': args.first_name,
-                'last_name': args.last_name
-            }
-        elif args.users_command == 'delete':
-            return {'command': 'delete_user', 'username': args.username}
-        return {'error': 'Unknown users command'}
+        handler = self._users_commands.get(args.users_command)
+        return handler(args) if handler else {'error': 'Unknown users command'}
     
     def _handle_files(self, args) -> Dict[str, Any]:
         """Handle file commands."""
-        if args.files_command == 'list':
-            return {'command': 'list_files', 'path': args.path}
-        elif args.files_command == 'upload':
-            return {
-                'command': 'upload_file',
-                'local_path': args.local_path,
-                'remote_path': args.remote_path
-            }
-        elif args.files_command == 'download':
-            return {
-                'command': 'download_file',
-                'remote_path': args.remote_path,
-                'local_path': args.local_path
-            }
-        return {'error': 'Unknown files command'}
+        handler = self._files_commands.get(args.files_command)
+        return handler(args) if handler else {'error': 'Unknown files command'}
     
     def _handle_devices(self, args) -> Dict[str, Any]:
         """Handle device commands."""
-        if args.devices_command == 'list':
-            return {'command': 'list_devices'}
-        return {'error': 'Unknown devices command'}
+        handler = self._devices_commands.get(args.devices_command)
+        return handler(args) if handler else {'error': 'Unknown devices command'}
     
     def _handle_reports(self, args) -> Dict[str, Any]:
         """Handle report commands."""
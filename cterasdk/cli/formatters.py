@@ -1,8 +1,15 @@
 """Output formatters for CLI."""
+import csv
+import io
 import json
 from enum import Enum
 from typing import Any, Dict
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 
 class OutputFormat(str, Enum):
     """Output format types."""
@@ -16,19 +23,17 @@ class OutputFormatter:
     """Format CLI output in various formats."""
     
     def __init__(self, format: OutputFormat):
-        self.format = format
+        self._format = format
+        self._dispatch = {
+            OutputFormat.JSON: self._format_json,
+            OutputFormat.YAML: self._format_yaml,
+            OutputFormat.TABLE: self._format_table,
+            OutputFormat.CSV: self._format_csv
+        }
     
     def format(self, data: Any) -> str:
         """Format data according to specified format."""
-        if self.format == OutputFormat.JSON:
-            return self._format_json(data)
-        elif self.format == OutputFormat.YAML:
-            return self._format_yaml(data)
-        elif self.format == OutputFormat.TABLE:
-            return self._format_table(data)
-        elif self.format == OutputFormat.CSV:
-            return self._format_csv(data)
-        return str(data)
+        return self._dispatch.get(self._format, str)(data)
     
     def _format_json(self, data: Any) -> str:
         """Format as JSON."""
@@ -36,11 +41,9 @@ class OutputFormatter:
     
     def _format_yaml(self, data: Any) -> str:
         """Format as YAML."""
-        try:
-            import yaml
-            return yaml.dump(data, default_flow_style=False)
-        except ImportError:
+        if yaml is None:
             return self._format_json(data)
+        return yaml.dump(data, default_flow_style=False)
     
     def _format_table(self, data: Any) -> str:
         """Format as table."""
@@ -51,23 +54,21 @@ class OutputFormatter:
             return "\n".join(lines)
         elif isinstance(data, list) and data and isinstance(data[0], dict):
             # Tabular data
-            keys = data[0].keys()
-            lines = [" | ".join(keys)]
-            lines.append("-" * len(lines[0]))
-            for item in data:
-                lines.append(" | ".join(str(item.get(k, '')) for k in keys))
+            keys = list(data[0].keys())
+            header = " | ".join(keys)
+            lines = [header, "-" * len(header)]
+            lines.extend(" | ".join([str(item.get(k, '')) for k in keys]) for item in data)
             return "\n".join(lines)
         return str(data)
     
     def _format_csv(self, data: Any) -> str:
         """Format as CSV."""
         if isinstance(data, list) and data and isinstance(data[0], dict):
-            import csv
-            import io
             output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+            keys = list(data[0].keys())
+            writer = csv.writer(output)
+            writer.writerow(keys)
+            writer.writerows([item.get(k, '') for k in keys] for item in data)
             return output.getvalue()
         return self._format_json(data)
 
@@ -1,6 +1,7 @@
 """Main CLI entry point."""
 import sys
 import argparse
+import functools
 import logging
 from typing import Optional
 from .commands import CommandRegistry
@@ -9,8 +10,9 @@ from .formatters import OutputFormatter, OutputFormat
 logger = logging.getLogger('cterasdk.cli')
 
 
-def main(args: Optional[list] = None):
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser, once per process."""
     parser = argparse.ArgumentParser(
         prog='ctera',
         description='CTERA SDK Command Line Interface'
@@ -68,8 +70,24 @@ def main(args: Optional[list] = None):
     # Interactive mode
     subparsers.add_parser('interactive', help='Start interactive mode')
     
-    # Parse arguments
-    parsed_args = parser.parse_args(args)
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _registry() -> CommandRegistry:
+    """Get the command registry, shared across invocations."""
+    return CommandRegistry()
+
+
+@functools.lru_cache(maxsize=None)
+def _formatter(output_format: OutputFormat) -> OutputFormatter:
+    """Get the output formatter of a format, shared across invocations."""
+    return OutputFormatter(output_format)
+
+
+def main(args: Optional[list] = None):
+    """Main CLI entry point."""
+    parsed_args = _build_parser().parse_args(args)
     
     if parsed_args.version:
         print("CTERA SDK CLI v1.0.0")
@@ -82,8 +100,8 @@ def main(args: Optional[list] = None):
         logging.basicConfig(level=logging.INFO)
     
     # Execute command
-    registry = CommandRegistry()
-    formatter = OutputFormatter(OutputFormat(parsed_args.format))
+    registry = _registry()
+    formatter = _formatter(OutputFormat(parsed_args.format))
     
     try:
         result = registry.execute(parsed_args)
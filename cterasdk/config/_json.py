@@ -0,0 +1,27 @@
+"""JSON encoding of configuration files, accelerated by orjson when it is installed."""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes):
+    """Decode JSON bytes, falling back to the json module for input orjson rejects"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals or integers wider than 64 bits, which the json module accepts
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode to indented JSON bytes, falling back to the json module for objects orjson rejects"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-string keys or integers wider than 64 bits
+    return json.dumps(obj, indent=2).encode('utf-8')
@@ -1,44 +1,107 @@
 """Configuration loader with multiple format support."""
-import json
 import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Tuple
+
+from . import _json
 
 logger = logging.getLogger('cterasdk.config')
 
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+        logger.debug("libyaml is not available, loading YAML with the pure-Python parser")
+except ImportError:
+    yaml = None
+
+_ENV_PREFIX = 'CTERA_'
+_ENV_PREFIX_LENGTH = len(_ENV_PREFIX)
+_ENV_KEY_TABLE = str.maketrans('_', '.')
+
+_CACHE_SIZE = 64  # Maximum number of parsed configuration files kept
+_cache: 'OrderedDict[str, Tuple[Tuple[int, int], bytes]]' = OrderedDict()  # Path to file version and pickled configuration
+_cache_lock = threading.Lock()
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        return _json.loads(f.read())
+
+
+def _read_yaml(path: str) -> Dict[str, Any]:
+    if yaml is None:
+        logger.error("PyYAML not installed, cannot load YAML files")
+        return {}
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _load(reader: Callable, path: Path) -> Dict[str, Any]:
+    """
+    Load a configuration file, parsing it once per file version, identified by its modification time and size.
+    
+    The cache keeps the configuration pickled, since unpickling a fresh copy is much faster than copying it deeply.
+    """
+    key = str(path)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == version:
+            _cache.move_to_end(key)
+            return pickle.loads(entry[1])
+    config = reader(key)
+    with _cache_lock:
+        _cache[key] = (version, pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return config
+
 
 class ConfigLoader:
-    """Loads configuration from various formats."""
+    """
+    Loads configuration from various formats.
+    
+    Parsed files are cached until their modification time or size changes.
+    Every call returns a copy, which callers may modify.
+    """
     
     @staticmethod
     def load_json(path: Path) -> Dict[str, Any]:
         """Load JSON configuration."""
-        with open(path, 'r') as f:
-            return json.load(f)
+        return _load(_read_json, path)
     
     @staticmethod
     def load_yaml(path: Path) -> Dict[str, Any]:
         """Load YAML configuration."""
-        try:
-            import yaml
-            with open(path, 'r') as f:
-                return yaml.safe_load(f)
-        except ImportError:
-            logger.error("PyYAML not installed, cannot load YAML files")
-            return {}
+        return _load(_read_yaml, path)
+    
+    @staticmethod
+    def invalidate(path: Optional[Path] = None):
+        """
+        Discard cached configuration files, forcing the next load to parse them again.
+        
+        :param Path path: Configuration file to discard, defaults to all files
+        """
+        with _cache_lock:
+            if path is None:
+                _cache.clear()
+            else:
+                _cache.pop(str(path), None)
     
     @staticmethod
     def load_env() -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        import os
-        config = {}
-        
-        for key, value in os.environ.items():
-            if key.startswith('CTERA_'):
-                config_key = key[6:].lower().replace('_', '.')
-                config[config_key] = value
-        
-        return config
+        return {key[_ENV_PREFIX_LENGTH:].lower().translate(_ENV_KEY_TABLE): value
+                for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
     
     @staticmethod
     def auto_load(path: Path) -> Dict[str, Any]:
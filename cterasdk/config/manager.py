@@ -1,44 +1,101 @@
 """Configuration manager with profile support."""
 import os
+import copy
+import stat
+import functools
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from . import _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger('cterasdk.config')
 
+_STREAMING_THRESHOLD = 64 * 1024
+_NEW_FILE_MODE = 0o600  # Permissions of a new configuration file, readable by its owner only
+
+
+@functools.lru_cache(maxsize=256)
+def _split(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key into its components"""
+    return tuple(key.split('.'))
+
+
+@functools.lru_cache(maxsize=256)
+def _env_key(key: str) -> str:
+    """Name of the environment variable overriding a dotted configuration key"""
+    return f"CTERA_{key.upper().replace('.', '_')}"
+
+
+def _flatten(config: Dict[str, Any], prefix: str = ''):
+    """Yield the ``(dotted_key, value)`` leaves of a nested configuration"""
+    for key, value in config.items():
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, f'{prefix}{key}.')
+        else:
+            yield f'{prefix}{key}', value
+
 
 class Profile:
-    """Configuration profile."""
+    """
+    Configuration profile.
+    
+    Leaf values are indexed by their dotted key, so reading one is a single lookup.
+    The profile keeps its own copy of the configuration, which is modified with :meth:`set`.
+    """
     
     def __init__(self, name: str, config: Dict[str, Any]):
         self.name = name
-        self.config = config
+        self._config = copy.deepcopy(config)
+        self._flat: Dict[str, Any] = dict(_flatten(self._config))
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """A copy of the nested configuration. Modifying it does not modify the profile."""
+        return copy.deepcopy(self._config)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
+        try:
+            value = self._flat[key]
+        except KeyError:
+            value = self._resolve(key)  # e.g. a key of a section, rather than of a value
+        if isinstance(value, dict):
+            value = copy.deepcopy(value)
+        return value if value is not None else default
+    
+    def _resolve(self, key: str) -> Any:
+        value = self._config
+        for k in _split(key):
             if isinstance(value, dict):
                 value = value.get(k)
             else:
-                return default
-        return value if value is not None else default
+                return None
+        return value
     
     def set(self, key: str, value: Any):
         """Set configuration value."""
-        keys = key.split('.')
-        config = self.config
+        keys = _split(key)
+        config = self._config
         for k in keys[:-1]:
             if k not in config:
                 config[k] = {}
             config = config[k]
-        config[keys[-1]] = value
+        config[keys[-1]] = copy.deepcopy(value)
+        self._flat = dict(_flatten(self._config))
 
 
 class ConfigManager:
     """
     Manages SDK configuration with multiple profiles.
+    
+    ``CTERA_*`` environment variables override profile values. They are read once, when the manager is created;
+    call :meth:`refresh_env_overrides` after modifying the environment.
     """
     
     def __init__(self, config_dir: Optional[Path] = None):
@@ -48,22 +105,28 @@ class ConfigManager:
         :param Path config_dir: Configuration directory
         """
         self.config_dir = config_dir or Path.home() / '.ctera'
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        self.profiles: Dict[str, Profile] = {}
+        self._profiles: Dict[str, Profile] = {}
+        self._loaded = False
         self.active_profile: Optional[Profile] = None
-        
-        self._load_profiles()
+        self._env_overrides: Dict[str, str] = {}
+        self.refresh_env_overrides()
+    
+    @property
+    def profiles(self) -> Dict[str, Profile]:
+        """Configuration profiles, loaded from disk on first access."""
+        if not self._loaded:
+            self._load_profiles()
+        return self._profiles
     
     def _load_profiles(self):
         """Load all configuration profiles."""
+        self._loaded = True
         config_file = self.config_dir / 'config.json'
         
         if config_file.exists():
-            import json
-            with open(config_file, 'r') as f:
-                data = json.load(f)
-                for name, config in data.get('profiles', {}).items():
+            with open(config_file, 'rb') as f:
+                for name, config in self._profile_items(f):
                     self.profiles[name] = Profile(name, config)
         
         # Create default profile if none exist
@@ -71,10 +134,17 @@ class ConfigManager:
             self.profiles['default'] = Profile('default', self._default_config())
             self._save_profiles()
     
+    @staticmethod
+    def _profile_items(f):
+        """Iterate the (name, config) profiles of a configuration file, streaming large files with ijson when available."""
+        if ijson is not None and os.fstat(f.fileno()).st_size > _STREAMING_THRESHOLD:
+            return ijson.kvitems(f, 'profiles', use_float=True)
+        return _json.loads(f.read()).get('profiles', {}).items()
+    
     def _save_profiles(self):
         """Save all profiles to disk."""
+        self.config_dir.mkdir(parents=True, exist_ok=True)
         config_file = self.config_dir / 'config.json'
-        import json
         
         data = {
             'profiles': {
@@ -83,8 +153,23 @@ class ConfigManager:
             }
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Replace the file atomically, so a crash never leaves a truncated configuration behind.
+        # The configuration may hold credentials, so the replacement keeps the permissions of the file it replaces.
+        try:
+            mode = stat.S_IMODE(os.stat(config_file).st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        temp_file = config_file.with_suffix('.json.tmp')
+        try:
+            with open(os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), 'wb') as f:
+                os.chmod(temp_file, mode)
+                f.write(_json.dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, config_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
     
     def get_profile(self, name: str) -> Optional[Profile]:
         """Get a profile by name."""
@@ -157,15 +242,26 @@ class ConfigManager:
             }
         }
     
+    def refresh_env_overrides(self):
+        """Reload environment variable overrides, after the environment was modified."""
+        self._env_overrides = {k: v for k, v in os.environ.items() if k.startswith('CTERA_')}
+    
     def get_env_override(self, key: str) -> Optional[str]:
-        """Get environment variable override."""
-        env_key = f"CTERA_{key.upper().replace('.', '_')}"
-        return os.environ.get(env_key)
+        """
+        Get environment variable override.
+        
+        Overrides are read when the manager is created, or by :meth:`refresh_env_overrides`.
+        """
+        return self._env_overrides.get(_env_key(key))
     
     def resolve_value(self, key: str, profile: Optional[Profile] = None) -> Any:
-        """Resolve configuration value with environment override."""
+        """
+        Resolve configuration value with environment override.
+        
+        Overrides are read when the manager is created, or by :meth:`refresh_env_overrides`.
+        """
         # Check environment variable first
-        env_value = self.get_env_override(key)
+        env_value = self._env_overrides.get(_env_key(key))
         if env_value is not None:
             return env_value
         
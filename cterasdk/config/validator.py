@@ -2,6 +2,11 @@
 import logging
 from typing import Dict, Any, List
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger('cterasdk.config')
 
 
@@ -10,6 +15,47 @@ class ValidationError(Exception):
     pass
 
 
+# (section, ((field, required type, predicate, error message), ...))
+_RULES = (
+    ('portal', (
+        ('host', None, bool, "Portal host cannot be empty"),
+        ('port', int, lambda v: 1 <= v <= 65535, "Invalid portal port: {}"),
+        ('timeout', (int, float), lambda v: v > 0, "Invalid portal timeout: {}"),
+    )),
+    ('rate_limit', (
+        ('max_requests', int, lambda v: v >= 1, "Invalid max_requests: {}"),
+        ('window_seconds', (int, float), lambda v: v > 0, "Invalid window_seconds: {}"),
+    )),
+)
+
+
+# Accepts only configurations that pass every rule, so a valid configuration is checked by the compiled validator alone.
+# Draft 4 is used since it does not consider floats such as 443.0 to be integers, like the rules.
+_SCHEMA = {
+    '$schema': 'http://json-schema.org/draft-04/schema#',
+    'type': 'object',
+    'properties': {
+        'portal': {
+            'type': 'object',
+            'properties': {
+                'host': {'not': {'enum': ['', 0, False, None, [], {}]}},
+                'port': {'type': 'integer', 'minimum': 1, 'maximum': 65535},
+                'timeout': {'type': 'number', 'minimum': 0, 'exclusiveMinimum': True},
+            },
+        },
+        'rate_limit': {
+            'type': 'object',
+            'properties': {
+                'max_requests': {'type': 'integer', 'minimum': 1},
+                'window_seconds': {'type': 'number', 'minimum': 0, 'exclusiveMinimum': True},
+            },
+        },
+    },
+}
+
+_compiled_validator = fastjsonschema.compile(_SCHEMA) if fastjsonschema is not None else None
+
+
 class ConfigValidator:
     """Validates configuration against schema."""
     
@@ -21,31 +67,24 @@ class ConfigValidator:
         :param dict config: Configuration to validate
         :return: List of validation errors
         """
-        errors = []
+        if _compiled_validator is not None:
+            try:
+                _compiled_validator(config)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass  # Collect every error, with their messages, from the rules
         
-        # Validate portal config
-        if 'portal' in config:
-            portal = config['portal']
-            if 'host' in portal and not portal['host']:
-                errors.append("Portal host cannot be empty")
-            if 'port' in portal:
-                port = portal['port']
-                if not isinstance(port, int) or port < 1 or port > 65535:
-                    errors.append(f"Invalid portal port: {port}")
-            if 'timeout' in portal:
-                timeout = portal['timeout']
-                if not isinstance(timeout, (int, float)) or timeout <= 0:
-                    errors.append(f"Invalid portal timeout: {timeout}")
+        errors = []
         
-        # Validate rate limit config
-        if 'rate_limit' in config:
-            rl = config['rate_limit']
-            if 'max_requests' in rl:
-                if not isinstance(rl['max_requests'], int) or rl['max_requests'] < 1:
-                    errors.append(f"Invalid max_requests: {rl['max_requests']}")
-            if 'window_seconds' in rl:
-                if not isinstance(rl['window_seconds'], (int, float)) or rl['window_seconds'] <= 0:
-                    errors.append(f"Invalid window_seconds: {rl['window_seconds']}")
+        for section, rules in _RULES:
+            values = config.get(section)
+            if not values:
+                continue
+            for field, types, predicate, message in rules:
+                if field in values:
+                    value = values[field]
+                    if (types is not None and not isinstance(value, types)) or not predicate(value):
+                        errors.append(message.format(value))
         
         return errors
     
@@ -0,0 +1,85 @@
+"""
+Log-bucketed histogram with constant-time recording and percentile queries over the occupied buckets.
+"""
+
+import math
+
+
+class LogBucketHistogram:
+    """
+    Histogram of values in logarithmic buckets, each spanning a fixed ratio of values.
+
+    Each bucket spans a factor of ``1 + 10 ** -sig_digits``, so percentiles are accurate to about half of that.
+    Buckets are created on demand, for values of any magnitude and sign. Zeros and infinities are counted exactly,
+    in buckets of their own. NaNs are counted, but rank above all other values and are estimated as the maximum.
+    Count, sum, minimum and maximum are exact.
+    """
+
+    __slots__ = ('_base', '_inv_log_base', 'positive', 'negative', 'zeros', 'count', 'total', 'min', 'max')
+
+    def __init__(self, sig_digits: int = 2):
+        """
+        Initialize histogram.
+
+        :param int sig_digits: Number of significant decimal digits of bucket boundaries
+        """
+        self._base = 1 + 10 ** -sig_digits
+        self._inv_log_base = 1 / math.log(self._base)
+        self.positive = {}  # Count of positive values by bucket index
+        self.negative = {}  # Count of negative values by bucket index of their absolute value
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> float:
+        if value == math.inf:
+            return math.inf  # Overflow bucket, above all finite values
+        return math.floor(math.log(value) * self._inv_log_base)
+
+    def _center(self, index: int) -> float:
+        return self._base ** (index + 0.5)  # Geometric center of the bucket
+
+    def record(self, value: float):
+        """Record a value"""
+        if value > 0:
+            index = self._index(value)
+            self.positive[index] = self.positive.get(index, 0) + 1
+        elif value < 0:
+            index = self._index(-value)
+            self.negative[index] = self.negative.get(index, 0) + 1
+        elif value == 0:
+            self.zeros += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _ascending(self):
+        """Bucket estimates and counts, in increasing order of value"""
+        for index in sorted(self.negative, reverse=True):
+            yield -self._center(index), self.negative[index]
+        if self.zeros:
+            yield 0.0, self.zeros
+        for index in sorted(self.positive):
+            yield self._center(index), self.positive[index]
+
+    def percentiles(self, *quantiles: float) -> list:
+        """
+        Estimate percentiles in a single scan of the occupied buckets.
+
+        :param quantiles: Increasing quantiles, between 0 and 1
+        :return: Estimated value of each quantile
+        """
+        ranks = [int(self.count * q) for q in quantiles]
+        estimates = []
+        cumulative = 0
+        for estimate, bucket in self._ascending():
+            cumulative += bucket
+            while len(estimates) < len(ranks) and cumulative > ranks[len(estimates)]:
+                estimates.append(min(max(estimate, self.min), self.max))
+            if len(estimates) == len(ranks):
+                break
+        estimates.extend([self.max] * (len(ranks) - len(estimates)))  # Ranks at or beyond the count
+        return estimates
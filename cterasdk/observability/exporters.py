@@ -2,16 +2,74 @@
 Metrics exporters for various monitoring backends.
 """
 
+import asyncio
 import json
 import logging
+import math
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Union
+
+import aiohttp
+
 from .metrics import Metric, MetricsCollector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger('cterasdk.observability')
 
 
+def _metric_default(metric: Metric) -> dict:
+    """Serialize a metric for orjson, which encodes the metric type and timestamp natively"""
+    return {
+        'name': metric.name,
+        'type': metric.metric_type,
+        'value': metric.value,
+        'tags': metric.tags,
+        'timestamp': metric.timestamp,
+    }
+
+
+def _non_finite(value) -> bool:
+    return isinstance(value, float) and not math.isfinite(value)
+
+
+def _dumps(metrics: List[Metric], indent: bool = False) -> bytes:
+    """
+    Serialize metrics to JSON, with orjson when it is installed.
+    
+    Falls back to the json module for what orjson encodes differently or rejects,
+    such as NaN and infinite values, which orjson encodes as null, and non-string tag keys.
+    """
+    if orjson is not None and not any(_non_finite(m.value) for m in metrics):
+        try:
+            return orjson.dumps(metrics, default=_metric_default, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError as e:
+            logger.debug("Serializing metrics with the json module: %s", str(e))
+    return json.dumps([m.to_dict() for m in metrics], indent=2 if indent else None).encode('utf-8')
+
+
+def _prometheus_text(metrics: List[Metric]) -> str:
+    """Render metrics in the Prometheus text format, one newline-terminated line per metric"""
+    parts = []
+    append = parts.append
+    for metric in metrics:
+        append(metric.name.replace('.', '_'))  # Prometheus naming convention
+        tags = metric.tags
+        if tags:
+            append('{')
+            append(','.join([f'{k}="{v}"' for k, v in tags.items()]))
+            append('} ')
+        else:
+            append(' ')
+        append(str(metric.value))
+        append('\n')
+    return ''.join(parts)
+
+
 class MetricsExporter(ABC):
     """Base class for metrics exporters"""
     
@@ -42,12 +100,7 @@ class ConsoleExporter(MetricsExporter):
     def export(self, metrics: List[Metric]) -> bool:
         """Export metrics to console"""
         try:
-            metrics_data = [m.to_dict() for m in metrics]
-            
-            if self.pretty_print:
-                output = json.dumps(metrics_data, indent=2)
-            else:
-                output = json.dumps(metrics_data)
+            output = _dumps(metrics, self.pretty_print).decode('utf-8')
             
             logger.info("Metrics Export:\n%s", output)
             return True
@@ -64,22 +117,7 @@ class PrometheusExporter(MetricsExporter):
     def export(self, metrics: List[Metric]) -> bool:
         """Export metrics in Prometheus format"""
         try:
-            lines = []
-            
-            for metric in metrics:
-                # Convert to Prometheus naming convention
-                name = metric.name.replace('.', '_')
-                
-                # Add tags
-                if metric.tags:
-                    tag_str = ','.join(f'{k}="{v}"' for k, v in metric.tags.items())
-                    metric_line = f'{name}{{{tag_str}}} {metric.value}'
-                else:
-                    metric_line = f'{name} {metric.value}'
-                
-                lines.append(metric_line)
-            
-            prometheus_output = '\n'.join(lines)
+            prometheus_output = _prometheus_text(metrics)
             logger.debug("Prometheus Metrics:\n%s", prometheus_output)
             return True
         except Exception as e:
@@ -105,18 +143,11 @@ class FileExporter(MetricsExporter):
     def export(self, metrics: List[Metric]) -> bool:
         """Export metrics to file"""
         try:
-            with open(self.file_path, 'w') as f:
+            with open(self.file_path, 'wb') as f:
                 if self.format == 'json':
-                    metrics_data = [m.to_dict() for m in metrics]
-                    json.dump(metrics_data, f, indent=2)
+                    f.write(_dumps(metrics, indent=True))
                 elif self.format == 'prometheus':
-                    for metric in metrics:
-                        name = metric.name.replace('.', '_')
-                        if metric.tags:
-                            tag_str = ','.join(f'{k}="{v}"' for k, v in metric.tags.items())
-                            f.write(f'{name}{{{tag_str}}} {metric.value}\n')
-                        else:
-                            f.write(f'{name} {metric.value}\n')
+                    f.write(_prometheus_text(metrics).encode('utf-8'))
             
             logger.debug("Metrics exported to file: %s", self.file_path)
             return True
@@ -128,6 +159,10 @@ class FileExporter(MetricsExporter):
 class HTTPExporter(MetricsExporter):
     """
     Exports metrics to an HTTP endpoint.
+    
+    Each event loop keeps its HTTP session open across exports, until the loop shuts down, as :func:`asyncio.run` does,
+    or :meth:`close` is called on it. Loops closed without shutting down must call :meth:`close` first.
+    Call :meth:`shutdown` to release the session of exports made outside a running event loop.
     """
     
     def __init__(self, url: str, headers: dict = None):
@@ -139,27 +174,76 @@ class HTTPExporter(MetricsExporter):
         """
         self.url = url
         self.headers = headers or {'Content-Type': 'application/json'}
+        self._sessions = {}  # Event loop to its HTTP session, and the task closing the session when the loop shuts down
+        self._loop = None  # Event loop of exports made outside a running event loop
+        self._tasks = set()
     
-    def export(self, metrics: List[Metric]) -> bool:
+    def export(self, metrics: List[Metric]) -> Union[bool, 'asyncio.Task']:
+        """
+        Export metrics via HTTP POST.
+        
+        When called from a running event loop, the export is scheduled on that loop,
+        and the task is returned rather than its result. Await the task for the result.
+        
+        :return: True if successful, False otherwise, or the export task
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(self.export_async(metrics))
+        
+        task = loop.create_task(self.export_async(metrics))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def export_async(self, metrics: List[Metric]) -> bool:
         """Export metrics via HTTP POST"""
         try:
-            import aiohttp
-            import asyncio
-            
-            async def post_metrics():
-                metrics_data = [m.to_dict() for m in metrics]
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.url,
-                        json=metrics_data,
-                        headers=self.headers
-                    ) as response:
-                        return response.status < 400
-            
-            loop = asyncio.get_event_loop()
-            success = loop.run_until_complete(post_metrics())
-            return success
+            async with self._get_session().post(self.url, data=_dumps(metrics)) as response:
+                return response.status < 400
         except Exception as e:
             logger.error("Failed to export metrics via HTTP: %s", str(e))
             return False
-
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+        for stale in [other for other in self._sessions if other.is_closed()]:
+            logger.debug("Discarding the HTTP session of an event loop closed without shutting down")
+            del self._sessions[stale]
+        session = aiohttp.ClientSession(
+            headers={'Content-Type': 'application/json', **self.headers},
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        )
+        closer = loop.create_task(self._close_on_shutdown(loop, session))
+        self._sessions[loop] = (session, closer)
+        return session
+    
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+        """Wait until cancelled, as pending tasks are when the event loop shuts down, then close the session"""
+        try:
+            await loop.create_future()
+        finally:
+            if self._sessions.get(loop, (None,))[0] is session:
+                del self._sessions[loop]
+            await session.close()
+    
+    async def close(self):
+        """Close the HTTP session of the running event loop"""
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            closer = entry[1]
+            closer.cancel()
+            await asyncio.gather(closer, return_exceptions=True)
+    
+    def shutdown(self):
+        """Close the HTTP session and the event loop used by exports made outside a running event loop"""
+        if self._loop is not None:
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+            self._loop = None
@@ -5,16 +5,33 @@ Health check utilities for monitoring SDK and service health.
 import time
 import asyncio
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from datetime import datetime
 
 
+_now = time.monotonic
+
+
 class HealthStatus(str, Enum):
     """Health status enumeration"""
     HEALTHY = "healthy"
     DEGRADED = "degraded"
     UNHEALTHY = "unhealthy"
     UNKNOWN = "unknown"
+    
+    @property
+    def label(self) -> str:
+        """Serialized name of the status, e.g. ``'healthy'``"""
+        return self.value
+
+
+# Rank of each status, the overall status being the most severe one
+_SEVERITY = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.UNKNOWN: 1,
+    HealthStatus.DEGRADED: 2,
+    HealthStatus.UNHEALTHY: 3,
+}
 
 
 class HealthCheckResult:
@@ -42,7 +59,19 @@ class HealthCheckResult:
         self.message = message
         self.details = details or {}
         self.duration = duration
-        self.timestamp = datetime.now()
+        self._ts_ns = time.time_ns()
+        self._timestamp: Optional[datetime] = None  # Built from the recording time on first access
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Time the result was recorded"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._ts_ns / 1e9)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, timestamp: datetime):
+        self._timestamp = timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -63,8 +92,11 @@ class HealthCheck:
     
     def __init__(self):
         """Initialize health check manager"""
-        self._checks: Dict[str, Callable] = {}
+        self._checks: Dict[str, Tuple[Callable, bool]] = {}  # name: (check function, is coroutine function)
         self._last_results: Dict[str, HealthCheckResult] = {}
+        self._order: Tuple[Tuple[str, Callable, bool], ...] = ()  # Registered checks, in registration order
+        self._status_version = 0
+        self._overall_status = (-1, HealthStatus.UNKNOWN)  # (status version, overall status)
     
     def register_check(self, name: str, check_func: Callable) -> None:
         """
@@ -73,7 +105,11 @@ class HealthCheck:
         :param str name: Check name
         :param callable check_func: Function that performs the check
         """
-        self._checks[name] = check_func
+        self._checks[name] = (check_func, asyncio.iscoroutinefunction(check_func))
+        self._update_order()
+    
+    def _update_order(self) -> None:
+        self._order = tuple((name, check_func, is_async) for name, (check_func, is_async) in self._checks.items())
     
     def unregister_check(self, name: str) -> bool:
         """
@@ -84,8 +120,10 @@ class HealthCheck:
         """
         if name in self._checks:
             del self._checks[name]
+            self._update_order()
             if name in self._last_results:
                 del self._last_results[name]
+                self._status_version += 1
             return True
         return False
     
@@ -103,25 +141,30 @@ class HealthCheck:
                 f"Check '{name}' not found"
             )
         
-        check_func = self._checks[name]
-        start_time = time.time()
+        check_func, is_async = self._checks[name]
+        return await self._invoke(name, check_func, is_async)
+    
+    async def _invoke(self, name: str, check_func: Callable, is_async: bool) -> HealthCheckResult:
+        """Run a registered health check and record its result"""
+        start_time = _now()
         
         try:
-            if asyncio.iscoroutinefunction(check_func):
+            if is_async:
                 result = await check_func()
             else:
-                result = check_func()
+                # Blocking checks run on the default executor, so concurrent checks are not serialized
+                result = await asyncio.get_running_loop().run_in_executor(None, check_func)
             
-            duration = time.time() - start_time
+            duration = _now() - start_time
             
             if isinstance(result, HealthCheckResult):
                 result.duration = duration
-                self._last_results[name] = result
+                self._record(name, result)
                 return result
             elif isinstance(result, bool):
                 status = HealthStatus.HEALTHY if result else HealthStatus.UNHEALTHY
                 result_obj = HealthCheckResult(name, status, duration=duration)
-                self._last_results[name] = result_obj
+                self._record(name, result_obj)
                 return result_obj
             else:
                 result_obj = HealthCheckResult(
@@ -130,31 +173,37 @@ class HealthCheck:
                     "Invalid check result type",
                     duration=duration
                 )
-                self._last_results[name] = result_obj
+                self._record(name, result_obj)
                 return result_obj
         
         except Exception as e:
-            duration = time.time() - start_time
+            duration = _now() - start_time
             result = HealthCheckResult(
                 name,
                 HealthStatus.UNHEALTHY,
                 f"Check failed: {str(e)}",
                 duration=duration
             )
-            self._last_results[name] = result
+            self._record(name, result)
             return result
     
+    def _record(self, name: str, result: HealthCheckResult) -> None:
+        self._last_results[name] = result
+        self._status_version += 1
+    
     async def run_all_checks(self) -> List[HealthCheckResult]:
         """
-        Run all registered health checks.
+        Run all registered health checks concurrently.
         
         :return: List of health check results
         """
-        results = []
-        for name in self._checks.keys():
-            result = await self.run_check(name)
-            results.append(result)
-        return results
+        order = self._order
+        results = await asyncio.gather(*(self._invoke(*check) for check in order), return_exceptions=True)
+        return [
+            result if not isinstance(result, BaseException) else
+            HealthCheckResult(name, HealthStatus.UNHEALTHY, f"Check failed: {str(result)}")
+            for (name, _, _), result in zip(order, results)
+        ]
     
     def get_last_result(self, name: str) -> Optional[HealthCheckResult]:
         """
@@ -171,19 +220,17 @@ class HealthCheck:
         
         :return: Overall health status
         """
-        if not self._last_results:
-            return HealthStatus.UNKNOWN
+        version, overall = self._overall_status
+        if version == self._status_version:
+            return overall
         
-        statuses = [result.status for result in self._last_results.values()]
+        # The overall status is the most severe one, so a mix of healthy and unknown checks is unknown
+        overall = max(
+            (result.status for result in self._last_results.values()), key=_SEVERITY.__getitem__, default=HealthStatus.UNKNOWN
+        )
         
-        if any(s == HealthStatus.UNHEALTHY for s in statuses):
-            return HealthStatus.UNHEALTHY
-        elif any(s == HealthStatus.DEGRADED for s in statuses):
-            return HealthStatus.DEGRADED
-        elif all(s == HealthStatus.HEALTHY for s in statuses):
-            return HealthStatus.HEALTHY
-        else:
-            return HealthStatus.UNKNOWN
+        self._overall_status = (self._status_version, overall)
+        return overall
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -2,13 +2,16 @@
 Metrics collection for SDK operations.
 """
 
+import math
 import time
 import threading
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from collections import defaultdict, deque
 from datetime import datetime
 
+from ._hdr import LogBucketHistogram
+
 
 class MetricType(str, Enum):
     """Types of metrics"""
@@ -55,23 +58,89 @@ class Metric:
         }
 
 
+class _SummaryWindow:
+    """
+    Latest observed values, with their extremes kept in monotonic queues.
+    
+    Observing a value is amortized constant time, also when it evicts the oldest one.
+    The sum is computed exactly when read, so that a large evicted value does not leave a rounding error behind.
+    """
+    
+    __slots__ = ('values', 'minima', 'maxima')
+    
+    def __init__(self, size: int):
+        self.values = deque(maxlen=size)
+        self.minima = deque()  # Increasing candidates for the minimum of the window
+        self.maxima = deque()  # Decreasing candidates for the maximum of the window
+    
+    def observe(self, value: float):
+        if self.values and len(self.values) == self.values.maxlen:
+            evicted = self.values[0]
+            if self.minima[0] == evicted:
+                self.minima.popleft()
+            if self.maxima[0] == evicted:
+                self.maxima.popleft()
+        self.values.append(value)
+        while self.minima and self.minima[-1] > value:
+            self.minima.pop()
+        self.minima.append(value)
+        while self.maxima and self.maxima[-1] < value:
+            self.maxima.pop()
+        self.maxima.append(value)
+
+
+_SHARD_COUNT = 16  # Power of two, so that a key hash is mapped to a shard with a mask
+_SHARD_MASK = _SHARD_COUNT - 1
+
+_SNAPSHOT_TTL = 0.1  # Seconds to serve the same snapshot of all metrics, if none was updated in between
+
+
+class _Shard:
+    """Metrics of the keys hashed to this shard, guarded by the shard lock"""
+    
+    __slots__ = ('lock', 'counters', 'gauges', 'histograms', 'histogram_stats', 'raw_histograms', 'summaries')
+    
+    def __init__(self, max_history: int):
+        self.lock = threading.Lock()
+        self.counters: Dict[tuple, float] = defaultdict(float)
+        self.gauges: Dict[tuple, float] = {}
+        self.histograms: Dict[tuple, LogBucketHistogram] = defaultdict(LogBucketHistogram)
+        self.histogram_stats: Dict[tuple, Tuple[int, Dict[str, float]]] = {}  # Latest stats, and the histogram count they were computed at
+        self.raw_histograms: Dict[tuple, deque] = defaultdict(lambda: deque(maxlen=max_history))
+        self.summaries: Dict[tuple, _SummaryWindow] = defaultdict(lambda: _SummaryWindow(max_history))
+    
+    def clear(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.histogram_stats.clear()
+            self.raw_histograms.clear()
+            self.summaries.clear()
+
+
 class MetricsCollector:
     """
     Collects and aggregates metrics from SDK operations.
+    
+    Metrics are split across shards by key hash, each with its own lock, so that threads updating
+    different metrics rarely contend. Counter and gauge reads take no lock.
+    Snapshots of all metrics are reused until a counter or gauge is updated.
     """
     
-    def __init__(self, max_history: int = 10000):
+    def __init__(self, max_history: int = 10000, keep_raw_histograms: bool = False):
         """
         Initialize metrics collector.
         
         :param int max_history: Maximum number of historical data points to keep
+        :param bool keep_raw_histograms: Whether to also keep the latest ``max_history`` raw histogram values, for debugging
         """
         self.max_history = max_history
-        self._counters: Dict[str, float] = defaultdict(float)
-        self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
-        self._summaries: Dict[str, List[float]] = defaultdict(list)
-        self._lock = threading.Lock()
+        self.keep_raw_histograms = keep_raw_histograms
+        self._shards = tuple(_Shard(max_history) for _ in range(_SHARD_COUNT))
+        self._write_seq = 0
+        self._snapshot = (-1, 0.0, [])  # Write sequence and time it was taken at, and the fields of the metrics
+        self._snapshot_lock = threading.Lock()
         
         # Built-in SDK metrics
         self._initialize_builtin_metrics()
@@ -92,8 +161,10 @@ class MetricsCollector:
         :param dict tags: Optional tags
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            self._counters[key] += value
+        shard = self._shard(key)
+        with shard.lock:
+            shard.counters[key] += value
+        self._write_seq += 1
     
     def set_gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """
@@ -104,8 +175,10 @@ class MetricsCollector:
         :param dict tags: Optional tags
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            self._gauges[key] = value
+        shard = self._shard(key)
+        with shard.lock:
+            shard.gauges[key] = value
+        self._write_seq += 1
     
     def record_histogram(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """
@@ -116,8 +189,11 @@ class MetricsCollector:
         :param dict tags: Optional tags
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            self._histograms[key].append(value)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.histograms[key].record(value)
+            if self.keep_raw_histograms:
+                shard.raw_histograms[key].append(value)
     
     def observe_summary(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """
@@ -128,125 +204,144 @@ class MetricsCollector:
         :param dict tags: Optional tags
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            self._summaries[key].append(value)
-            # Keep only recent observations
-            if len(self._summaries[key]) > self.max_history:
-                self._summaries[key] = self._summaries[key][-self.max_history:]
+        shard = self._shard(key)
+        with shard.lock:
+            shard.summaries[key].observe(value)
     
     def get_counter(self, name: str, tags: Optional[Dict[str, str]] = None) -> float:
         """Get counter value"""
         key = self._make_key(name, tags)
-        with self._lock:
-            return self._counters.get(key, 0.0)
+        return self._shard(key).counters.get(key, 0.0)
     
     def get_gauge(self, name: str, tags: Optional[Dict[str, str]] = None) -> Optional[float]:
         """Get gauge value"""
         key = self._make_key(name, tags)
-        with self._lock:
-            return self._gauges.get(key)
+        return self._shard(key).gauges.get(key)
     
     def get_histogram_stats(self, name: str, tags: Optional[Dict[str, str]] = None) -> Dict[str, float]:
         """
         Get histogram statistics.
         
+        Percentiles are estimated from log-scaled buckets, within about 0.5% of the recorded values.
+        Statistics are computed again only after new values were recorded.
+        
         :return: Dictionary with min, max, mean, p50, p95, p99
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            values = list(self._histograms.get(key, []))
-        
-        if not values:
-            return {}
-        
-        sorted_values = sorted(values)
-        count = len(sorted_values)
+        shard = self._shard(key)
+        with shard.lock:
+            histogram = shard.histograms.get(key)
+            if histogram is None or not histogram.count:
+                return {}
+            count, stats = shard.histogram_stats.get(key, (0, None))
+            if count != histogram.count:
+                p50, p95, p99 = histogram.percentiles(0.50, 0.95, 0.99)
+                stats = {
+                    'count': histogram.count,
+                    'min': histogram.min,
+                    'max': histogram.max,
+                    'mean': histogram.total / histogram.count,
+                    'p50': p50,
+                    'p95': p95,
+                    'p99': p99,
+                }
+                shard.histogram_stats[key] = (histogram.count, stats)
+            return dict(stats)
+    
+    def get_histogram_values(self, name: str, tags: Optional[Dict[str, str]] = None) -> List[float]:
+        """
+        Get the latest raw histogram values, kept only if the collector was created with ``keep_raw_histograms``.
         
-        return {
-            'count': count,
-            'min': sorted_values[0],
-            'max': sorted_values[-1],
-            'mean': sum(sorted_values) / count,
-            'p50': sorted_values[int(count * 0.50)],
-            'p95': sorted_values[int(count * 0.95)],
-            'p99': sorted_values[int(count * 0.99)],
-        }
+        :return: List of values, oldest first
+        """
+        key = self._make_key(name, tags)
+        shard = self._shard(key)
+        with shard.lock:
+            return list(shard.raw_histograms.get(key, []))
     
     def get_summary_stats(self, name: str, tags: Optional[Dict[str, str]] = None) -> Dict[str, float]:
         """
-        Get summary statistics.
+        Get summary statistics of the latest ``max_history`` observed values.
         
         :return: Dictionary with count, sum, mean, min, max
         """
         key = self._make_key(name, tags)
-        with self._lock:
-            values = list(self._summaries.get(key, []))
-        
-        if not values:
-            return {}
-        
-        return {
-            'count': len(values),
-            'sum': sum(values),
-            'mean': sum(values) / len(values),
-            'min': min(values),
-            'max': max(values),
-        }
+        shard = self._shard(key)
+        with shard.lock:
+            summary = shard.summaries.get(key)
+            if summary is None or not summary.values:
+                return {}
+            count = len(summary.values)
+            total = math.fsum(summary.values)
+            return {
+                'count': count,
+                'sum': total,
+                'mean': total / count,
+                'min': summary.minima[0],
+                'max': summary.maxima[0],
+            }
     
     def get_all_metrics(self) -> List[Metric]:
         """
         Get all current metrics.
         
+        The latest snapshot is returned if no counter or gauge was updated since, for up to ``_SNAPSHOT_TTL`` seconds.
+        Every call returns metrics of its own, so modifying them does not modify the snapshot.
+        
         :return: List of all metrics
         """
-        metrics = []
-        
-        with self._lock:
-            # Counters
-            for key, value in self._counters.items():
-                name, tags = self._parse_key(key)
-                metrics.append(Metric(name, MetricType.COUNTER, value, tags))
-            
-            # Gauges
-            for key, value in self._gauges.items():
-                name, tags = self._parse_key(key)
-                metrics.append(Metric(name, MetricType.GAUGE, value, tags))
+        seq, taken, metrics = self._snapshot
+        if seq != self._write_seq or time.monotonic() - taken >= _SNAPSHOT_TTL:
+            with self._snapshot_lock:
+                seq, taken, metrics = self._snapshot
+                now = time.monotonic()
+                if seq != self._write_seq or now - taken >= _SNAPSHOT_TTL:
+                    seq = self._write_seq
+                    metrics = self._collect()
+                    self._snapshot = (seq, now, metrics)
+        return [Metric(name, metric_type, value, dict(tags), timestamp) for name, metric_type, value, tags, timestamp in metrics]
+    
+    def _collect(self) -> List[tuple]:
+        """Collect the fields of the metrics of the counters and gauges of all shards"""
+        counters, gauges = [], []
+        for shard in self._shards:
+            with shard.lock:
+                counters.extend(shard.counters.items())
+                gauges.extend(shard.gauges.items())
         
+        timestamp = datetime.now()
+        metrics = []
+        for key, value in counters:
+            name, tags = self._parse_key(key)
+            metrics.append((name, MetricType.COUNTER, value, tags, timestamp))
+        for key, value in gauges:
+            name, tags = self._parse_key(key)
+            metrics.append((name, MetricType.GAUGE, value, tags, timestamp))
         return metrics
     
     def reset(self):
         """Reset all metrics"""
-        with self._lock:
-            self._counters.clear()
-            self._gauges.clear()
-            self._histograms.clear()
-            self._summaries.clear()
-            self._initialize_builtin_metrics()
+        for shard in self._shards:
+            shard.clear()
+        self._write_seq += 1
+        self._initialize_builtin_metrics()
+    
+    def _shard(self, key: tuple) -> _Shard:
+        """Get the shard of a metric key"""
+        return self._shards[hash(key) & _SHARD_MASK]
     
     @staticmethod
-    def _make_key(name: str, tags: Optional[Dict[str, str]] = None) -> str:
+    def _make_key(name: str, tags: Optional[Dict[str, str]] = None) -> Tuple[str, Optional[FrozenSet]]:
         """Create a unique key from name and tags"""
-        if not tags:
-            return name
-        tag_str = ','.join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{name}{{{tag_str}}}"
+        return (name, frozenset(tags.items())) if tags else (name, None)
     
     @staticmethod
-    def _parse_key(key: str) -> tuple:
-        """Parse key back into name and tags"""
-        if '{' not in key:
-            return key, {}
-        
-        name, tag_str = key.split('{', 1)
-        tag_str = tag_str.rstrip('}')
-        
-        tags = {}
-        if tag_str:
-            for pair in tag_str.split(','):
-                k, v = pair.split('=', 1)
-                tags[k] = v
-        
-        return name, tags
+    def _parse_key(key: Tuple[str, Optional[FrozenSet]]) -> tuple:
+        """Parse key back into name and tags, sorted by tag name"""
+        name, tags = key
+        if not tags:
+            return name, {}
+        return name, dict(sorted((str(k), str(v)) for k, v in tags))
 
 
 class PerformanceTimer:
@@ -263,16 +358,16 @@ class PerformanceTimer:
         self.collector = collector
         self.metric_name = metric_name
         self.tags = tags
-        self.start_time = None
+        self.start_ns = None
     
     def __enter__(self):
         """Start timing"""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and record metric"""
-        duration = time.time() - self.start_time
+        duration = (time.perf_counter_ns() - self.start_ns) / 1e9
         self.collector.record_histogram(self.metric_name, duration, self.tags)
         
         # Also track success/error
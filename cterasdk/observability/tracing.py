@@ -2,9 +2,11 @@
 Distributed tracing support for SDK operations.
 """
 
+import os
 import time
-import uuid
+import itertools
 import threading
+from collections import deque
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
@@ -24,7 +26,7 @@ class SpanStatus(str, Enum):
     UNSET = "unset"
 
 
-class Span:
+class Span:  # pylint: disable=too-many-instance-attributes
     """Represents a trace span"""
     
     def __init__(
@@ -49,12 +51,34 @@ class Span:
         self.span_id = span_id
         self.parent_span_id = parent_span_id
         self.kind = kind
-        self.start_time = time.time()
+        self.start_time = time.time()  # Wall-clock time, for export
         self.end_time: Optional[float] = None
+        self.start_time_ns = time.perf_counter_ns()  # Monotonic, for the duration
+        self.end_time_ns: Optional[int] = None
         self.status = SpanStatus.UNSET
         self.attributes: Dict[str, Any] = {}
         self.events: List[Dict[str, Any]] = []
     
+    @property
+    def kind(self) -> SpanKind:
+        """Span kind"""
+        return self._kind
+
+    @kind.setter
+    def kind(self, kind: SpanKind):
+        self._kind = kind
+        self._kind_value = kind.value
+
+    @property
+    def status(self) -> SpanStatus:
+        """Span status"""
+        return self._status
+
+    @status.setter
+    def status(self, status: SpanStatus):
+        self._status = status
+        self._status_value = status.value
+
     def set_attribute(self, key: str, value: Any):
         """
         Set span attribute.
@@ -91,15 +115,16 @@ class Span:
     
     def end(self):
         """End the span"""
-        if self.end_time is None:
-            self.end_time = time.time()
+        if self.end_time_ns is None:
+            self.end_time_ns = time.perf_counter_ns()
+            self.end_time = self.start_time + (self.end_time_ns - self.start_time_ns) / 1e9
     
     @property
     def duration(self) -> Optional[float]:
         """Get span duration in seconds"""
-        if self.end_time is None:
+        if self.end_time_ns is None:
             return None
-        return self.end_time - self.start_time
+        return (self.end_time_ns - self.start_time_ns) / 1e9
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert span to dictionary"""
@@ -108,30 +133,106 @@ class Span:
             'trace_id': self.trace_id,
             'span_id': self.span_id,
             'parent_span_id': self.parent_span_id,
-            'kind': self.kind.value,
+            'kind': self._kind_value,
             'start_time': self.start_time,
             'end_time': self.end_time,
             'duration': self.duration,
-            'status': self.status.value,
+            'status': self._status_value,
             'attributes': self.attributes,
             'events': self.events,
         }
 
 
+class _DiscardDict(dict):
+    """Always-empty dictionary that silently drops writes"""
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        pass
+
+    def setdefault(self, key, default=None):  # pylint: disable=unused-argument
+        return default
+
+
+class _DiscardList(list):
+    """Always-empty list that silently drops appends"""
+
+    def append(self, item):
+        pass
+
+    def extend(self, items):
+        pass
+
+    def insert(self, index, item):
+        pass
+
+    def __iadd__(self, items):
+        return self
+
+
+class _NoopSpan(Span):
+    """Span returned while tracing is disabled, which records nothing"""
+
+    name = "noop"
+    trace_id = "0"
+    span_id = "0"
+    parent_span_id = None
+    _kind = SpanKind.INTERNAL
+    _kind_value = SpanKind.INTERNAL.value
+    start_time = end_time = 0.0
+    start_time_ns = end_time_ns = 0
+    _status = SpanStatus.UNSET
+    _status_value = SpanStatus.UNSET.value
+    attributes = _DiscardDict()
+    events = _DiscardList()
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        pass
+
+    @Span.kind.setter
+    def kind(self, kind: SpanKind):
+        pass
+
+    @Span.status.setter
+    def status(self, status: SpanStatus):
+        pass
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        pass
+
+    def set_status(self, status: SpanStatus, description: Optional[str] = None):
+        pass
+
+    def end(self):
+        pass
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(super().to_dict(), attributes={}, events=[])
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
 class TracingManager:
     """
     Manages distributed tracing for SDK operations.
     """
     
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, max_completed: int = 10000):
         """
         Initialize tracing manager.
         
         :param bool enabled: Whether tracing is enabled
+        :param int max_completed: Maximum number of completed spans to keep, discarding the oldest ones
         """
         self.enabled = enabled
         self._current_span = threading.local()
-        self._completed_spans: List[Span] = []
+        self._completed_spans: deque = deque(maxlen=max_completed)
         self._lock = threading.Lock()
     
     def start_span(
@@ -149,7 +250,7 @@ class TracingManager:
         :return: New span
         """
         if not self.enabled:
-            return self._create_noop_span()
+            return _NOOP_SPAN
         
         parent_span = self.get_current_span()
         
@@ -205,8 +306,8 @@ class TracingManager:
         """
         with self._lock:
             if limit:
-                return self._completed_spans[-limit:]
-            return self._completed_spans.copy()
+                return list(itertools.islice(reversed(self._completed_spans), limit))[::-1]
+            return list(self._completed_spans)
     
     def clear_completed_spans(self):
         """Clear all completed spans"""
@@ -216,17 +317,12 @@ class TracingManager:
     @staticmethod
     def _generate_trace_id() -> str:
         """Generate a unique trace ID"""
-        return uuid.uuid4().hex
+        return os.urandom(16).hex()
     
     @staticmethod
     def _generate_span_id() -> str:
         """Generate a unique span ID"""
-        return uuid.uuid4().hex[:16]
-    
-    @staticmethod
-    def _create_noop_span() -> Span:
-        """Create a no-op span when tracing is disabled"""
-        return Span("noop", "0", "0")
+        return os.urandom(8).hex()
 
 
 class TracingContext:
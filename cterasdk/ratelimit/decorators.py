@@ -22,7 +22,8 @@ def rate_limited(
     
     :param RateLimitStrategy strategy: Rate limiting strategy (default: TokenBucket)
     :param int tokens: Number of tokens required per call
-    :param int max_retries: Maximum retry attempts if rate limited
+    :param int max_retries: Maximum retry attempts if rate limited. Coroutines wait for their tokens instead of retrying,
+        and raise ValueError if more tokens are required than the strategy can ever grant at once
     
     Example:
         @rate_limited(strategy=FixedWindowStrategy(max_requests=10, window_size=60))
@@ -36,20 +37,8 @@ def rate_limited(
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                for attempt in range(max_retries):
-                    if await strategy.acquire_async(tokens):
-                        return await func(*args, **kwargs)
-                    
-                    wait_time = strategy.wait_time()
-                    if wait_time > 0 and attempt < max_retries - 1:
-                        logger.debug(
-                            "Rate limit reached for %s. Waiting %.2f seconds",
-                            func.__name__, wait_time
-                        )
-                        await asyncio.sleep(wait_time)
-                
-                logger.warning("Rate limit exceeded for %s after %d attempts", func.__name__, max_retries)
-                raise RuntimeError(f"Rate limit exceeded for {func.__name__}")
+                await strategy.wait_async(tokens)
+                return await func(*args, **kwargs)
             
             return async_wrapper
         else:
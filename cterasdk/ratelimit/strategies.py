@@ -10,6 +10,9 @@ from collections import deque
 from typing import Optional
 
 
+_MIN_POLL_INTERVAL = 0.01  # Seconds between attempts of strategies that cannot tell when tokens become available
+
+
 class RateLimitStrategy(ABC):
     """Base class for rate limiting strategies"""
 
@@ -42,6 +45,28 @@ class RateLimitStrategy(ABC):
         """
         pass
 
+    @property
+    def max_tokens(self) -> Optional[int]:
+        """Largest number of tokens that can be acquired at once, or None if unknown"""
+        return None
+
+    def _check_satisfiable(self, tokens: int):
+        """Raise ValueError for requests that can never be satisfied, instead of waiting for them forever"""
+        max_tokens = self.max_tokens
+        if max_tokens is not None and tokens > max_tokens:
+            raise ValueError(f"Cannot acquire {tokens} tokens, at most {max_tokens} can be acquired at once")
+
+    async def wait_async(self, tokens: int = 1):
+        """
+        Wait until tokens are acquired in async context.
+        
+        :param int tokens: Number of tokens to acquire
+        :raises ValueError: If more than ``max_tokens`` tokens are requested
+        """
+        self._check_satisfiable(tokens)
+        while not await self.acquire_async(tokens):
+            await asyncio.sleep(max(self.wait_time(), _MIN_POLL_INTERVAL))
+
 
 class FixedWindowStrategy(RateLimitStrategy):
     """
@@ -92,6 +117,10 @@ class FixedWindowStrategy(RateLimitStrategy):
                 return True
             return False
 
+    @property
+    def max_tokens(self) -> int:
+        return self.max_requests
+
     def wait_time(self) -> float:
         """Calculate wait time until next request can be made"""
         with self._lock:
@@ -123,6 +152,7 @@ class TokenBucketStrategy(RateLimitStrategy):
         self.last_update = time.time()
         self._lock = threading.Lock()
         self._async_lock = asyncio.Lock()
+        self._async_waiters = asyncio.Lock()  # Admits waiting coroutines one at a time, in arrival order
 
     def _refill(self):
         """Refill tokens based on elapsed time"""
@@ -149,6 +179,31 @@ class TokenBucketStrategy(RateLimitStrategy):
                 return True
             return False
 
+    @property
+    def max_tokens(self) -> int:
+        return self.capacity
+
+    async def wait_async(self, tokens: int = 1):
+        """
+        Wait until tokens are acquired in async context.
+        
+        Waiters are served in arrival order. Only the first one sleeps, until exactly enough tokens are refilled,
+        so waiters do not wake up together to compete for the same tokens.
+        
+        :param int tokens: Number of tokens to acquire
+        :raises ValueError: If more tokens than the bucket capacity are requested
+        """
+        self._check_satisfiable(tokens)
+        async with self._async_waiters:
+            while True:
+                with self._lock:
+                    self._refill()
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return
+                    delay = (tokens - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+
     def wait_time(self) -> float:
         """Calculate wait time until enough tokens are available"""
         with self._lock:
@@ -208,6 +263,10 @@ class LeakyBucketStrategy(RateLimitStrategy):
                 return True
             return False
 
+    @property
+    def max_tokens(self) -> int:
+        return self.capacity
+
     def wait_time(self) -> float:
         """Calculate wait time until space is available in queue"""
         with self._lock:
@@ -268,6 +327,10 @@ class AdaptiveStrategy(RateLimitStrategy):
                 return True
             return False
 
+    @property
+    def max_tokens(self) -> int:
+        return 1  # Tokens never accumulate beyond one
+
     def wait_time(self) -> float:
         """Calculate wait time"""
         with self._lock:
@@ -0,0 +1,116 @@
+"""Unit tests for the file operations analytics module"""
+import importlib.util
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from cterasdk.analytics.file_operations import FileOperationsAnalytics
+
+
+class TestMostAccessedFiles(unittest.TestCase):
+    """Test cases for finding the most accessed files"""
+
+    def setUp(self):
+        self.analytics = FileOperationsAnalytics(mock.MagicMock())
+        start = datetime(2026, 1, 1)
+        self.logs = [
+            {'file_path': f'/file{i % 3}', 'username': f'user{i % (i % 3 + 2)}', 'bytes': 1024, 'timestamp': start + timedelta(minutes=i)}
+            for i in range(60)
+        ]
+        self.logs.extend({'file_path': f'/file{i % 2}', 'username': 'user9', 'timestamp': start} for i in range(5))
+
+    def expected(self):
+        paths = sorted({log['file_path'] for log in self.logs}, key=lambda path: -sum(log['file_path'] == path for log in self.logs))
+        return [
+            {
+                'path': path,
+                'access_count': sum(log['file_path'] == path for log in self.logs),
+                'unique_users': len({log['username'] for log in self.logs if log['file_path'] == path}),
+                'total_bytes_transferred_mb': sum(log.get('bytes', 0) for log in self.logs if log['file_path'] == path) / 1024 ** 2,
+                'last_accessed': max(log['timestamp'] for log in self.logs if log['file_path'] == path).isoformat(),
+            }
+            for path in paths
+        ]
+
+    def most_accessed(self, **kwargs):
+        with mock.patch.object(self.analytics, '_fetch_file_access_logs', return_value=self.logs):
+            return self.analytics.get_most_accessed_files(**kwargs)
+
+    @unittest.skipUnless(importlib.util.find_spec('pandas'), 'pandas is not installed')
+    def test_exact_with_pandas(self):
+        """Test unique users are counted exactly by default, with pandas"""
+        self.assertEqual(self.most_accessed(), self.expected())
+
+    def test_exact_without_pandas(self):
+        """Test unique users are counted exactly by default, without pandas"""
+        with mock.patch('cterasdk.analytics.file_operations.pd', None):
+            self.assertEqual(self.most_accessed(), self.expected())
+
+    def test_estimate_without_datasketch(self):
+        """Test unique users are counted exactly when estimates are requested but datasketch is not installed"""
+        with mock.patch('cterasdk.analytics.file_operations.HyperLogLog', None):
+            self.assertEqual(self.most_accessed(exact_unique_users=False), self.expected())
+
+    @unittest.skipUnless(importlib.util.find_spec('datasketch'), 'datasketch is not installed')
+    def test_estimate(self):
+        """Test unique users are estimated with HyperLogLog when requested"""
+        for actual, expected in zip(self.most_accessed(exact_unique_users=False), self.expected()):
+            self.assertAlmostEqual(actual.pop('unique_users'), expected.pop('unique_users'), delta=1)
+            self.assertEqual(actual, expected)
+
+    def test_limit(self):
+        """Test files accessed equally often are returned in order of first access, with and without pandas"""
+        self.logs = [
+            {'file_path': path, 'username': 'user', 'timestamp': datetime(2026, 1, 1, minute=minute)}
+            for minute, path in enumerate(['/b', '/a', '/c', '/a', '/b', '/c', '/d'])
+        ]
+        self.logs[0]['bytes'] = 1024 ** 2
+        with mock.patch('cterasdk.analytics.file_operations.pd', None):
+            expected = self.most_accessed(limit=2)
+        self.assertEqual([(file['path'], file['total_bytes_transferred_mb']) for file in expected], [('/b', 1.0), ('/a', 0)])
+        if importlib.util.find_spec('pandas'):
+            self.assertEqual(self.most_accessed(limit=2), expected)
+
+
+class TestUploadDownloadStats(unittest.TestCase):
+    """Test cases for upload and download statistics"""
+
+    def setUp(self):
+        self.analytics = FileOperationsAnalytics(mock.MagicMock())
+        tz = timezone(timedelta(hours=2))
+        start = datetime(2026, 1, 30, 20, tzinfo=tz)  # A Friday
+        self.operations = [
+            {'type': ('upload', 'download', 'delete')[i % 3], 'bytes': 1024 * i, 'timestamp': start + timedelta(hours=7 * i)}
+            for i in range(40)
+        ]
+        self.operations.append({'type': 'download', 'timestamp': start.astimezone(timezone.utc)})
+
+    def stats(self, group_by):
+        with mock.patch.object(self.analytics, '_fetch_file_operations', return_value=self.operations):
+            return self.analytics.get_upload_download_stats(datetime(2026, 1, 30), datetime(2026, 2, 13), group_by=group_by)
+
+    def test_unsupported_interval(self):
+        """Test grouping by an unsupported interval raises"""
+        with self.assertRaises(ValueError):
+            self.analytics.get_upload_download_stats(group_by='minute')
+
+    def test_without_numpy(self):
+        """Test operations are bucketed by calendar intervals in the time zone of the first operation"""
+        with mock.patch('cterasdk.analytics.file_operations.np', None):
+            stats = self.stats('week')
+        self.assertEqual(stats['total_uploads'], 14)
+        self.assertEqual(stats['total_downloads'], 14)
+        self.assertEqual(stats['total_upload_bytes'], 1024 * sum(range(0, 40, 3)))
+        self.assertEqual(stats['total_download_bytes'], 1024 * sum(range(1, 40, 3)))
+        self.assertEqual([bucket['start'] for bucket in stats['timeline']], [
+            '2026-01-26T00:00:00+02:00', '2026-02-02T00:00:00+02:00', '2026-02-09T00:00:00+02:00'
+        ])
+        self.assertEqual(stats['peak_upload_time'], '2026-02-02T00:00:00+02:00')
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_with_numpy(self):
+        """Test NumPy buckets operations as they are bucketed in pure Python"""
+        for group_by in ('hour', 'day', 'week', 'month'):
+            with mock.patch('cterasdk.analytics.file_operations.np', None):
+                expected = self.stats(group_by)
+            self.assertEqual(self.stats(group_by), expected, group_by)
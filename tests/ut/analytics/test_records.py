@@ -0,0 +1,38 @@
+"""Unit tests for the analytics record types"""
+import dataclasses
+import unittest
+
+from cterasdk.analytics.records import AdminActivityRecord, StorageTrendPoint
+
+
+class TestRecords(unittest.TestCase):
+    """Test cases for the analytics record types"""
+
+    def setUp(self):
+        self.record = AdminActivityRecord('2026-01-01T00:00:00', 'admin', 'delete_user', 'user', 42, {'name': 'alice'}, True)
+
+    def test_to_dict(self):
+        """Test records convert to dictionaries keyed by field name, in field order"""
+        self.assertEqual(list(self.record.to_dict().items()), [
+            ('timestamp', '2026-01-01T00:00:00'),
+            ('admin_username', 'admin'),
+            ('action', 'delete_user'),
+            ('resource_type', 'user'),
+            ('resource_id', 42),
+            ('details', {'name': 'alice'}),
+            ('success', True),
+        ])
+        point = StorageTrendPoint('2026-01-01T00:00:00', 1.5, 10.0, 15.0, 0.1)
+        self.assertEqual(point.to_dict(), {
+            'timestamp': '2026-01-01T00:00:00',
+            'total_used_gb': 1.5,
+            'total_capacity_gb': 10.0,
+            'utilization_percent': 15.0,
+            'growth_rate_gb_per_day': 0.1,
+        })
+
+    def test_immutable(self):
+        """Test records are immutable and have no instance dictionary"""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.record.action = 'create_user'
+        self.assertFalse(hasattr(self.record, '__dict__'))
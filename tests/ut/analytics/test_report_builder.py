@@ -0,0 +1,176 @@
+# pylint: disable=protected-access
+"""Unit tests for the report builder module"""
+import asyncio
+import csv
+import importlib.util
+import math
+import os
+import random
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from cterasdk.analytics import report_builder
+from cterasdk.analytics.report_builder import AggregationType, ReportBuilder, ReportFilter
+
+
+class TestExportCSV(unittest.TestCase):
+    """Test cases for exporting reports as CSV"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'report.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def export(self, data):
+        self.assertTrue(ReportBuilder._export_csv({'data': data}, self.path))
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def dict_writer(self, data):
+        with open(self.path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+            writer.writeheader()
+            writer.writerows(data)
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_matches_dict_writer(self):
+        """Test the exported bytes match csv.DictWriter, including missing fields"""
+        data = [{'name': 'a,b', 'size': 5, 'ratio': 0.5}, {'size': 7, 'name': None}, {'name': 'c', 'size': 1, 'ratio': 2.0}]
+        self.assertEqual(self.export(data), self.dict_writer(data))
+
+    def test_single_column(self):
+        """Test exporting records of a single field"""
+        self.assertEqual(self.export([{'name': 'a'}, {'name': 'b'}]), b'name\r\na\r\nb\r\n')
+
+    def test_extra_fields_raise(self):
+        """Test a record with fields missing from the header raises ValueError"""
+        with self.assertRaises(ValueError):
+            ReportBuilder._export_csv({'data': [{'name': 'a'}, {'name': 'b', 'size': 1}]}, self.path)
+
+    def test_empty(self):
+        """Test a report without data is not exported"""
+        self.assertFalse(ReportBuilder._export_csv({'data': []}, self.path))
+
+
+class TestCalculateAggregation(unittest.TestCase):
+    """Test cases for aggregating values with and without the JIT-compiled kernels"""
+
+    def setUp(self):
+        generator = random.Random(0)
+        self.values = [generator.uniform(0, 1000) for _ in range(5000)]
+        # Values of mixed magnitude and sign, whose sum depends on the order and rounding of the additions
+        self.ill_conditioned = [generator.choice([1e16, -1e16, 1.0, 0.1, 3.7e10]) * generator.random() for _ in range(5000)]
+
+    def aggregate(self, values, agg_type, jit):
+        if jit:
+            return ReportBuilder._calculate_aggregation(values, agg_type)
+        with mock.patch('cterasdk.analytics.report_builder._jit_kernels', return_value=None):
+            return ReportBuilder._calculate_aggregation(values, agg_type)
+
+    def assert_aggregates(self, jit):
+        self.assertTrue(math.isclose(self.aggregate(self.values, AggregationType.SUM, jit), math.fsum(self.values), rel_tol=1e-12))
+        for values in (self.values, self.ill_conditioned):
+            self.assertEqual(self.aggregate(values, AggregationType.SUM, jit), sum(values))
+            self.assertEqual(self.aggregate(values, AggregationType.AVG, jit), sum(values) / len(values))
+            self.assertEqual(self.aggregate(values, AggregationType.MIN, jit), min(values))
+            self.assertEqual(self.aggregate(values, AggregationType.MAX, jit), max(values))
+
+    @unittest.skipUnless(importlib.util.find_spec('numba'), 'numba is not installed')
+    def test_jit_kernels(self):
+        """Test the JIT-compiled kernels aggregate exactly as the Python built-ins"""
+        self.assert_aggregates(jit=True)
+
+    def test_builtins(self):
+        """Test aggregating with the Python built-ins"""
+        self.assert_aggregates(jit=False)
+
+
+class TestBuild(unittest.TestCase):
+    """Test cases for building reports from several data sources"""
+
+    def setUp(self):
+        self.builder = ReportBuilder(mock.MagicMock()).add_data_source('users').add_data_source('devices')
+        self.threads = set()
+
+    def fetch(self, source):
+        self.threads.add(threading.get_ident())
+        for index in range(3):
+            yield {'source': source['type'], 'index': index}
+
+    def test_sources_fetched_in_calling_thread(self):
+        """Test data sources are streamed one after the other, without sharing the Portal session across threads"""
+        with mock.patch.object(self.builder, '_fetch_data_source', side_effect=self.fetch):
+            report = self.builder.build()
+        self.assertEqual(self.threads, {threading.get_ident()})
+        self.assertEqual([(row['source'], row['index']) for row in report['data']], [
+            ('users', 0), ('users', 1), ('users', 2), ('devices', 0), ('devices', 1), ('devices', 2)
+        ])
+
+    def test_build_async(self):
+        """Test data sources are gathered asynchronously"""
+        async def fetch(source):
+            return list(self.fetch(source))
+
+        with mock.patch.object(self.builder, '_fetch_data_source_async', side_effect=fetch):
+            report = asyncio.run(self.builder.build_async())
+        self.assertEqual(len(report['data']), 6)
+
+
+class TestSelect(unittest.TestCase):
+    """Test cases for selecting records with Arrow kernels, and row by row"""
+
+    def setUp(self):
+        self.records = [
+            {'name': f'user{index}', 'size': index * 7 % 50 + 1, 'owner': {'group': 'admins' if index % 3 else 'users'}}
+            for index in range(100)
+        ]
+
+    def build(self, records, report_filter, columnar):
+        builder = ReportBuilder(mock.MagicMock()).add_data_source('users').add_filter(report_filter).sort('size', descending=True)
+        builder.set_limit(10)
+        with mock.patch.object(builder, '_fetch_data_source', return_value=iter(records)), \
+                mock.patch('cterasdk.analytics.report_builder.pa', report_builder.pa if columnar else None):
+            report = builder.build()
+        return report['data'], report.get('error')
+
+    def assert_paths_agree(self, records, report_filter):
+        expected, error = self.build(records, report_filter, False)
+        self.assertIsNone(error)
+        self.assertEqual(self.build(records, report_filter, True), (expected, None))
+        return expected
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_filters(self):
+        """Test both paths select the same records"""
+        report_filter = ReportFilter().add_greater_than('size', 10).add_less_than('size', 45).add_equals('owner.group', 'admins')
+        selected = self.assert_paths_agree(self.records, report_filter.add_contains('name', 'user').add_in('size', [20, 27, 41, 44]))
+        self.assertEqual([record['size'] for record in selected], [44, 41, 41, 27, 20, 20])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_missing_values(self):
+        """Test both paths match missing values equally"""
+        records = self.records + [{'name': 'user100', 'size': 12, 'owner': {'group': None}}]
+        selected = self.assert_paths_agree(records, ReportFilter().add_equals('owner.group', None))
+        self.assertEqual(selected, [records[-1]])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_ordered_comparison_with_missing_values(self):
+        """Test both paths fail when comparing a missing value, rather than excluding the record"""
+        records = self.records + [{'name': 'user100', 'size': None, 'owner': {'group': 'users'}}]
+        for columnar in (False, True):
+            data, error = self.build(records, ReportFilter().add_greater_than('size', 10), columnar)
+            self.assertEqual(data, [])
+            self.assertEqual(error, "'>' not supported between instances of 'NoneType' and 'int'")
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_mixed_types(self):
+        """Test records of mixed types are selected row by row"""
+        records = self.records + [{'name': 'user100', 'size': 30, 'owner': 'nobody'}]
+        selected = self.assert_paths_agree(records, ReportFilter().add_contains('name', 'user'))
+        self.assertEqual(len(selected), 10)
@@ -0,0 +1,80 @@
+"""Unit tests for the security audit analytics module"""
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from cterasdk.analytics.records import AdminActivityRecord, FailedLoginRecord
+from cterasdk.analytics.security_audit import SecurityAuditAnalytics
+
+
+class TestDetectAnomalousBehavior(unittest.TestCase):
+    """Test cases for anomalous behavior detection"""
+
+    def setUp(self):
+        self.analytics = SecurityAuditAnalytics(mock.MagicMock())
+        self.end = datetime(2026, 1, 8)
+        self.start = self.end - timedelta(days=7)
+
+    def access_logs(self, count):
+        return [
+            {'id': i, 'timestamp': self.start + timedelta(seconds=i), 'username': 'user', 'action': 'delete', 'ip_address': str(i)}
+            for i in range(count)
+        ]
+
+    def test_access_logs_fetched_once(self):
+        """Test access logs are fetched in a single pass over the window"""
+        with mock.patch.object(self.analytics, '_fetch_access_logs', return_value=self.access_logs(10)) as fetch:
+            self.analytics.detect_anomalous_behavior(self.start, self.end)
+        fetch.assert_called_once()
+
+    def test_no_anomalies_reported(self):
+        """Test the placeholder detectors report no anomalies"""
+        with mock.patch.object(self.analytics, '_fetch_access_logs', return_value=self.access_logs(500)):
+            self.assertEqual(self.analytics.detect_anomalous_behavior(self.start, self.end), [])
+
+
+class TestAuditRecords(unittest.TestCase):
+    """Test cases for the records returned by the audit getters"""
+
+    def setUp(self):
+        self.analytics = SecurityAuditAnalytics(mock.MagicMock())
+        self.end = datetime(2026, 1, 8)
+        self.start = self.end - timedelta(days=5)
+
+    def test_failed_login_attempts(self):
+        """Test failed login attempts are returned per user, with the most attempts first"""
+        attempts = [
+            {'id': i, 'timestamp': self.start + timedelta(minutes=i), 'username': 'bob' if i % 3 == 0 else 'alice',
+             'ip_address': f'10.0.0.{i % 2}'}
+            for i in range(12)
+        ]
+        with mock.patch.object(self.analytics, '_fetch_login_attempts', return_value=attempts):
+            records = self.analytics.get_failed_login_attempts(self.start, self.end, threshold=4)
+        self.assertTrue(all(isinstance(record, FailedLoginRecord) for record in records))
+        self.assertEqual([(record.username, record.failed_attempts, record.risk_level) for record in records], [
+            ('alice', 8, 'high'), ('bob', 4, 'medium')
+        ])
+        alice = records[0].to_dict()
+        self.assertEqual(sorted(alice.pop('ip_addresses')), ['10.0.0.0', '10.0.0.1'])
+        self.assertEqual(alice, {
+            'username': 'alice',
+            'failed_attempts': 8,
+            'first_attempt': (self.start + timedelta(minutes=1)).isoformat(),
+            'last_attempt': (self.start + timedelta(minutes=11)).isoformat(),
+            'risk_level': 'high',
+        })
+
+    def test_admin_activity(self):
+        """Test admin activities are returned as records, with timestamps serialized unless requested otherwise"""
+        activities = [
+            {'id': i, 'timestamp': self.start + timedelta(hours=i), 'admin_username': 'admin', 'action': 'delete_user',
+             'resource_type': 'user', 'resource_id': i, 'success': i % 2 == 0}
+            for i in range(3)
+        ]
+        with mock.patch.object(self.analytics, '_fetch_admin_activities', return_value=activities):
+            records = self.analytics.get_admin_activity(self.start, self.end)
+            unserialized = self.analytics.get_admin_activity(self.start, self.end, limit=2, serialize_timestamps=False)
+        self.assertEqual(records[1], AdminActivityRecord(
+            (self.start + timedelta(hours=1)).isoformat(), 'admin', 'delete_user', 'user', 1, {}, False
+        ))
+        self.assertEqual([record.timestamp for record in unserialized], [self.start, self.start + timedelta(hours=1)])
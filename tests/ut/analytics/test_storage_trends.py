@@ -0,0 +1,166 @@
+# pylint: disable=protected-access
+"""Unit tests for the storage trends analytics module"""
+import contextlib
+import importlib.util
+import unittest
+from datetime import datetime, timedelta
+from statistics import NormalDist, linear_regression
+from unittest import mock
+
+from cterasdk.analytics.records import StorageTrendPoint
+from cterasdk.analytics.storage_trends import StorageTrendsAnalytics
+
+
+class TestStorageByFileType(unittest.TestCase):
+    """Test cases for the storage distribution by file type"""
+
+    def setUp(self):
+        self.analytics = StorageTrendsAnalytics(mock.MagicMock())
+        self.file_stats = [
+            {'extension': 'pdf', 'size_bytes': 3 << 30, 'count': 30},
+            {'extension': None, 'size_bytes': 1 << 30, 'count': 5},
+            {'extension': 'docx', 'size_bytes': 2 << 30, 'count': 20},
+            {'extension': '', 'size_bytes': 2 << 30, 'count': 15},
+            {'extension': 'pdf', 'size_bytes': (1 << 62) - (3 << 30), 'count': 1},
+        ]
+        self.expected = {
+            'pdf': ((1 << 62), 31),
+            'no_extension': (3 << 30, 20),
+            'docx': (2 << 30, 20),
+        }
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_totals_vectorized(self):
+        """Test statistics of the same extension are summed exactly, in order of first occurrence"""
+        totals = self.analytics._file_type_totals_vectorized(self.file_stats)
+        self.assertEqual(list(totals.items()), list(self.expected.items()))
+
+    def test_totals(self):
+        """Test statistics of the same extension are summed, in order of first occurrence"""
+        totals = self.analytics._file_type_totals(self.file_stats)
+        self.assertEqual(list(totals.items()), list(self.expected.items()))
+
+    def test_storage_by_file_type(self):
+        """Test the distribution is reported in gigabytes and percentages of the total size"""
+        file_stats = self.file_stats[:4]
+        with mock.patch.object(self.analytics, '_fetch_file_type_statistics', return_value=file_stats), \
+                mock.patch('cterasdk.analytics.storage_trends.np', None):
+            fallback = self.analytics.get_storage_by_file_type()
+        with mock.patch.object(self.analytics, '_fetch_file_type_statistics', return_value=file_stats):
+            report = self.analytics.get_storage_by_file_type()
+        self.assertEqual(report, fallback)
+        self.assertEqual(report['total_size_gb'], 8)
+        self.assertEqual(report['file_types'], {
+            'pdf': {'size_gb': 3, 'count': 30, 'percentage': 37.5},
+            'no_extension': {'size_gb': 3, 'count': 20, 'percentage': 37.5},
+            'docx': {'size_gb': 2, 'count': 20, 'percentage': 25},
+        })
+        self.assertEqual(list(report['file_types']), ['pdf', 'no_extension', 'docx'])
+
+
+class TestStorageGrowthTrend(unittest.TestCase):
+    """Test cases for the storage growth trend"""
+
+    def setUp(self):
+        self.analytics = StorageTrendsAnalytics(mock.MagicMock())
+        self.start = datetime(2026, 1, 1)
+        self.snapshots = [
+            {'timestamp': self.start + timedelta(days=day), 'used_bytes': (day + 1) << 30, 'capacity_bytes': 8 << 30, 'growth_rate': 1.0}
+            for day in range(4)
+        ]
+        self.snapshots.append({'timestamp': self.start + timedelta(days=4), 'used_bytes': 0, 'capacity_bytes': 0})
+
+    def trend(self, **kwargs):
+        with mock.patch.object(self.analytics, '_storage_snapshots', return_value=iter(self.snapshots)):
+            return self.analytics.get_storage_growth_trend(self.start, self.start + timedelta(days=4), **kwargs)
+
+    def test_trend_points(self):
+        """Test snapshots are converted to trend points in gigabytes, with timestamps serialized unless requested otherwise"""
+        with mock.patch('cterasdk.analytics.storage_trends.np', None):
+            trend = self.trend()
+            unserialized = self.trend(serialize_timestamps=False)
+        self.assertEqual(trend[1], StorageTrendPoint('2026-01-02T00:00:00', 2.0, 8.0, 25.0, 1.0))
+        self.assertEqual(trend[-1], StorageTrendPoint('2026-01-05T00:00:00', 0.0, 0.0, 0.0, 0))
+        self.assertEqual(unserialized[0].timestamp, self.start)
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_vectorized(self):
+        """Test NumPy converts snapshots to the same trend points"""
+        with mock.patch('cterasdk.analytics.storage_trends.np', None):
+            expected = self.trend()
+        self.assertEqual(self.trend(), expected)
+
+
+class TestCapacityForecast(unittest.TestCase):
+    """Test cases for forecasting capacity needs"""
+
+    def setUp(self):
+        self.analytics = StorageTrendsAnalytics(mock.MagicMock())
+        start = datetime(2026, 1, 1)
+        self.linear = [StorageTrendPoint(start + timedelta(days=day), 100.0 + 2 * day, 201.0, 0.0, 2.0) for day in range(10)]
+        self.noisy = [
+            StorageTrendPoint(point.timestamp, point.total_used_gb + (-1) ** index * 3, point.total_capacity_gb, 0.0, 2.0)
+            for index, point in enumerate(self.linear)
+        ]
+
+    def forecast(self, historical_data, forecast_days=30, confidence=0.95, vectorized=True):
+        with contextlib.nullcontext() if vectorized else mock.patch('cterasdk.analytics.storage_trends.np', None):
+            return self.analytics._perform_capacity_forecast(historical_data, forecast_days, confidence)
+
+    def test_linear_growth(self):
+        """Test linear growth is extrapolated, with the time left until full"""
+        prediction = self.forecast(self.linear, vectorized=False)
+        self.assertEqual(prediction['current_usage_gb'], 118.0)
+        self.assertEqual(prediction['current_capacity_gb'], 201.0)
+        self.assertAlmostEqual(prediction['predicted_usage_gb'], 178.0)
+        self.assertAlmostEqual(prediction['predicted_capacity_needed_gb'], 178.0)
+        self.assertEqual(prediction['days_until_full'], 41)
+        self.assertEqual(prediction['recommended_action'], 'Plan capacity expansion within 41 days')
+
+    def test_prediction_band(self):
+        """Test the capacity needed is the upper bound of the prediction band, with a normal critical value without SciPy"""
+        with mock.patch('cterasdk.analytics.storage_trends.student_t', None):
+            prediction = self.forecast(self.noisy, vectorized=False)
+        usage = [point.total_used_gb for point in self.noisy]
+        slope, intercept = linear_regression(range(len(usage)), usage)
+        residuals = [used - (slope * day + intercept) for day, used in enumerate(usage)]
+        self.assertGreater(prediction['predicted_capacity_needed_gb'], prediction['predicted_usage_gb'])
+        deviation = (prediction['predicted_capacity_needed_gb'] - prediction['predicted_usage_gb']) / NormalDist().inv_cdf(0.975)
+        self.assertAlmostEqual(deviation, (sum(r * r for r in residuals) / 8) ** 0.5)
+
+    def test_student_t(self):
+        """Test the critical value is taken from Student's t distribution when SciPy is installed"""
+        student_t = mock.MagicMock()
+        student_t.ppf.return_value = 2.5
+        with mock.patch('cterasdk.analytics.storage_trends.student_t', student_t):
+            prediction = self.forecast(self.noisy, vectorized=False)
+        student_t.ppf.assert_called_once_with(0.975, 8)
+        with mock.patch('cterasdk.analytics.storage_trends.student_t', None):
+            normal = self.forecast(self.noisy, vectorized=False)
+        band = (prediction['predicted_capacity_needed_gb'] - prediction['predicted_usage_gb']) / 2.5
+        self.assertAlmostEqual(band, (normal['predicted_capacity_needed_gb'] - normal['predicted_usage_gb']) / NormalDist().inv_cdf(0.975))
+
+    def test_full(self):
+        """Test an expansion is recommended when the predicted need exceeds the capacity"""
+        prediction = self.forecast(self.linear, forecast_days=60, vectorized=False)
+        self.assertAlmostEqual(prediction['predicted_usage_gb'], 238.0)
+        self.assertEqual(prediction['recommended_action'], 'Expand capacity by at least 37.0 GB')
+
+    def test_single_point(self):
+        """Test a single data point predicts no growth"""
+        prediction = self.forecast(self.linear[:1], vectorized=False)
+        self.assertEqual(prediction['predicted_usage_gb'], 100.0)
+        self.assertIsNone(prediction['days_until_full'])
+        self.assertEqual(prediction['recommended_action'], 'No action required')
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_vectorized(self):
+        """Test the NumPy fit forecasts as the pure Python fit does"""
+        for historical_data in (self.linear, self.noisy, self.linear[:1], self.linear[:2]):
+            expected = self.forecast(historical_data, vectorized=False)
+            prediction = self.forecast(historical_data)
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(prediction[key], value, msg=key)
+                else:
+                    self.assertEqual(prediction[key], value, key)
@@ -0,0 +1,46 @@
+"""Unit tests for the reporting window helpers"""
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from cterasdk.analytics._window import _fetch_partitioned, _split_window
+
+
+class TestFetchPartitioned(unittest.TestCase):
+    """Test cases for fetching a window as consecutive sub-window queries"""
+
+    def setUp(self):
+        self.start_date = datetime(2024, 1, 1)
+        self.end_date = datetime(2024, 2, 1)
+        self.calls = []
+
+    def fetch(self, start, end, source):
+        self.calls.append((start, end, threading.get_ident()))
+        yield {'source': source, 'start': start}
+        yield {'source': source, 'end': end}
+
+    def test_records_in_window_order(self):
+        """Test the records of all sub-windows are returned in window order"""
+        windows = list(_split_window(self.start_date, self.end_date))
+        self.assertGreater(len(windows), 1)
+        records = list(_fetch_partitioned(self.fetch, self.start_date, self.end_date, 'logs'))
+        self.assertEqual(len(records), 2 * len(windows))
+        self.assertEqual([record.get('start', record.get('end')) for record in records],
+                         [timestamp for window in windows for timestamp in window])
+        self.assertEqual([(start, end) for start, end, _ in self.calls], windows)
+
+    def test_sub_windows_fetched_lazily_in_calling_thread(self):
+        """Test sub-windows are queried one at a time, on the calling thread, as the records are consumed"""
+        records = _fetch_partitioned(self.fetch, self.start_date, self.end_date, 'logs')
+        self.assertEqual(self.calls, [])
+        next(records)
+        self.assertEqual(len(self.calls), 1)
+        list(records)
+        self.assertEqual({thread for _, _, thread in self.calls}, {threading.get_ident()})
+
+    def test_single_window(self):
+        """Test a window shorter than the maximum span is fetched in a single query"""
+        end_date = self.start_date + timedelta(days=1)
+        records = list(_fetch_partitioned(self.fetch, self.start_date, end_date, source='logs'))
+        self.assertEqual(records, [{'source': 'logs', 'start': self.start_date}, {'source': 'logs', 'end': end_date}])
+        self.assertEqual(len(self.calls), 1)
@@ -0,0 +1,121 @@
+"""Unit tests for the bulk operations module"""
+import asyncio
+import threading
+import time
+import unittest
+
+from cterasdk.bulk.operations import BulkOperationManager, OperationStatus
+
+
+class TestExecuteAsync(unittest.TestCase):
+    """Test cases for executing bulk operations on a pool of workers"""
+
+    def test_results_in_operation_order(self):
+        """Test every operation runs once and results are returned in operation order"""
+        manager = BulkOperationManager(max_concurrent=3)
+        calls = []
+
+        async def operation(value):
+            calls.append(value)
+            await asyncio.sleep(0.001 * (value % 4))
+            return value * 2
+
+        for value in range(20):
+            manager.add_operation(f'op{value}', operation, value)
+        results = asyncio.run(manager.execute_async())
+        self.assertEqual(sorted(calls), list(range(20)))
+        self.assertEqual([result.data for result in results], [value * 2 for value in range(20)])
+        self.assertTrue(all(result.status is OperationStatus.SUCCESS for result in results))
+
+    def test_concurrency_bounded(self):
+        """Test no more than max_concurrent operations run at once"""
+        manager = BulkOperationManager(max_concurrent=4)
+        running, peak = 0, 0
+
+        async def operation():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        for value in range(20):
+            manager.add_operation(f'op{value}', operation)
+        asyncio.run(manager.execute_async())
+        self.assertEqual(peak, 4)
+
+    def test_rollback_on_failure(self):
+        """Test completed operations are rolled back when an operation fails"""
+        manager = BulkOperationManager(max_concurrent=1)
+        rolled_back = []
+
+        def fail():
+            raise RuntimeError('failure')
+
+        manager.add_operation('ok', lambda: 'done', rollback_func=lambda: rolled_back.append('ok'))
+        manager.add_operation('fail', fail)
+        results = asyncio.run(manager.execute_async())
+        self.assertEqual([result.status for result in results], [OperationStatus.ROLLED_BACK, OperationStatus.FAILED])
+        self.assertEqual(rolled_back, ['ok'])
+
+    def test_no_operations(self):
+        """Test executing an empty bulk set"""
+        self.assertEqual(asyncio.run(BulkOperationManager().execute_async()), [])
+
+    def test_max_concurrent_validated(self):
+        """Test a manager cannot be created without at least one worker"""
+        for max_concurrent in (0, -1):
+            with self.assertRaises(ValueError):
+                BulkOperationManager(max_concurrent=max_concurrent)
+
+
+class TestProgress(unittest.TestCase):
+    """Test cases for bulk operation progress callbacks"""
+
+    def run_operations(self, count, **kwargs):
+        manager = BulkOperationManager(max_concurrent=1, **kwargs)
+        progress = []
+        for value in range(count):
+            manager.add_operation(f'op{value}', lambda: None)
+        manager.execute_sync(on_progress=lambda completed, total: progress.append(completed))
+        asyncio_progress = []
+        manager.clear()
+        for value in range(count):
+            manager.add_operation(f'op{value}', lambda: None)
+        asyncio.run(manager.execute_async(on_progress=lambda completed, total: asyncio_progress.append(completed)))
+        return progress, asyncio_progress
+
+    def test_every_operation_by_default(self):
+        """Test progress is reported on every completed operation by default"""
+        for progress in self.run_operations(5):
+            self.assertEqual(progress, [1, 2, 3, 4, 5])
+
+    def test_batched(self):
+        """Test progress is reported every progress_batch_size operations and on the last one"""
+        for progress in self.run_operations(5, progress_batch_size=2):
+            self.assertEqual(progress, [2, 4, 5])
+
+
+class TestBlockingOperations(unittest.TestCase):
+    """Test cases for bulk operations with blocking callables"""
+
+    def test_serialized_off_event_loop(self):
+        """Test blocking operations run one at a time, on a thread other than the event loop's"""
+        manager = BulkOperationManager(max_concurrent=8)
+        lock = threading.Lock()
+        threads = set()
+
+        def operation(value):
+            self.assertTrue(lock.acquire(blocking=False), 'blocking operations overlapped')
+            try:
+                threads.add(threading.get_ident())
+                time.sleep(0.001)
+                return value
+            finally:
+                lock.release()
+
+        for value in range(10):
+            manager.add_operation(f'op{value}', operation, value)
+        results = asyncio.run(manager.execute_async())
+        self.assertEqual([result.data for result in results], list(range(10)))
+        self.assertNotIn(threading.get_ident(), threads)
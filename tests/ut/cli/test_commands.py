@@ -0,0 +1,39 @@
+"""Unit tests for the CLI command registry"""
+import argparse
+import unittest
+
+from cterasdk.cli.commands import CommandRegistry
+
+
+class TestCommandRegistry(unittest.TestCase):
+    """Test cases for CommandRegistry"""
+
+    def setUp(self):
+        self.registry = CommandRegistry()
+
+    def test_builtin_commands(self):
+        """Test built-in commands and sub-commands are dispatched"""
+        args = argparse.Namespace(command='users', users_command='list', limit=10)
+        self.assertEqual(self.registry.execute(args), {'command': 'list_users', 'limit': 10})
+        args = argparse.Namespace(command='devices', devices_command='list')
+        self.assertEqual(self.registry.execute(args), {'command': 'list_devices'})
+        args = argparse.Namespace(command='reports', type='storage', output='report.csv')
+        self.assertEqual(self.registry.execute(args), {'command': 'generate_report', 'type': 'storage', 'output': 'report.csv'})
+
+    def test_unknown_commands(self):
+        """Test unknown commands and sub-commands report an error"""
+        self.assertEqual(self.registry.execute(argparse.Namespace(command='unknown')), {'error': 'Unknown command'})
+        args = argparse.Namespace(command='files', files_command='unknown')
+        self.assertEqual(self.registry.execute(args), {'error': 'Unknown files command'})
+
+    def test_registered_command(self):
+        """Test registered commands are dispatched"""
+        self.registry.register('hello', lambda args: {'command': 'hello', 'name': args.name})
+        self.assertEqual(self.registry.execute(argparse.Namespace(command='hello', name='ctera')), {'command': 'hello', 'name': 'ctera'})
+
+    def test_register_builtin_rejected(self):
+        """Test registering a command under the name of a built-in command raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.registry.register('users', lambda args: {})
+        args = argparse.Namespace(command='users', users_command='delete', username='alice')
+        self.assertEqual(self.registry.execute(args), {'command': 'delete_user', 'username': 'alice'})
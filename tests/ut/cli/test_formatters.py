@@ -0,0 +1,50 @@
+"""Unit tests for the CLI output formatters"""
+import csv
+import io
+import json
+import unittest
+
+from cterasdk.cli.formatters import OutputFormat, OutputFormatter, yaml
+
+
+class TestOutputFormatter(unittest.TestCase):
+    """Test cases for OutputFormatter.format"""
+
+    def setUp(self):
+        self.records = [{'name': 'alice', 'size': 1}, {'name': 'bob', 'size': 2}]
+        self.mapping = {'name': 'alice', 'size': 1}
+
+    def test_json(self):
+        """Test formatting as JSON"""
+        self.assertEqual(json.loads(OutputFormatter(OutputFormat.JSON).format(self.records)), self.records)
+
+    def test_yaml(self):
+        """Test formatting as YAML, or as JSON if PyYAML is not installed"""
+        output = OutputFormatter(OutputFormat.YAML).format(self.records)
+        if yaml is None:
+            self.assertEqual(json.loads(output), self.records)
+        else:
+            self.assertEqual(yaml.safe_load(output), self.records)
+
+    def test_table_of_records(self):
+        """Test formatting a list of records as a table"""
+        output = OutputFormatter(OutputFormat.TABLE).format(self.records)
+        self.assertEqual(output.splitlines(), ['name | size', '-----------', 'alice | 1', 'bob | 2'])
+
+    def test_table_of_mapping(self):
+        """Test formatting a dictionary as a table"""
+        self.assertEqual(OutputFormatter(OutputFormat.TABLE).format(self.mapping), 'name: alice\nsize: 1')
+
+    def test_csv_of_records(self):
+        """Test formatting a list of records as CSV"""
+        output = OutputFormatter(OutputFormat.CSV).format(self.records)
+        self.assertEqual(list(csv.DictReader(io.StringIO(output))), [{'name': 'alice', 'size': '1'}, {'name': 'bob', 'size': '2'}])
+
+    def test_csv_of_mapping(self):
+        """Test formatting a dictionary as CSV falls back to JSON"""
+        self.assertEqual(json.loads(OutputFormatter(OutputFormat.CSV).format(self.mapping)), self.mapping)
+
+    def test_every_format(self):
+        """Test every output format returns a string"""
+        for output_format in OutputFormat:
+            self.assertIsInstance(OutputFormatter(output_format).format(self.records), str, output_format)
@@ -0,0 +1,88 @@
+"""Unit tests for the configuration loader module"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cterasdk.config import loader
+from cterasdk.config.loader import ConfigLoader
+
+
+class TestConfigLoader(unittest.TestCase):
+    """Test cases for loading configuration files"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.addCleanup(ConfigLoader.invalidate)
+        self.path = Path(directory) / 'config.json'
+        self.write({'portal': {'host': 'portal.ctera.com', 'port': 443}})
+
+    def write(self, config):
+        self.path.write_text(json.dumps(config), encoding='utf-8')
+
+    def test_cached_copy(self):
+        """Test a cached configuration is parsed once, and every load returns a copy of it"""
+        with mock.patch('cterasdk.config.loader._read_json', wraps=loader._read_json) as read:
+            config = ConfigLoader.load_json(self.path)
+            config['portal']['host'] = 'other.ctera.com'
+            self.assertEqual(ConfigLoader.load_json(self.path), {'portal': {'host': 'portal.ctera.com', 'port': 443}})
+        read.assert_called_once()
+
+    def test_reload_modified(self):
+        """Test a configuration file is parsed again once modified"""
+        ConfigLoader.load_json(self.path)
+        self.write({'portal': {'host': 'other.ctera.com', 'port': 8443}})
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(ConfigLoader.load_json(self.path), {'portal': {'host': 'other.ctera.com', 'port': 8443}})
+
+    def test_invalidate(self):
+        """Test invalidated configuration files are parsed again"""
+        with mock.patch('cterasdk.config.loader._read_json', wraps=loader._read_json) as read:
+            ConfigLoader.load_json(self.path)
+            ConfigLoader.invalidate(self.path)
+            ConfigLoader.load_json(self.path)
+            ConfigLoader.invalidate()
+            ConfigLoader.load_json(self.path)
+        self.assertEqual(read.call_count, 3)
+
+    def test_unsupported_format(self):
+        """Test loading a file of an unsupported format raises"""
+        with self.assertRaises(ValueError):
+            ConfigLoader.auto_load(self.path.with_suffix('.ini'))
+
+    def test_load_env(self):
+        """Test CTERA_* environment variables are loaded as dotted keys"""
+        with mock.patch.dict(os.environ, {'CTERA_PORTAL_HOST': 'portal.ctera.com', 'OTHER': 'value'}, clear=True):
+            self.assertEqual(ConfigLoader.load_env(), {'portal.host': 'portal.ctera.com'})
+
+
+@unittest.skipIf(loader.yaml is None, 'PyYAML is not installed')
+class TestYAMLLoader(unittest.TestCase):
+    """Test cases for loading YAML configuration files"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.addCleanup(ConfigLoader.invalidate)
+        self.path = Path(directory) / 'config.yaml'
+        self.path.write_text('portal:\n  host: portal.ctera.com\n  port: 443\n', encoding='utf-8')
+        self.expected = {'portal': {'host': 'portal.ctera.com', 'port': 443}}
+
+    def test_load(self):
+        """Test YAML files are loaded with the fastest safe loader available"""
+        self.assertEqual(ConfigLoader.auto_load(self.path), self.expected)
+
+    def test_pure_python_loader(self):
+        """Test YAML files are loaded with the pure-Python safe loader when libyaml is not available"""
+        with mock.patch('cterasdk.config.loader._SafeLoader', loader.yaml.SafeLoader):
+            self.assertEqual(ConfigLoader.load_yaml(self.path), self.expected)
+
+    def test_without_yaml(self):
+        """Test YAML files load as an empty configuration when PyYAML is not installed"""
+        with mock.patch('cterasdk.config.loader.yaml', None):
+            self.assertEqual(ConfigLoader.load_yaml(self.path), {})
@@ -0,0 +1,121 @@
+"""Unit tests for the configuration manager module"""
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cterasdk.config.manager import ConfigManager, Profile
+
+
+class TestProfile(unittest.TestCase):
+    """Test cases for configuration profiles"""
+
+    def setUp(self):
+        self.source = {'portal': {'host': 'portal.ctera.com', 'port': 443}, 'logging': {'level': 'INFO'}}
+        self.profile = Profile('default', self.source)
+
+    def test_get(self):
+        """Test reading values and sections by their dotted key"""
+        self.assertEqual(self.profile.get('portal.host'), 'portal.ctera.com')
+        self.assertEqual(self.profile.get('portal'), {'host': 'portal.ctera.com', 'port': 443})
+        self.assertEqual(self.profile.get('portal.missing', 'fallback'), 'fallback')
+        self.assertEqual(self.profile.get('portal.host.missing', 'fallback'), 'fallback')
+
+    def test_set(self):
+        """Test setting values updates both values and sections"""
+        self.profile.set('portal.port', 8443)
+        self.profile.set('edge.timeout', 30)
+        self.assertEqual(self.profile.get('portal.port'), 8443)
+        self.assertEqual(self.profile.get('edge.timeout'), 30)
+        self.assertEqual(self.profile.config['edge'], {'timeout': 30})
+
+    def test_set_section(self):
+        """Test setting a section indexes its values"""
+        self.profile.set('portal', {'host': 'other.ctera.com'})
+        self.assertEqual(self.profile.get('portal.host'), 'other.ctera.com')
+        self.assertIsNone(self.profile.get('portal.port'))
+
+    def test_source_not_shared(self):
+        """Test modifying the configuration the profile was created from does not modify the profile"""
+        self.source['portal']['host'] = 'other.ctera.com'
+        self.assertEqual(self.profile.get('portal.host'), 'portal.ctera.com')
+        self.assertEqual(self.profile.config['portal']['host'], 'portal.ctera.com')
+
+    def test_copies_not_shared(self):
+        """Test modifying returned configurations does not modify the profile"""
+        self.profile.config['portal']['host'] = 'other.ctera.com'
+        self.profile.get('portal')['host'] = 'other.ctera.com'
+        section = {'level': 'DEBUG'}
+        self.profile.set('logging', section)
+        section['level'] = 'ERROR'
+        self.assertEqual(self.profile.get('portal.host'), 'portal.ctera.com')
+        self.assertEqual(self.profile.get('logging.level'), 'DEBUG')
+        self.assertEqual(self.profile.config['logging'], {'level': 'DEBUG'})
+
+
+class TestEnvOverrides(unittest.TestCase):
+    """Test cases for environment variable overrides"""
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.config_dir)
+        self.manager = ConfigManager(Path(self.config_dir))
+
+    def test_profile_value(self):
+        """Test values are read from the active profile without an override"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.manager.refresh_env_overrides()
+            self.assertEqual(self.manager.resolve_value('portal.port'), 443)
+            self.assertIsNone(self.manager.get_env_override('portal.port'))
+
+    def test_override_read_at_creation(self):
+        """Test overrides set before the manager is created take precedence"""
+        with mock.patch.dict(os.environ, {'CTERA_PORTAL_PORT': '8443'}):
+            manager = ConfigManager(Path(self.config_dir))
+        self.assertEqual(manager.resolve_value('portal.port'), '8443')
+        self.assertEqual(manager.get_env_override('portal.port'), '8443')
+
+    def test_refresh(self):
+        """Test overrides set after the manager is created apply once refreshed"""
+        with mock.patch.dict(os.environ, {'CTERA_PORTAL_PORT': '8443'}):
+            self.assertEqual(self.manager.resolve_value('portal.port'), 443)
+            self.manager.refresh_env_overrides()
+            self.assertEqual(self.manager.resolve_value('portal.port'), '8443')
+        self.manager.refresh_env_overrides()
+        self.assertEqual(self.manager.resolve_value('portal.port'), 443)
+
+
+class TestSaveProfiles(unittest.TestCase):
+    """Test cases for saving configuration profiles"""
+
+    def setUp(self):
+        self.config_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.config_dir)
+        self.config_file = self.config_dir / 'config.json'
+        self.manager = ConfigManager(self.config_dir)
+
+    def test_new_file(self):
+        """Test a new configuration file is readable by its owner only"""
+        self.manager.create_profile('staging')
+        self.assertEqual(stat.S_IMODE(os.stat(self.config_file).st_mode), 0o600)
+        self.assertEqual(ConfigManager(self.config_dir).list_profiles(), ['default', 'staging'])
+        self.assertEqual(os.listdir(self.config_dir), ['config.json'])
+
+    def test_permissions_kept(self):
+        """Test saving keeps the permissions of the configuration file it replaces"""
+        self.manager.create_profile('staging')
+        os.chmod(self.config_file, 0o640)
+        self.manager.delete_profile('staging')
+        self.assertEqual(stat.S_IMODE(os.stat(self.config_file).st_mode), 0o640)
+        self.assertEqual(ConfigManager(self.config_dir).list_profiles(), ['default'])
+
+    def test_failed_save(self):
+        """Test a failed save leaves the previous configuration file in place, and no temporary file behind"""
+        self.manager.create_profile('staging')
+        with mock.patch('os.replace', side_effect=OSError('disk full')), self.assertRaises(OSError):
+            self.manager.create_profile('production')
+        self.assertEqual(ConfigManager(self.config_dir).list_profiles(), ['default', 'staging'])
+        self.assertEqual(os.listdir(self.config_dir), ['config.json'])
@@ -0,0 +1,42 @@
+"""Unit tests for the configuration validator module"""
+import unittest
+from unittest import mock
+
+from cterasdk.config import validator
+from cterasdk.config.validator import ConfigValidator, ValidationError
+
+
+class TestConfigValidator(unittest.TestCase):
+    """Test cases for validating configurations, with and without the compiled schema"""
+
+    def setUp(self):
+        self.cases = [
+            ({'portal': {'host': 'portal.ctera.com', 'port': 443, 'timeout': 60}, 'rate_limit': {'max_requests': 100}}, []),
+            ({'edge': {'timeout': 0}, 'portal': {}, 'rate_limit': None}, []),
+            ({'portal': {'host': '', 'port': 0, 'timeout': 0.5}}, ['Portal host cannot be empty', 'Invalid portal port: 0']),
+            ({'portal': {'host': 'portal', 'port': 443.0, 'timeout': -1}}, ['Invalid portal port: 443.0', 'Invalid portal timeout: -1']),
+            ({'portal': {'port': '443'}, 'rate_limit': {'max_requests': 0, 'window_seconds': '60'}}, [
+                'Invalid portal port: 443', 'Invalid max_requests: 0', 'Invalid window_seconds: 60'
+            ]),
+        ]
+
+    def assert_cases(self):
+        for config, errors in self.cases:
+            self.assertEqual(ConfigValidator.validate(config), errors, config)
+
+    @unittest.skipIf(validator.fastjsonschema is None, 'fastjsonschema is not installed')
+    def test_compiled_schema(self):
+        """Test configurations are validated with the compiled schema, with the same errors as the rules"""
+        self.assert_cases()
+
+    def test_rules(self):
+        """Test configurations are validated with the rules when fastjsonschema is not installed"""
+        with mock.patch('cterasdk.config.validator._compiled_validator', None):
+            self.assert_cases()
+
+    def test_validate_and_raise(self):
+        """Test an invalid configuration raises with all of its errors"""
+        ConfigValidator.validate_and_raise(self.cases[0][0])
+        with self.assertRaises(ValidationError) as error:
+            ConfigValidator.validate_and_raise(self.cases[2][0])
+        self.assertEqual(str(error.exception), 'Configuration validation failed: Portal host cannot be empty, Invalid portal port: 0')
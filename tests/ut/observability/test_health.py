@@ -0,0 +1,32 @@
+"""Unit tests for the observability health module"""
+import unittest
+from datetime import datetime, timedelta
+
+from cterasdk.observability.health import HealthCheckResult, HealthStatus
+
+
+class TestHealthCheckResult(unittest.TestCase):
+    """Test cases for health check results"""
+
+    def setUp(self):
+        self.before = datetime.now()
+        self.result = HealthCheckResult('portal', HealthStatus.HEALTHY, 'Connected', duration=0.5)
+
+    def test_timestamp(self):
+        """Test the timestamp is the time the result was recorded"""
+        self.assertLessEqual(abs(self.result.timestamp - self.before), timedelta(seconds=1))
+        self.assertIs(self.result.timestamp, self.result.timestamp)
+
+    def test_set_timestamp(self):
+        """Test a timestamp assigned directly is serialized"""
+        timestamp = datetime(2024, 1, 1, 12, 30)
+        self.result.timestamp = timestamp
+        self.assertEqual(self.result.timestamp, timestamp)
+        self.assertEqual(self.result.to_dict(), {
+            'name': 'portal',
+            'status': 'healthy',
+            'message': 'Connected',
+            'details': {},
+            'duration': 0.5,
+            'timestamp': '2024-01-01T12:30:00',
+        })
@@ -0,0 +1,176 @@
+"""Unit tests for the observability metrics module"""
+import math
+import random
+import unittest
+
+from cterasdk.observability.metrics import MetricsCollector, MetricType
+
+
+class TestHistogramStats(unittest.TestCase):
+    """Test cases for histogram statistics"""
+
+    def setUp(self):
+        self.collector = MetricsCollector()
+
+    def assert_matches_reference(self, values):
+        for value in values:
+            self.collector.record_histogram('test.histogram', value)
+        stats = self.collector.get_histogram_stats('test.histogram')
+        reference = sorted(values)
+        count = len(reference)
+        self.assertEqual(stats['count'], count)
+        self.assertEqual(stats['min'], reference[0])
+        self.assertEqual(stats['max'], reference[-1])
+        self.assertTrue(math.isclose(stats['mean'], sum(reference) / count, rel_tol=1e-9, abs_tol=1e-9))
+        for name, quantile in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+            expected = reference[int(count * quantile)]
+            self.assertLessEqual(abs(stats[name] - expected), abs(expected) * 0.01, name)
+
+    def test_sub_second_values(self):
+        """Test percentiles of latencies below a second"""
+        self.assert_matches_reference([random.uniform(0.0001, 0.5) for _ in range(5000)])
+
+    def test_values_above_a_minute(self):
+        """Test percentiles of values beyond any fixed upper bound"""
+        self.assert_matches_reference(list(range(100, 10100, 10)))
+
+    def test_wide_range(self):
+        """Test percentiles of values spanning many orders of magnitude"""
+        self.assert_matches_reference([10 ** random.uniform(-9, 12) for _ in range(5000)])
+
+    def test_zero_and_negative_values(self):
+        """Test percentiles of zero and negative values"""
+        self.assert_matches_reference([random.choice([0, 0.0, -1.5, 2]) * random.randint(1, 1000) for _ in range(5000)])
+
+    def test_infinite_values(self):
+        """Test infinities are ranked below and above all finite values"""
+        values = [-math.inf] + [float(i) for i in range(1, 98)] + [math.inf, math.inf]
+        for value in values:
+            self.collector.record_histogram('test.histogram', value)
+        stats = self.collector.get_histogram_stats('test.histogram')
+        self.assertEqual(stats['count'], 100)
+        self.assertEqual(stats['min'], -math.inf)
+        self.assertEqual(stats['max'], math.inf)
+        self.assertTrue(math.isnan(stats['mean']))
+        self.assertLessEqual(abs(stats['p50'] - 50), 0.5)
+        self.assertLessEqual(abs(stats['p95'] - 95), 1)
+        self.assertEqual(stats['p99'], math.inf)
+
+    def test_nan_value(self):
+        """Test a NaN is counted without failing the histogram"""
+        for value in (1.0, math.nan, 2.0):
+            self.collector.record_histogram('test.histogram', value)
+        stats = self.collector.get_histogram_stats('test.histogram')
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual((stats['min'], stats['max']), (1.0, 2.0))
+
+    def test_single_value(self):
+        """Test percentiles of a single value"""
+        self.assert_matches_reference([42.0])
+
+    def test_empty(self):
+        """Test stats of a histogram without values"""
+        self.assertEqual(self.collector.get_histogram_stats('test.histogram'), {})
+
+
+class TestSummaryStats(unittest.TestCase):
+    """Test cases for summary statistics"""
+
+    def assert_matches_window(self, values, max_history):
+        collector = MetricsCollector(max_history=max_history)
+        for value in values:
+            collector.observe_summary('test.summary', value)
+        stats = collector.get_summary_stats('test.summary')
+        window = values[-max_history:]
+        count = len(window)
+        mean = sum(window) / count
+        self.assertEqual(stats['count'], count)
+        self.assertEqual(stats['min'], min(window))
+        self.assertEqual(stats['max'], max(window))
+        self.assertTrue(math.isclose(stats['sum'], sum(window), rel_tol=1e-9, abs_tol=1e-6))
+        self.assertTrue(math.isclose(stats['mean'], mean, rel_tol=1e-9, abs_tol=1e-9))
+
+    def test_within_history(self):
+        """Test summary of fewer values than the history size"""
+        self.assert_matches_window([random.uniform(-100, 100) for _ in range(50)], 100)
+
+    def test_beyond_history(self):
+        """Test summary covers only the latest max_history values"""
+        self.assert_matches_window([random.uniform(-100, 100) for _ in range(5000)], 100)
+
+    def test_extremes_evicted(self):
+        """Test minimum and maximum of values older than the history are forgotten"""
+        self.assert_matches_window([-1000.0, 1000.0] + [float(i) for i in range(10)], 5)
+
+    def test_large_value_evicted(self):
+        """Test a large evicted value leaves no rounding error in the sum and mean"""
+        collector = MetricsCollector(max_history=100)
+        collector.observe_summary('test.summary', 1e17)
+        for _ in range(100):
+            collector.observe_summary('test.summary', 1.0)
+        stats = collector.get_summary_stats('test.summary')
+        self.assertEqual(stats['sum'], 100.0)
+        self.assertEqual(stats['mean'], 1.0)
+
+    def test_single_value_history(self):
+        """Test summary with a history of a single value"""
+        self.assert_matches_window([3.0, 1.0, 2.0], 1)
+
+    def test_empty(self):
+        """Test stats of a summary without values"""
+        self.assertEqual(MetricsCollector().get_summary_stats('test.summary'), {})
+
+
+class TestReset(unittest.TestCase):
+    """Test cases for resetting the collector"""
+
+    def setUp(self):
+        self.collector = MetricsCollector()
+
+    def test_reset(self):
+        """Test reset clears all metrics and restores the built-in ones"""
+        self.collector.increment('sdk.requests.total', 5)
+        self.collector.increment('test.counter')
+        self.collector.set_gauge('test.gauge', 3)
+        self.collector.record_histogram('test.histogram', 1.0)
+        self.collector.observe_summary('test.summary', 1.0)
+        self.collector.reset()
+        self.assertEqual(self.collector.get_counter('sdk.requests.total'), 0)
+        self.assertEqual(self.collector.get_counter('test.counter'), 0)
+        self.assertIsNone(self.collector.get_gauge('test.gauge'))
+        self.assertEqual(self.collector.get_gauge('sdk.active_connections'), 0)
+        self.assertEqual(self.collector.get_histogram_stats('test.histogram'), {})
+        self.assertEqual(self.collector.get_summary_stats('test.summary'), {})
+
+    def test_reset_invalidates_snapshot(self):
+        """Test metrics listed after a reset do not include the cleared ones"""
+        self.collector.increment('test.counter')
+        self.assertIn('test.counter', [metric.name for metric in self.collector.get_all_metrics()])
+        self.collector.reset()
+        self.assertNotIn('test.counter', [metric.name for metric in self.collector.get_all_metrics()])
+
+
+class TestAllMetrics(unittest.TestCase):
+    """Test cases for getting all metrics"""
+
+    def setUp(self):
+        self.collector = MetricsCollector()
+        self.collector.increment('test.counter', 2, {'region': 'eu'})
+        self.collector.set_gauge('test.gauge', 3)
+
+    def metric(self, name):
+        return next(metric for metric in self.collector.get_all_metrics() if metric.name == name)
+
+    def test_values(self):
+        """Test counters and gauges are returned with their tags"""
+        counter, gauge = self.metric('test.counter'), self.metric('test.gauge')
+        self.assertEqual((counter.metric_type, counter.value, counter.tags), (MetricType.COUNTER, 2, {'region': 'eu'}))
+        self.assertEqual((gauge.metric_type, gauge.value, gauge.tags), (MetricType.GAUGE, 3, {}))
+
+    def test_snapshot_not_shared(self):
+        """Test modifying returned metrics does not modify the metrics returned by later calls"""
+        counter = self.metric('test.counter')
+        counter.value = 100
+        counter.tags['region'] = 'us'
+        counter = self.metric('test.counter')
+        self.assertEqual((counter.value, counter.tags), (2, {'region': 'eu'}))
@@ -0,0 +1,64 @@
+"""Unit tests for the observability tracing module"""
+import unittest
+
+from cterasdk.observability.tracing import Span, SpanKind, SpanStatus, TracingManager
+
+
+class TestSpan(unittest.TestCase):
+    """Test cases for spans"""
+
+    def setUp(self):
+        self.span = Span('test.span', 'trace', 'span')
+
+    def test_defaults(self):
+        """Test a new span is internal and its status is unset"""
+        self.assertEqual((self.span.kind, self.span.status), (SpanKind.INTERNAL, SpanStatus.UNSET))
+        self.assertEqual((self.span.to_dict()['kind'], self.span.to_dict()['status']), ('internal', 'unset'))
+
+    def test_set_status(self):
+        """Test the status set by set_status is exported"""
+        self.span.set_status(SpanStatus.ERROR, 'failed')
+        self.assertEqual(self.span.status, SpanStatus.ERROR)
+        self.assertEqual(self.span.to_dict()['status'], 'error')
+        self.assertEqual(self.span.attributes, {'status.description': 'failed'})
+
+    def test_assign_kind_and_status(self):
+        """Test the kind and status assigned directly are exported"""
+        self.span.kind = SpanKind.CLIENT
+        self.span.status = SpanStatus.OK
+        self.assertEqual((self.span.kind, self.span.status), (SpanKind.CLIENT, SpanStatus.OK))
+        self.assertEqual((self.span.to_dict()['kind'], self.span.to_dict()['status']), ('client', 'ok'))
+
+
+class TestDisabledTracing(unittest.TestCase):
+    """Test cases for spans started while tracing is disabled"""
+
+    def setUp(self):
+        self.manager = TracingManager(enabled=False)
+
+    def test_attribute_writes_are_discarded(self):
+        """Test writing span attributes directly does not raise"""
+        span = self.manager.start_span('test.span')
+        span.attributes['key'] = 'value'
+        span.attributes.update(other='value')
+        span.set_attribute('key', 'value')
+        self.assertEqual(span.attributes, {})
+
+    def test_event_writes_are_discarded(self):
+        """Test appending span events directly does not raise"""
+        span = self.manager.start_span('test.span')
+        span.events.append({'name': 'event'})
+        span.add_event('event')
+        self.assertEqual(span.events, [])
+        self.manager.end_span(span)
+        self.assertEqual(self.manager.get_completed_spans(), [])
+
+    def test_kind_and_status_writes_are_discarded(self):
+        """Test assigning the span kind and status directly does not modify the shared span"""
+        span = self.manager.start_span('test.span', SpanKind.CLIENT)
+        span.kind = SpanKind.SERVER
+        span.status = SpanStatus.ERROR
+        span.set_status(SpanStatus.OK)
+        span = self.manager.start_span('test.span')
+        self.assertEqual((span.kind, span.status), (SpanKind.INTERNAL, SpanStatus.UNSET))
+        self.assertEqual((span.to_dict()['kind'], span.to_dict()['status']), ('internal', 'unset'))
@@ -0,0 +1,78 @@
+"""Unit tests for the rate limiting decorators"""
+import asyncio
+import time
+import unittest
+
+from cterasdk.ratelimit.decorators import rate_limited
+from cterasdk.ratelimit.strategies import (
+    AdaptiveStrategy, FixedWindowStrategy, LeakyBucketStrategy, RateLimitStrategy, TokenBucketStrategy
+)
+
+
+class _EventuallyGranted(RateLimitStrategy):
+    """Strategy granting tokens on the third attempt, which cannot tell the largest number of tokens it grants"""
+
+    def __init__(self):
+        self.attempts = 0
+
+    def acquire(self, tokens: int = 1) -> bool:
+        self.attempts += 1
+        return self.attempts >= 3
+
+    async def acquire_async(self, tokens: int = 1) -> bool:
+        return self.acquire(tokens)
+
+    def wait_time(self) -> float:
+        return 0.0
+
+
+class TestAsyncRateLimited(unittest.TestCase):
+    """Test cases for rate limiting coroutines"""
+
+    @staticmethod
+    def run_calls(strategy, count, tokens=1):
+        completed = []
+
+        @rate_limited(strategy, tokens=tokens)
+        async def call(index):
+            completed.append(index)
+            return index
+
+        async def main():
+            return await asyncio.gather(*(call(index) for index in range(count)))
+
+        return asyncio.run(main()), completed
+
+    def test_waits_for_tokens(self):
+        """Test coroutines wait for their tokens, rather than failing once retries are exhausted"""
+        start = time.monotonic()
+        results, completed = self.run_calls(TokenBucketStrategy(rate=50, capacity=1), 6)
+        self.assertEqual(results, list(range(6)))
+        self.assertEqual(completed, list(range(6)))  # Waiters are served in arrival order
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_fixed_window(self):
+        """Test coroutines exceeding a fixed window wait for the next one"""
+        start = time.monotonic()
+        results, _ = self.run_calls(FixedWindowStrategy(max_requests=2, window_size=0.05), 3)
+        self.assertEqual(results, [0, 1, 2])
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_unsatisfiable(self):
+        """Test requesting more tokens than a strategy can grant at once raises, instead of waiting forever"""
+        strategies = (
+            FixedWindowStrategy(max_requests=2, window_size=1),
+            TokenBucketStrategy(rate=10, capacity=2),
+            LeakyBucketStrategy(rate=10, capacity=2),
+            AdaptiveStrategy(initial_rate=10, min_rate=1, max_rate=100),
+        )
+        for strategy in strategies:
+            with self.assertRaises(ValueError, msg=type(strategy).__name__):
+                self.run_calls(strategy, 1, tokens=3)
+
+    def test_unknown_maximum(self):
+        """Test strategies that cannot tell the largest number of tokens they grant keep waiting"""
+        strategy = _EventuallyGranted()
+        results, _ = self.run_calls(strategy, 1, tokens=100)
+        self.assertEqual(results, [0])
+        self.assertEqual(strategy.attempts, 3)